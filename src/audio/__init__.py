@@ -1,17 +1,62 @@
 """Ses işleme modülleri"""
 
-from .analyzer import analyze_audio_segments, merge_close_segments
+from .analyzer import (
+    analyze_audio_segments, analyze_segment_index, merge_close_segments,
+    detect_pause_candidates, split_segments_by_duration
+)
+from .automation import AutomationLane, Breakpoint, fon_automation_lane
+from .ducking import sidechain_gain_db
 from .effects import apply_eased_gain_ramp, apply_linear_gain_ramp, normalize_audio_in_memory
-from .mixer import find_musical_outro_point
+from .envelope import apply_gain_envelope, apply_gain_ramp, cached_gain_curve, curve_cache_stats, gain_curve
+from .fades import append_with_crossfade, crossfade, fade_in, fade_out
+from .features import FonFeatures, LoopPoints, get_fon_features, get_loop_points
+from .looping import LoopedSource
+from .loudness import integrated_loudness, master_loudness, measure_loudness
+from .mixer import (
+    find_musical_outro_point, find_musical_outro_points,
+    outro_point_from_features, outro_points_from_features
+)
 from .processor import ses_montaj
+from .resample import resample_segment
+from .segments import SegmentIndex, count_valid_spots
 
 __all__ = [
     "analyze_audio_segments",
+    "analyze_segment_index",
     "merge_close_segments",
+    "detect_pause_candidates",
+    "split_segments_by_duration",
+    "AutomationLane",
+    "Breakpoint",
+    "fon_automation_lane",
+    "sidechain_gain_db",
     "apply_eased_gain_ramp",
     "apply_linear_gain_ramp",
     "normalize_audio_in_memory",
+    "apply_gain_envelope",
+    "apply_gain_ramp",
+    "gain_curve",
+    "cached_gain_curve",
+    "curve_cache_stats",
+    "append_with_crossfade",
+    "crossfade",
+    "fade_in",
+    "fade_out",
     "find_musical_outro_point",
+    "find_musical_outro_points",
+    "outro_point_from_features",
+    "outro_points_from_features",
+    "FonFeatures",
+    "get_fon_features",
+    "LoopPoints",
+    "get_loop_points",
+    "LoopedSource",
+    "integrated_loudness",
+    "measure_loudness",
+    "master_loudness",
     "ses_montaj",
+    "resample_segment",
+    "SegmentIndex",
+    "count_valid_spots",
 ]
 
@@ -1,11 +1,14 @@
 """Ses analizi modülü - spot tespiti ve segment analizi"""
 
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+import math
 import logging
+import numpy as np
 from pydub import AudioSegment
 from pydub.silence import detect_nonsilent
 
 from .effects import normalize_audio_in_memory
+from .segments import SegmentIndex
 from ..constants import AnalysisConfig
 
 logger = logging.getLogger(__name__)
@@ -24,36 +27,134 @@ def merge_close_segments(
     Returns:
         Birleştirilmiş segmentler listesi
     """
+    return SegmentIndex.from_ranges(segments).merged(max_gap).to_ranges()
+
+def detect_pause_candidates(
+    segments: List[Tuple[int, int]],
+    max_gap: int = None
+) -> List[Tuple[int, int, float]]:
+    """
+    Konuşma bölümleri arasındaki duraksamaları kesim adayı olarak skorlar.
+    
+    Skor, boşluğun max_gap'e oranının log2'sidir: max_gap'ten uzun
+    duraksamalar pozitif (doğal spot sınırı), kısa duraksamalar negatif
+    (cümle içi nefes) skor alır.
+    
+    Args:
+        segments: (başlangıç, bitiş) tuple'larının listesi (ms)
+        max_gap: Referans boşluk süresi (ms)
+        
+    Returns:
+        (duraksama başlangıcı, duraksama bitişi, skor) tuple'larının listesi
+    """
     if max_gap is None:
         max_gap = AnalysisConfig.MAX_GAP_MS
     
+    sorted_segments = sorted(segments, key=lambda x: x[0])
+    pauses = []
+    for (_, prev_end), (next_start, _) in zip(sorted_segments, sorted_segments[1:]):
+        gap = max(1, next_start - prev_end)
+        pauses.append((prev_end, next_start, math.log2(gap / max(1, max_gap))))
+    return pauses
+
+def split_segments_by_duration(
+    segments: List[Tuple[int, int]],
+    min_duration_ms: int,
+    max_duration_ms: int,
+    max_gap: int = None
+) -> List[Tuple[int, int]]:
+    """
+    Konuşma bölümlerini [min, max] süre aralığındaki spotlara en iyi şekilde böler.
+    
+    Duraksamalar üzerinde dinamik programlama yapar: her spot bir veya daha
+    fazla ardışık konuşma bölümünü kapsar, spot sınırları yalnızca
+    duraksamalarda olabilir ve kullanılan sınırların skor toplamı en
+    yükseğe çıkarılır. Süre sınırları yumuşak kısıttır; uygun bir bölme
+    varsa her zaman o seçilir, yoksa ihlali en az olan bölme döner.
+    Maksimum süreye sığan aday sayısı k ise karmaşıklık O(n·k)'dir.
+    
+    Args:
+        segments: Ham konuşma bölümleri (başlangıç, bitiş) listesi (ms)
+        min_duration_ms: Minimum spot süresi (ms)
+        max_duration_ms: Maksimum spot süresi (ms)
+        max_gap: Duraksama skorları için referans boşluk (ms)
+        
+    Returns:
+        Spotların (başlangıç, bitiş) tuple'larının listesi
+    """
     if not segments:
         return []
     
     sorted_segments = sorted(segments, key=lambda x: x[0])
-    merged = []
-    current_start, current_end = sorted_segments[0]
+    starts = np.array([s for s, _ in sorted_segments], dtype=np.int64)
+    ends = np.array([e for _, e in sorted_segments], dtype=np.int64)
+    n = len(sorted_segments)
     
-    for start, end in sorted_segments[1:]:
-        if start - current_end <= max_gap:
-            current_end = max(current_end, end)
-        else:
-            merged.append((current_start, current_end))
-            current_start, current_end = start, end
+    # Düğüm j (0..n): j. bölümden önceki sınır. İç düğümlerin kesim bonusu
+    # duraksama skorudur; baş ve son düğüm bonussuzdur.
+    cut_bonus = np.zeros(n + 1, dtype=np.float64)
+    pauses = detect_pause_candidates(sorted_segments, max_gap=max_gap)
+    if pauses:
+        cut_bonus[1:n] = [score for _, _, score in pauses]
+    
+    penalty_per_ms = AnalysisConfig.SPOT_DURATION_PENALTY / 1000.0
+    noise_len = AnalysisConfig.MIN_SEGMENT_LENGTH_MS
     
-    merged.append((current_start, current_end))
-    return merged
+    best = np.full(n + 1, -np.inf, dtype=np.float64)
+    best[0] = 0.0
+    back = np.zeros(n + 1, dtype=np.int64)
+    lo = 0
+    
+    for j in range(1, n + 1):
+        seg_end = ends[j - 1]
+        # max süresini aşan başlangıçları pencereden çıkar (tek bölüm her zaman aday)
+        while lo < j - 1 and seg_end - starts[lo] > max_duration_ms:
+            lo += 1
+        
+        durations = seg_end - starts[lo:j]
+        violation = (
+            np.maximum(0, min_duration_ms - durations) +
+            np.maximum(0, durations - max_duration_ms)
+        )
+        # Tek başına gürültü kadar kısa kalan bölüm zaten elenir, ceza yok
+        if durations[-1] < noise_len:
+            violation[-1] = 0
+        
+        values = best[lo:j] - violation * penalty_per_ms
+        k = int(np.argmax(values))
+        best[j] = values[k] + cut_bonus[j]
+        back[j] = lo + k
+    
+    spots = []
+    j = n
+    while j > 0:
+        i = int(back[j])
+        spots.append((int(starts[i]), int(ends[j - 1])))
+        j = i
+    spots.reverse()
+    return spots
 
-def analyze_audio_segments(audio_path: str, max_gap_ms: int = None) -> List[Tuple[int, int]]:
+def analyze_segment_index(
+    audio_path: str,
+    max_gap_ms: int = None,
+    min_spot_ms: Optional[int] = None,
+    max_spot_ms: Optional[int] = None
+) -> SegmentIndex:
     """
-    Ses dosyasından konuşma bölümlerini tespit eder.
+    Ses dosyasından konuşma bölümlerini tespit eder ve SegmentIndex döndürür.
+    
+    max_spot_ms verilirse segmentler max_gap ile birleştirilmek yerine
+    split_segments_by_duration ile [min_spot_ms, max_spot_ms] aralığındaki
+    spotlara bölünür. Her segmentin seviyesi (dBFS) indekse yazılır.
     
     Args:
         audio_path: Analiz edilecek ses dosyasının yolu
         max_gap_ms: Segment birleştirme için maksimum boşluk (ms). None ise varsayılan değer kullanılır.
+        min_spot_ms: Minimum spot süresi (ms, opsiyonel)
+        max_spot_ms: Maksimum spot süresi (ms, opsiyonel, 0/None ise süre sınırı kapalı)
         
     Returns:
-        Konuşma bölümlerinin (başlangıç, bitiş) tuple'larının listesi (milisaniye)
+        Geçerli uzunluktaki spotların SegmentIndex'i
         
     Raises:
         FileNotFoundError: Dosya bulunamazsa
@@ -75,18 +176,24 @@ def analyze_audio_segments(audio_path: str, max_gap_ms: int = None) -> List[Tupl
             silence_thresh=AnalysisConfig.SILENCE_THRESH
         )
         
-        # Yakın segmentleri birleştir (max_gap_ms parametresi ile)
-        merged_ranges = merge_close_segments(ranges, max_gap=max_gap_ms)
+        if max_spot_ms:
+            # Süre sınırlı mod: duraksamalardan optimum bölme
+            index = SegmentIndex.from_ranges(split_segments_by_duration(
+                ranges,
+                min_duration_ms=int(min_spot_ms or 0),
+                max_duration_ms=int(max_spot_ms),
+                max_gap=max_gap_ms
+            ))
+        else:
+            # Yakın segmentleri birleştir (max_gap_ms parametresi ile, vektörel)
+            index = SegmentIndex.from_ranges(ranges).merged(max_gap_ms)
         
-        # Minimum uzunluk filtresi
-        min_length = AnalysisConfig.MIN_SEGMENT_LENGTH_MS
-        valid_ranges = [
-            (start, end) for start, end in merged_ranges
-            if (end - start) >= min_length
-        ]
+        # Minimum uzunluk filtresi (vektörel)
+        index = index.valid()
+        index.data["level_db"] = [ham[start:end].dBFS for start, end in index]
         
-        logger.info(f"Analiz tamamlandı: {len(valid_ranges)} spot bulundu")
-        return valid_ranges
+        logger.info(f"Analiz tamamlandı: {len(index)} spot bulundu")
+        return index
         
     except FileNotFoundError:
         logger.error(f"Dosya bulunamadı: {audio_path}")
@@ -95,3 +202,31 @@ def analyze_audio_segments(audio_path: str, max_gap_ms: int = None) -> List[Tupl
         logger.error(f"Ses analizi hatası ({audio_path}): {e}", exc_info=True)
         raise
 
+def analyze_audio_segments(
+    audio_path: str,
+    max_gap_ms: int = None,
+    min_spot_ms: Optional[int] = None,
+    max_spot_ms: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Ses dosyasından konuşma bölümlerini tespit eder.
+    
+    Args:
+        audio_path: Analiz edilecek ses dosyasının yolu
+        max_gap_ms: Segment birleştirme için maksimum boşluk (ms). None ise varsayılan değer kullanılır.
+        min_spot_ms: Minimum spot süresi (ms, opsiyonel)
+        max_spot_ms: Maksimum spot süresi (ms, opsiyonel, 0/None ise süre sınırı kapalı)
+        
+    Returns:
+        Konuşma bölümlerinin (başlangıç, bitiş) tuple'larının listesi (milisaniye)
+        
+    Raises:
+        FileNotFoundError: Dosya bulunamazsa
+        Exception: Ses işleme hatası
+    """
+    return analyze_segment_index(
+        audio_path,
+        max_gap_ms=max_gap_ms,
+        min_spot_ms=min_spot_ms,
+        max_spot_ms=max_spot_ms
+    ).to_ranges()
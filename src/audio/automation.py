@@ -0,0 +1,186 @@
+"""
+Otomasyon şeridi - fon seviyesinin zaman içindeki bildirimsel tanımı.
+
+Şerit, (zaman, seviye, eğri) kırılma noktalarından oluşur; iki nokta
+arası, ikinci noktanın eğrisiyle dB cinsinden geçilir (gain_curve ile aynı
+örnek merkezli hesap; rampalar cached_gain_curve önbelleğinden gelir).
+compile() tüm şeridi tek bir float32 kazanç dizisine çevirir, böylece
+intro/gövde/outro ayrı segmentler olarak işlenip birleştirilmek yerine
+fona tek çarpımla uygulanır. to_dict / from_dict ile JSON'a çevrilebilir
+(önbellek anahtarı ve karşılaştırma için).
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from .envelope import CurveType, apply_gain_envelope, cached_gain_curve, db_to_amplitude, ease
+from ..constants import AudioLevels
+
+logger = logging.getLogger(__name__)
+
+# Şerit formatı değiştiğinde artırılır (serileştirilmiş şeritler uyumsuz olur)
+AUTOMATION_LANE_VERSION = 1
+
+class Breakpoint(NamedTuple):
+    """Otomasyon kırılma noktası"""
+    time_ms: float
+    gain_db: float
+    curve: CurveType = "linear"  # Önceki noktadan bu noktaya geçiş eğrisi
+
+class AutomationLane:
+    """
+    Sıralı kırılma noktalarından oluşan kazanç şeridi.
+    
+    İlk noktadan önce ilk seviye, son noktadan sonra son seviye sabit kalır.
+    """
+    
+    def __init__(self, breakpoints: Iterable[Breakpoint]):
+        points = [Breakpoint(float(p[0]), float(p[1]), *p[2:]) for p in breakpoints]
+        if not points:
+            raise ValueError("Otomasyon şeridi en az bir nokta içermeli")
+        if any(b.time_ms < a.time_ms for a, b in zip(points, points[1:])):
+            raise ValueError("Otomasyon noktaları zamana göre sıralı olmalı")
+        self.breakpoints = tuple(points)
+    
+    @property
+    def duration_ms(self) -> float:
+        """Son kırılma noktasının zamanı (ms)"""
+        return self.breakpoints[-1].time_ms
+    
+    def gain_at(self, time_ms: float) -> float:
+        """
+        Verilen andaki kazanç (dB).
+        
+        Args:
+            time_ms: Zaman (ms)
+        
+        Returns:
+            Kazanç (dB)
+        """
+        points = self.breakpoints
+        if time_ms <= points[0].time_ms:
+            return points[0].gain_db
+        for a, b in zip(points, points[1:]):
+            if time_ms < b.time_ms:
+                t = float(ease(np.array((time_ms - a.time_ms) / (b.time_ms - a.time_ms)), b.curve))
+                return a.gain_db + (b.gain_db - a.gain_db) * t
+        return points[-1].gain_db
+    
+    def compile(self, n_samples: int, sr: int) -> np.ndarray:
+        """
+        Şeridi örnek başına kazanç çarpanlarına çevirir.
+        
+        Nokta zamanları en yakın örneğe yuvarlanır; her aralıkta kazanç
+        gain_curve'deki gibi örnek merkezlerinde dB cinsinden ilerler.
+        
+        Args:
+            n_samples: Çıktı uzunluğu (frame)
+            sr: Sample rate
+        
+        Returns:
+            (n_samples,) boyutlu float32 çarpanlar
+        """
+        gains = np.empty(max(int(n_samples), 0), dtype=np.float32)
+        if len(gains) == 0:
+            return gains
+        
+        positions = [min(max(int(round(p.time_ms * sr / 1000.0)), 0), len(gains)) for p in self.breakpoints]
+        gains[:positions[0]] = db_to_amplitude(self.breakpoints[0].gain_db)
+        for (a, start), (b, stop) in zip(zip(self.breakpoints, positions), zip(self.breakpoints[1:], positions[1:])):
+            n = stop - start
+            if n <= 0:
+                continue
+            if a.gain_db == b.gain_db:
+                # Sabit bölge: üs alma yok, tek değerle doldur
+                gains[start:stop] = db_to_amplitude(a.gain_db)
+            else:
+                # Rampalar spotlar arasında çoğunlukla aynı: önbellekten
+                gains[start:stop] = cached_gain_curve(n, a.gain_db, b.gain_db, b.curve, sr=sr)
+        gains[positions[-1]:] = db_to_amplitude(self.breakpoints[-1].gain_db)
+        return gains
+    
+    def apply(self, segment: AudioSegment) -> AudioSegment:
+        """
+        Şeridi segmente tek çarpımla uygular.
+        
+        Args:
+            segment: Ses segmenti (şeridin 0 anı segmentin başıdır)
+        
+        Returns:
+            İşlenmiş segment
+        """
+        if len(segment) == 0:
+            return segment
+        gains = self.compile(int(segment.frame_count()), segment.frame_rate)
+        return apply_gain_envelope(segment, gains)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON'a çevrilebilir sözlük"""
+        return {
+            "version": AUTOMATION_LANE_VERSION,
+            "breakpoints": [[p.time_ms, p.gain_db, p.curve] for p in self.breakpoints],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AutomationLane":
+        """
+        to_dict çıktısından şerit oluşturur.
+        
+        Args:
+            data: Sözlük
+        
+        Returns:
+            AutomationLane
+        """
+        version = data.get("version")
+        if version != AUTOMATION_LANE_VERSION:
+            raise ValueError(f"Desteklenmeyen otomasyon şeridi sürümü: {version}")
+        return cls(Breakpoint(*point) for point in data["breakpoints"])
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AutomationLane) and self.breakpoints == other.breakpoints
+    
+    def __hash__(self) -> int:
+        return hash(self.breakpoints)
+    
+    def __repr__(self) -> str:
+        points = ", ".join(f"{p.time_ms:.0f}ms {p.gain_db:+.1f}dB {p.curve}" for p in self.breakpoints)
+        return f"AutomationLane({points})"
+
+def fon_automation_lane(
+    intro_ms: float,
+    voice_ms: float,
+    start_fon_db: float,
+    ducked_fon_db: float,
+    fall_ms: Optional[float] = None,
+    end_db: float = AudioLevels.SILENCE_DB
+) -> AutomationLane:
+    """
+    Montajdaki fon seviyesi şeridi (gelişmiş ayar değerlerinden).
+    
+    Intro: start_fon_db -> ducked_fon_db (ease_out), konuşma boyunca
+    ducked_fon_db sabit, ardından fall_ms verilmişse ducked_fon_db -> end_db
+    (ease_in) bitiş düşüşü. Bitiş sesi eklenecekse fall_ms None bırakılır.
+    
+    Args:
+        intro_ms: Intro süresi (ms)
+        voice_ms: Konuşma (ham segment) süresi (ms)
+        start_fon_db: Giriş seviyesi (dB)
+        ducked_fon_db: Konuşma altı seviye (dB)
+        fall_ms: Outro düşüş süresi (ms, None = düşüş yok)
+        end_db: Düşüş sonu seviyesi (dB)
+    
+    Returns:
+        AutomationLane
+    """
+    points: List[Breakpoint] = [
+        Breakpoint(0.0, start_fon_db),
+        Breakpoint(intro_ms, ducked_fon_db, "ease_out"),
+        Breakpoint(intro_ms + voice_ms, ducked_fon_db),
+    ]
+    if fall_ms is not None:
+        points.append(Breakpoint(intro_ms + voice_ms + fall_ms, end_db, "ease_in"))
+    return AutomationLane(points)
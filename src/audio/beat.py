@@ -0,0 +1,470 @@
+"""Hafif NumPy tempo/beat tahmincisi - librosa.beat.beat_track alternatifi"""
+
+import time
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..constants import AnalysisConfig
+
+logger = logging.getLogger(__name__)
+
+def _frame_signal(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """
+    Sinyali merkezli (center=True) örtüşen frame'lere böler.
+    
+    Args:
+        y: Mono sinyal
+        frame_length: Frame uzunluğu (sample)
+        hop_length: Frame adımı (sample)
+    
+    Returns:
+        (frame sayısı, frame_length) boyutlu görünüm
+    """
+    pad = frame_length // 2
+    padded = np.pad(np.asarray(y, dtype=np.float32), (pad, pad))
+    if len(padded) < frame_length:
+        padded = np.pad(padded, (0, frame_length - len(padded)))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, frame_length)
+    return windows[::hop_length]
+
+def frame_rms(y: np.ndarray, frame_length: int = None, hop_length: int = None) -> np.ndarray:
+    """
+    Frame bazlı RMS enerji eğrisi (librosa.feature.rms ile aynı çerçeveleme).
+    
+    Args:
+        y: Mono sinyal
+        frame_length: Frame uzunluğu (None ise AnalysisConfig.FRAME_LENGTH)
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+    
+    Returns:
+        RMS dizisi
+    """
+    if frame_length is None:
+        frame_length = AnalysisConfig.FRAME_LENGTH
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    frames = _frame_signal(y, frame_length, hop_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+def onset_envelope(
+    y: np.ndarray,
+    sr: int,
+    n_fft: int = None,
+    hop_length: int = None,
+    n_bands: int = 40
+) -> np.ndarray:
+    """
+    Spektral akı (spectral flux) tabanlı onset zarfı.
+    
+    Log-sıkıştırılmış bant enerjilerinin pozitif farklarının toplamıdır;
+    yavaş değişen seviye, kısa bir hareketli ortalama çıkarılarak giderilir.
+    
+    Args:
+        y: Mono sinyal
+        sr: Sample rate
+        n_fft: FFT boyu (None ise AnalysisConfig.FRAME_LENGTH)
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+        n_bands: Logaritmik frekans bandı sayısı
+    
+    Returns:
+        Frame başına onset gücü
+    """
+    if n_fft is None:
+        n_fft = AnalysisConfig.FRAME_LENGTH
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    frames = _frame_signal(y, n_fft, hop_length)
+    if len(frames) < 2:
+        return np.zeros(len(frames), dtype=np.float32)
+    
+    window = np.hanning(n_fft).astype(np.float32)
+    mag = np.abs(np.fft.rfft(frames * window, axis=1))
+    
+    # Bin'leri logaritmik bantlarda topla (mel benzeri): aksi halde çok sayıdaki
+    # yüksek frekans bin'i akıyı hi-hat gibi ara vuruşlara çeker
+    edges = np.unique(np.geomspace(1, mag.shape[1], n_bands + 1).astype(np.int64))
+    bands = np.add.reduceat(mag, edges[:-1], axis=1)
+    log_bands = np.log1p(100.0 * bands / max(float(bands.max()), 1e-10))
+    
+    flux = np.maximum(0.0, np.diff(log_bands, axis=0)).mean(axis=1)
+    
+    # Onset, pencerenin ön kenarına girdiği anda akıya yansır; yarım pencere
+    # kadar geciktirerek frame zamanını onset zamanına hizala
+    lag = 1 + n_fft // (2 * hop_length)
+    env = np.concatenate((np.zeros(lag), flux))[:len(frames)]
+    
+    # Yerel ortalamayı çıkar (~0.25 s), yarım dalga doğrult
+    width = max(1, int(round(0.25 * sr / hop_length)))
+    local_mean = np.convolve(env, np.ones(width) / width, mode="same")
+    env = np.maximum(0.0, env - local_mean)
+    
+    peak = env.max()
+    return (env / peak if peak > 0 else env).astype(np.float32)
+
+def estimate_tempo(
+    envelope: np.ndarray,
+    sr: int,
+    hop_length: int = None,
+    min_bpm: float = 60.0,
+    max_bpm: float = 200.0,
+    prior_bpm: float = 120.0,
+    prior_std: float = 0.7
+) -> Tuple[float, float]:
+    """
+    Onset zarfının FFT otokorelasyonundan tempo tahmini.
+    
+    Otokorelasyon, prior_bpm merkezli log-normal bir tempo önceliği ile
+    ağırlıklandırılır ve tepe noktası parabolik interpolasyonla iyileştirilir.
+    
+    Args:
+        envelope: Onset zarfı
+        sr: Sample rate
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+        min_bpm: Minimum tempo
+        max_bpm: Maksimum tempo
+        prior_bpm: Tempo önceliğinin merkezi
+        prior_std: Tempo önceliğinin genişliği (oktav)
+    
+    Returns:
+        (tempo (BPM), beat periyodu (frame))
+    """
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    frame_rate = sr / hop_length
+    n = len(envelope)
+    min_lag = max(1, int(np.floor(60.0 * frame_rate / max_bpm)))
+    max_lag = min(n - 2, int(np.ceil(60.0 * frame_rate / min_bpm)))
+    if n < 4 or max_lag <= min_lag:
+        period = 60.0 * frame_rate / prior_bpm
+        return prior_bpm, period
+    
+    x = envelope - envelope.mean()
+    spectrum = np.fft.rfft(x, 2 * n)
+    acf = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
+    
+    lags = np.arange(min_lag, max_lag + 1)
+    bpms = 60.0 * frame_rate / lags
+    prior = np.exp(-0.5 * (np.log2(bpms / prior_bpm) / prior_std) ** 2)
+    weighted = acf[lags] * prior
+    
+    k = int(np.argmax(weighted))
+    lag = float(lags[k])
+    if 0 < k < len(lags) - 1:
+        a, b, c = weighted[k - 1], weighted[k], weighted[k + 1]
+        denom = a - 2.0 * b + c
+        if denom != 0:
+            lag += 0.5 * (a - c) / denom
+    
+    return 60.0 * frame_rate / lag, lag
+
+def track_beats(envelope: np.ndarray, period: float) -> np.ndarray:
+    """
+    Beat fazını seçer ve beat'leri yerel onset tepelerine oturtur.
+    
+    İlk periyot içindeki her olası faz için ızgara aynı anda yürünür: her
+    beat bir öncekinden bir periyot sonra beklenir ve ±%10 içindeki en
+    güçlü onset'e oturtulur (tempo kayması birikmez). Beat'ler üzerindeki
+    toplam onset gücü en yüksek olan faz seçilir.
+    
+    Args:
+        envelope: Onset zarfı
+        period: Beat periyodu (frame)
+    
+    Returns:
+        Beat frame indeksleri
+    """
+    n = len(envelope)
+    if n == 0 or period <= 0:
+        return np.zeros(0, dtype=np.int64)
+    
+    radius = max(1, int(round(period * 0.1)))
+    offsets = np.arange(-radius, radius + 1)
+    closeness = np.exp(-0.5 * (offsets / radius) ** 2)
+    
+    # Tüm fazlar paralel: (faz sayısı, beat sayısı) ızgara
+    expected = np.arange(min(int(np.ceil(period)), n), dtype=np.float64)
+    max_beats = int(np.ceil(n / (period * 0.9))) + 1
+    grid = np.full((len(expected), max_beats), -1, dtype=np.int64)
+    for k in range(max_beats):
+        active = expected < n
+        if not active.any():
+            break
+        candidates = np.clip(np.rint(expected[:, None]).astype(np.int64) + offsets, 0, n - 1)
+        picked = np.argmax(envelope[candidates] * closeness, axis=1)
+        beats = candidates[np.arange(len(expected)), picked]
+        grid[active, k] = beats[active]
+        expected = np.where(active, beats + period, expected)
+    
+    scores = np.where(grid >= 0, envelope[np.maximum(grid, 0)], 0.0).sum(axis=1)
+    best = grid[int(np.argmax(scores))]
+    return np.unique(best[best >= 0])
+
+def beat_track(y: np.ndarray, sr: int, hop_length: int = None) -> Tuple[float, np.ndarray]:
+    """
+    librosa.beat.beat_track ile aynı şekilde (tempo, beat frame'leri) döndürür.
+    
+    Args:
+        y: Mono sinyal
+        sr: Sample rate
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+    
+    Returns:
+        (tempo (BPM), beat frame indeksleri)
+    """
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    # Onset için kısa pencere yeterli (daha iyi zaman çözünürlüğü, yarı maliyet)
+    env = onset_envelope(y, sr, n_fft=1024, hop_length=hop_length)
+    tempo, period = estimate_tempo(env, sr, hop_length)
+    return tempo, track_beats(env, period)
+
+def chroma_stft(
+    y: np.ndarray,
+    sr: int,
+    n_fft: int = None,
+    hop_length: int = None
+) -> np.ndarray:
+    """
+    STFT güç spektrumundan 12 perdelik chroma (her bin en yakın perde sınıfına).
+    
+    Args:
+        y: Mono sinyal
+        sr: Sample rate
+        n_fft: FFT boyu (None ise AnalysisConfig.FRAME_LENGTH)
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+    
+    Returns:
+        (12, frame sayısı) boyutlu chroma (frame başına maksimumu 1)
+    """
+    if n_fft is None:
+        n_fft = AnalysisConfig.FRAME_LENGTH
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    return chroma_from_power(power_spectrogram(y, n_fft, hop_length), sr, n_fft)
+
+def power_spectrogram(y: np.ndarray, n_fft: int = None, hop_length: int = None) -> np.ndarray:
+    """
+    Hann pencereli, merkezli STFT güç spektrumu.
+    
+    Args:
+        y: Mono sinyal
+        n_fft: FFT boyu (None ise AnalysisConfig.FRAME_LENGTH)
+        hop_length: Frame adımı (None ise AnalysisConfig.HOP_LENGTH)
+    
+    Returns:
+        (frame sayısı, n_fft // 2 + 1) boyutlu güç spektrumu
+    """
+    if n_fft is None:
+        n_fft = AnalysisConfig.FRAME_LENGTH
+    if hop_length is None:
+        hop_length = AnalysisConfig.HOP_LENGTH
+    
+    frames = _frame_signal(y, n_fft, hop_length)
+    window = np.hanning(n_fft).astype(np.float32)
+    return np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+
+def chroma_from_power(power: np.ndarray, sr: int, n_fft: int) -> np.ndarray:
+    """
+    Hazır güç spektrumundan chroma üretir (aynı STFT'yi başka özellikler de kullanıyorsa).
+    
+    Args:
+        power: (frame sayısı, n_fft // 2 + 1) boyutlu güç spektrumu
+        sr: Sample rate
+        n_fft: FFT boyu
+    
+    Returns:
+        (12, frame sayısı) boyutlu chroma (frame başına maksimumu 1)
+    """
+    # 27.5 Hz (A0) - 5 kHz arası bin'ler perde sınıflarına toplanır
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    usable = (freqs >= 27.5) & (freqs <= 5000.0)
+    pitch_class = np.rint(12.0 * np.log2(freqs[usable] / 440.0) + 69.0).astype(np.int64) % 12
+    mapping = np.zeros((int(usable.sum()), 12), dtype=np.float32)
+    mapping[np.arange(len(pitch_class)), pitch_class] = 1.0
+    
+    chroma = power[:, usable] @ mapping
+    chroma /= np.maximum(chroma.max(axis=1, keepdims=True), 1e-10)
+    return chroma.T
+
+def beat_sync(features: np.ndarray, frames: np.ndarray) -> np.ndarray:
+    """
+    Frame özelliklerini verilen sınırlar arasında ortalar (beat/ölçü senkron).
+    
+    Args:
+        features: (boyut, frame sayısı) özellik matrisi
+        frames: Sıralı sınır frame'leri; her aralık bir sonraki sınıra kadar sürer
+    
+    Returns:
+        (boyut, sınır sayısı) ortalama matrisi
+    """
+    n = features.shape[1]
+    frames = np.clip(np.asarray(frames, dtype=np.int64), 0, max(0, n - 1))
+    counts = np.maximum(np.diff(np.append(frames, n)), 1).astype(np.float64)
+    return np.add.reduceat(features, frames, axis=1) / counts
+
+def _novelty(chroma: np.ndarray, energy: np.ndarray) -> np.ndarray:
+    """
+    Ardışık sütunlar arası yenilik: chroma kosinüs uzaklığı + log enerji değişimi.
+    
+    İki bileşen ayrı ayrı standartlaştırılıp toplanır; ilk sütun NaN'dır.
+    """
+    unit = chroma / np.maximum(np.linalg.norm(chroma, axis=0), 1e-10)
+    harmonic = np.full(chroma.shape[1], np.nan)
+    harmonic[1:] = 1.0 - np.sum(unit[:, 1:] * unit[:, :-1], axis=0)
+    dynamic = np.full(len(energy), np.nan)
+    dynamic[1:] = np.abs(np.diff(energy))
+    
+    def standardize(x):
+        std = np.nanstd(x)
+        return (x - np.nanmean(x)) / std if std > 0 else np.zeros_like(x)
+    
+    return standardize(harmonic) + standardize(dynamic)
+
+def _best_phase(novelty: np.ndarray, period: int) -> int:
+    """Periyodik ızgaranın en yüksek ortalama yeniliği veren fazı"""
+    scores = [
+        np.nanmean(novelty[p::period]) if np.isfinite(novelty[p::period]).any() else -np.inf
+        for p in range(period)
+    ]
+    return int(np.argmax(scores))
+
+def downbeat_phrase_index(
+    beat_frames: np.ndarray,
+    chroma: np.ndarray,
+    rms: np.ndarray,
+    beats_per_bar: int = None,
+    phrase_bars: int = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Beat grid'inden ölçü başlarını (downbeat) ve cümle sınırlarını seçer.
+    
+    Beat-senkron chroma/enerji yeniliği hesaplanır; armoni ve dinamik
+    değişimleri ölçü başlarında yoğunlaştığından, beats_per_bar periyotlu
+    ızgaranın ortalama yeniliği en yüksek fazı downbeat fazıdır. Aynı
+    yöntem ölçü-senkron özelliklerle phrase_bars periyodunda tekrarlanarak
+    cümle (phrase) sınırları bulunur.
+    
+    Args:
+        beat_frames: Beat frame'leri
+        chroma: (12, frame sayısı) chroma
+        rms: Frame başına RMS
+        beats_per_bar: Ölçü başına beat (None ise AnalysisConfig.BEATS_PER_BAR)
+        phrase_bars: Cümle başına ölçü (None ise AnalysisConfig.PHRASE_BARS)
+    
+    Returns:
+        (downbeat frame'leri, cümle sınırı frame'leri)
+    """
+    if beats_per_bar is None:
+        beats_per_bar = AnalysisConfig.BEATS_PER_BAR
+    if phrase_bars is None:
+        phrase_bars = AnalysisConfig.PHRASE_BARS
+    
+    beat_frames = np.asarray(beat_frames, dtype=np.int64)
+    n = min(chroma.shape[1], len(rms))
+    beat_frames = beat_frames[beat_frames < n]
+    empty = np.zeros(0, dtype=np.int64)
+    if len(beat_frames) < 2 * beats_per_bar or n == 0:
+        return beat_frames[::beats_per_bar], empty
+    
+    chroma = chroma[:, :n]
+    log_rms = np.log(np.maximum(rms[:n], 1e-10))[None, :]
+    
+    beat_novelty = _novelty(beat_sync(chroma, beat_frames), beat_sync(log_rms, beat_frames)[0])
+    downbeats = beat_frames[_best_phase(beat_novelty, beats_per_bar)::beats_per_bar]
+    
+    if len(downbeats) < 2 * phrase_bars:
+        return downbeats, empty
+    
+    bar_novelty = _novelty(beat_sync(chroma, downbeats), beat_sync(log_rms, downbeats)[0])
+    phrases = downbeats[_best_phase(bar_novelty, phrase_bars)::phrase_bars]
+    return downbeats, phrases
+
+def _beat_f_measure(reference_ms: np.ndarray, estimated_ms: np.ndarray, tolerance_ms: float = 70.0) -> float:
+    """Beat F-ölçüsü (±tolerance eşleşme, MIREX tarzı)"""
+    if len(reference_ms) == 0 or len(estimated_ms) == 0:
+        return 0.0
+    idx = np.clip(np.searchsorted(reference_ms, estimated_ms), 1, len(reference_ms) - 1)
+    nearest = np.minimum(
+        np.abs(estimated_ms - reference_ms[idx - 1]),
+        np.abs(estimated_ms - reference_ms[idx])
+    )
+    hits = int(np.count_nonzero(nearest <= tolerance_ms))
+    precision = hits / len(estimated_ms)
+    recall = min(1.0, hits / len(reference_ms))
+    return 0.0 if hits == 0 else 2 * precision * recall / (precision + recall)
+
+def compare_beat_trackers(
+    paths: Sequence[str],
+    sr: int = None,
+    start_points_ms: Sequence[float] = (8000, 15000, 25000, 40000)
+) -> List[Dict[str, float]]:
+    """
+    NumPy tahmincisini librosa ile doğruluk ve hız açısından karşılaştırır.
+    
+    Her dosya için iki yöntemin süresi, tempo tahmini, librosa beat'lerine
+    göre F-ölçüsü ve verilen konuşma bitişlerinde outro noktası farkı ölçülür.
+    
+    Args:
+        paths: Karşılaştırılacak ses dosyaları
+        sr: Sample rate (None ise AnalysisConfig.SAMPLE_RATE)
+        start_points_ms: Outro karşılaştırması için konuşma bitiş noktaları (ms)
+    
+    Returns:
+        Dosya başına ölçüm sözlüklerinin listesi
+    """
+    import librosa
+    from .features import _analyze_signal
+    from .mixer import outro_point_from_features
+    
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    results = []
+    for path in paths:
+        y, sr = librosa.load(path, sr=sr, mono=True)
+        duration_ms = len(y) / sr * 1000.0
+        
+        timings = {}
+        features = {}
+        for tracker in ("librosa", "numpy"):
+            started = time.perf_counter()
+            features[tracker] = _analyze_signal(y, sr, 0.0, duration_ms, tracker=tracker)
+            timings[tracker] = time.perf_counter() - started
+        
+        outro_diffs = [
+            abs(outro_point_from_features(features["numpy"], p) - outro_point_from_features(features["librosa"], p))
+            for p in start_points_ms
+        ]
+        results.append({
+            "path": path,
+            "librosa_s": timings["librosa"],
+            "numpy_s": timings["numpy"],
+            "librosa_tempo": features["librosa"].tempo,
+            "numpy_tempo": features["numpy"].tempo,
+            "beat_f_measure": _beat_f_measure(features["librosa"].beat_times, features["numpy"].beat_times),
+            "outro_diff_ms": float(np.mean(outro_diffs)),
+        })
+    return results
+
+if __name__ == "__main__":
+    from .preset_index import iter_preset_files
+    
+    logging.basicConfig(level=logging.WARNING)
+    preset_paths = [path for _, path in iter_preset_files()]
+    rows = compare_beat_trackers(preset_paths)
+    for row in rows:
+        print(
+            f"{row['path'][-40:]:>40}  librosa {row['librosa_s']:.3f}s {row['librosa_tempo']:6.1f} BPM  "
+            f"numpy {row['numpy_s']:.3f}s {row['numpy_tempo']:6.1f} BPM  "
+            f"F={row['beat_f_measure']:.2f}  outro Δ={row['outro_diff_ms']:.0f}ms"
+        )
+    if rows:
+        speedup = sum(r["librosa_s"] for r in rows) / max(sum(r["numpy_s"] for r in rows), 1e-9)
+        print(f"Toplam hızlanma: {speedup:.1f}x, ortalama F={np.mean([r['beat_f_measure'] for r in rows]):.2f}")
@@ -0,0 +1,55 @@
+"""AudioSegment <-> NumPy tampon dönüşümleri"""
+
+import logging
+
+import numpy as np
+from pydub import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+def sample_dtype(sample_width: int) -> np.dtype:
+    """pydub örnek genişliğine karşılık gelen tamsayı dtype'ı"""
+    return np.dtype(np.int8) if sample_width == 1 else np.dtype(f"<i{sample_width}")
+
+def segment_to_float(segment: AudioSegment) -> np.ndarray:
+    """
+    Segmenti [-1, 1) aralığında float32 örnek dizisine çevirir.
+    
+    24 bit segmentler önce 32 bite çevrilir (NumPy'da 3 baytlık tamsayı yok).
+    
+    Args:
+        segment: Ses segmenti
+    
+    Returns:
+        (frame, kanal) boyutlu float32 dizi (kopya)
+    """
+    if segment.sample_width == 3:
+        segment = segment.set_sample_width(4)
+    dtype = sample_dtype(segment.sample_width)
+    samples = np.frombuffer(segment.raw_data, dtype=dtype).reshape(-1, segment.channels)
+    return samples.astype(np.float32) * np.float32(1.0 / -np.iinfo(dtype).min)
+
+def float_to_segment(samples: np.ndarray, like: AudioSegment) -> AudioSegment:
+    """
+    Float örnekleri, like segmentinin formatında AudioSegment'e çevirir.
+    
+    Aralık dışı örnekler kırpılır (pydub apply_gain ile aynı doyum davranışı).
+    
+    Args:
+        samples: (frame, kanal) veya tek boyutlu float dizi, [-1, 1) ölçeğinde
+        like: Frame rate, kanal ve örnek genişliği alınacak segment
+    
+    Returns:
+        Yeni AudioSegment
+    """
+    sample_width = 4 if like.sample_width == 3 else like.sample_width
+    dtype = sample_dtype(sample_width)
+    info = np.iinfo(dtype)
+    # 32 bit tamsayı sınırları float32'de tam temsil edilemez
+    work_dtype = np.float64 if sample_width == 4 else np.float32
+    scaled = np.asarray(samples, dtype=work_dtype) * work_dtype(-info.min)
+    out = np.clip(np.rint(scaled, out=scaled), info.min, info.max).astype(dtype)
+    return like._spawn(
+        out.tobytes(),
+        overrides={"sample_width": sample_width, "frame_rate": like.frame_rate, "channels": like.channels}
+    )
@@ -0,0 +1,125 @@
+"""Preset sınıflandırıcı - tempo ve enerji özelliklerinden sanal kategori ataması"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .beat import chroma_from_power, power_spectrogram
+from .features import FonFeatures
+from ..constants import AnalysisConfig, AUTO_PRESET_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# Enerji tertillerine karşılık gelen kategoriler (düşükten yükseğe)
+ENERGY_LEVEL_CATEGORIES = ("Düşük Ritimli", "Orta Ritimli", "Enerjik")
+DRAMATIC_CATEGORY = "Dramatik"
+
+# Dinamik aralığı kütüphane ortalamasının bu kadar standart sapma üstündeyse dramatik
+DRAMATIC_MIN_ZSCORE = 1.0
+
+# Tını özeti için MFCC ayarları
+N_MELS = 40
+N_MFCC = 13
+
+def compute_preset_descriptors(
+    y: np.ndarray,
+    sr: int,
+    features: FonFeatures,
+    power: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
+    """
+    Bir preset için sınıflandırma ve benzerlik özelliklerini hesaplar.
+    
+    Dosya okunmaz: decode edilmiş sinyal ve (varsa) fon özellik analizinde
+    kullanılan güç spektrumu verilir, böylece indeksleme dosya başına tek
+    decode ve tek STFT ile yapılır. Tempo ve RMS eğrisi fon özelliklerinden
+    gelir; spektral merkez (centroid), MFCC ortalamaları (tını) ve chroma
+    ortalaması (tonalite) aynı güç spektrumundan vektörel hesaplanır.
+    
+    Args:
+        y: Mono sinyal (sr hızında)
+        sr: Sample rate
+        features: Aynı dosyanın fon özellikleri (get_fon_features)
+        power: y'nin güç spektrumu (beat.power_spectrogram; None ise hesaplanır)
+    
+    Returns:
+        {"tempo", "loudness_db", "centroid_hz", "dynamic_range_db",
+        "mfcc_mean", "chroma_mean"} sözlüğü (son ikisi liste)
+    """
+    import librosa
+    from scipy.fft import dct
+    
+    rms = features.rms.astype(np.float64)
+    rms_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+    audible = rms_db[rms_db > rms_db.max() - 60.0] if rms.size else rms_db
+    
+    n_fft = AnalysisConfig.FRAME_LENGTH
+    if power is None:
+        power = power_spectrogram(y, n_fft, AnalysisConfig.HOP_LENGTH)
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    frame_power = power.sum(axis=1)
+    centroids = (power @ freqs) / np.maximum(frame_power, 1e-10)
+    # Sessiz frame'ler ortalamayı bozmasın: enerjiye göre ağırlıklı
+    centroid_hz = float(np.average(centroids, weights=frame_power)) if frame_power.sum() > 0 else 0.0
+    
+    mel = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=N_MELS)
+    log_mel = np.log(np.maximum(power @ mel.T, 1e-10))
+    mfcc = dct(log_mel, type=2, norm="ortho", axis=1)[:, :N_MFCC]
+    chroma = chroma_from_power(power, sr, n_fft)
+    # Ortalamalar yalnızca duyulabilir frame'lerden (baştaki/sondaki sessizlik hariç)
+    voiced = frame_power > frame_power.max() * 1e-6 if frame_power.size else frame_power.astype(bool)
+    if not voiced.any():
+        voiced = np.ones_like(frame_power, dtype=bool)
+    
+    return {
+        "tempo": float(features.tempo),
+        "loudness_db": float(20.0 * np.log10(max(np.sqrt(np.mean(rms ** 2)) if rms.size else 0.0, 1e-10))),
+        "centroid_hz": centroid_hz,
+        "dynamic_range_db": float(np.percentile(audible, 95) - np.percentile(audible, 10)) if audible.size else 0.0,
+        "mfcc_mean": [float(v) for v in mfcc[voiced].mean(axis=0)] if mfcc.size else [0.0] * N_MFCC,
+        "chroma_mean": [float(v) for v in chroma[:, voiced].mean(axis=1)] if chroma.size else [0.0] * 12,
+    }
+
+def _zscore(values: np.ndarray) -> np.ndarray:
+    std = values.std()
+    return (values - values.mean()) / std if std > 0 else np.zeros_like(values)
+
+def classify_presets(descriptors: Sequence[Dict[str, Any]]) -> List[List[str]]:
+    """
+    Preset kütüphanesini tek seferde sanal kategorilere ayırır.
+    
+    Enerji skoru; tempo, ses yüksekliği ve spektral merkezin kütüphane
+    içindeki z-skorlarının ortalamasıdır. Skorun tertilleri Düşük Ritimli,
+    Orta Ritimli ve Enerjik kategorilerini verir. Dinamik aralığı
+    kütüphaneye göre belirgin geniş olanlar ayrıca Dramatik'e girer.
+    
+    Args:
+        descriptors: compute_preset_descriptors çıktıları
+    
+    Returns:
+        Her preset için kategori adları listesi
+    """
+    if not descriptors:
+        return []
+    
+    table = np.array(
+        [[d["tempo"], d["loudness_db"], d["centroid_hz"], d["dynamic_range_db"]] for d in descriptors],
+        dtype=np.float64
+    )
+    # Çok yüksek/çok düşük tempo tahminleri oktav hatası olabilir: log ölçekte karşılaştır
+    tempo = np.log2(np.maximum(table[:, 0], 1.0))
+    energy = (_zscore(tempo) + _zscore(table[:, 1]) + _zscore(np.log2(np.maximum(table[:, 2], 1.0)))) / 3.0
+    
+    # Tertil sınırları; sıralamaya göre eşit dağılım (küçük kütüphanelerde de dengeli)
+    ranks = np.argsort(np.argsort(energy, kind="stable"), kind="stable")
+    levels = np.minimum(ranks * len(ENERGY_LEVEL_CATEGORIES) // len(energy), len(ENERGY_LEVEL_CATEGORIES) - 1)
+    dramatic = _zscore(table[:, 3]) >= DRAMATIC_MIN_ZSCORE
+    
+    categories = []
+    for level, is_dramatic in zip(levels, dramatic):
+        names = [ENERGY_LEVEL_CATEGORIES[level]]
+        if is_dramatic:
+            names.append(DRAMATIC_CATEGORY)
+        categories.append([name for name in names if name in AUTO_PRESET_CATEGORIES])
+    return categories
@@ -0,0 +1,134 @@
+"""
+Sidechain ducking - fon seviyesini konuşma zarfına göre ayarlar.
+
+Gövde boyunca sabit ducked seviye yerine: konuşma varken ducked, uzun
+duraklamalarda mid seviyeye açılır. Algılayıcı kısa pencereli RMS
+(vektörel) ile konuşma/boşluk kararı verir; karar hold + lookahead ile
+genişletilip attack/release zarf izleyicisinden (kernels) geçirilir.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float
+from .kernels import envelope_follower, peak_hold, time_constant_coeff
+from ..constants import DuckingConfig
+
+logger = logging.getLogger(__name__)
+
+def voice_activity(samples: np.ndarray, sr: int, threshold_db: float) -> np.ndarray:
+    """
+    Örnek başına konuşma var/yok kararı.
+    
+    Kanallar ortalanır, DETECTOR_MS pencereli RMS seviyesi eşikle
+    karşılaştırılır ve pencere kararı örneklere yayılır.
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        sr: Sample rate
+        threshold_db: Eşik (dBFS)
+    
+    Returns:
+        (frame,) boyutlu 0/1 dizisi (float64)
+    """
+    n = len(samples)
+    if n == 0:
+        return np.zeros(0)
+    
+    hop = max(1, int(sr * DuckingConfig.DETECTOR_MS / 1000.0))
+    frames = -(-n // hop)
+    power = np.zeros(frames * hop, dtype=np.float32)
+    mono = samples.mean(axis=1) if samples.ndim > 1 else samples
+    np.square(mono, out=power[:n])
+    mean_power = power.reshape(frames, hop).mean(axis=1)
+    # Son (eksik) pencerenin ortalaması gerçek uzunluğuyla
+    tail = n - (frames - 1) * hop
+    mean_power[-1] *= hop / tail
+    
+    threshold_power = 10.0 ** (threshold_db / 10.0)
+    active = (mean_power > threshold_power).astype(np.float64)
+    return np.repeat(active, hop)[:n]
+
+def ducking_amount(
+    voice: np.ndarray,
+    sr: int,
+    threshold_db: Optional[float] = None,
+    attack_ms: Optional[float] = None,
+    release_ms: Optional[float] = None
+) -> np.ndarray:
+    """
+    Örnek başına ducking miktarı (1 = tam kısık, 0 = açık).
+    
+    Konuşma kararı HOLD_MS geriye, LOOKAHEAD_MS ileriye genişletilir
+    (kelime arası boşluklarda pompalama olmasın, kısma konuşmadan önce
+    başlasın), baş ve son EDGE_MS kısık tutulur, ardından attack/release
+    izleyicisiyle yumuşatılır.
+    
+    Args:
+        voice: (frame, kanal) float konuşma örnekleri
+        sr: Sample rate
+        threshold_db: Konuşma eşiği (None ise DuckingConfig.THRESHOLD_DB)
+        attack_ms: Kısma süresi (None ise DuckingConfig.ATTACK_MS)
+        release_ms: Açılma süresi (None ise DuckingConfig.RELEASE_MS)
+    
+    Returns:
+        (frame,) boyutlu 0-1 dizisi (float64)
+    """
+    threshold_db = DuckingConfig.THRESHOLD_DB if threshold_db is None else threshold_db
+    attack_ms = DuckingConfig.ATTACK_MS if attack_ms is None else attack_ms
+    release_ms = DuckingConfig.RELEASE_MS if release_ms is None else release_ms
+    
+    active = voice_activity(voice, sr, threshold_db)
+    n = len(active)
+    if n == 0:
+        return active
+    
+    # y[i] = max(active[i - hold : i + lookahead]); peak_hold ileriye bakar, hold kadar kaydır
+    hold = min(int(sr * DuckingConfig.HOLD_MS / 1000.0), n)
+    lookahead = int(sr * DuckingConfig.LOOKAHEAD_MS / 1000.0)
+    held = peak_hold(active, hold + lookahead + 1)
+    key = np.empty(n)
+    key[:hold] = held[0]
+    key[hold:] = held[:n - hold]
+    
+    edge = min(int(sr * DuckingConfig.EDGE_MS / 1000.0), n)
+    key[:edge] = 1.0
+    key[n - edge:] = 1.0
+    
+    return envelope_follower(key, time_constant_coeff(attack_ms, sr), time_constant_coeff(release_ms, sr))
+
+def sidechain_gain_db(
+    voice: AudioSegment,
+    ducked_db: float,
+    open_db: float,
+    threshold_db: Optional[float] = None,
+    attack_ms: Optional[float] = None,
+    release_ms: Optional[float] = None
+) -> np.ndarray:
+    """
+    Konuşma boyunca fon kazancı (dB): konuşmada ducked_db, duraklamada open_db.
+    
+    Args:
+        voice: Konuşma segmenti (fon ile aynı sample rate)
+        ducked_db: Konuşma altı fon seviyesi (dB)
+        open_db: Duraklamadaki fon seviyesi (dB); ducked_db'den düşükse ducking yapılmaz
+        threshold_db: Konuşma eşiği (dBFS)
+        attack_ms: Kısma süresi (ms)
+        release_ms: Açılma süresi (ms)
+    
+    Returns:
+        (frame,) boyutlu kazanç (dB, float64)
+    """
+    samples = segment_to_float(voice)
+    open_db = max(open_db, ducked_db)
+    amount = ducking_amount(samples, voice.frame_rate, threshold_db, attack_ms, release_ms)
+    gain_db = open_db + (ducked_db - open_db) * amount
+    if len(amount):
+        logger.debug(
+            f"Sidechain ducking: sürenin %{np.mean(amount < 0.5) * 100:.0f}'inde fon açık "
+            f"({ducked_db:.1f} -> {open_db:.1f} dB)"
+        )
+    return gain_db
@@ -0,0 +1,374 @@
+"""Dinamik işlemciler - vektörel kompresör ve true-peak limiter (NumPy/SciPy)"""
+
+import time
+import logging
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float, float_to_segment
+from .kernels import envelope_follower, gain_computer, peak_hold, time_constant_coeff
+from ..constants import CompressorConfig, LimiterConfig
+
+logger = logging.getLogger(__name__)
+
+def gain_reduction_db(
+    samples: np.ndarray,
+    sr: int,
+    threshold: float,
+    ratio: float,
+    attack: float,
+    release: float
+) -> np.ndarray:
+    """
+    Kompresörün örnek başına kazanç azaltımını (dB, pozitif) hesaplar.
+    
+    Algılayıcı, pydub'daki gibi son attack ms'lik pencerenin RMS'idir
+    (tüm kanallar birlikte, kümülatif toplamla). Eşiği aşan kısım
+    (1 - 1/ratio) ile çarpılarak hedef azaltım bulunur. Balistik, attack/release
+    zarf izleyicisidir: azaltım artarken attack, azalırken release zaman
+    sabitiyle izlenir. Kazanç hesaplayıcı ve izleyici kernels çekirdekleridir.
+    
+    Args:
+        samples: (frame, kanal) float örnekler ([-1, 1) ölçeği)
+        sr: Sample rate
+        threshold: Eşik (dBFS)
+        ratio: Oran (örn. 3.0 = 3:1)
+        attack: Attack süresi (ms)
+        release: Release süresi (ms)
+    
+    Returns:
+        (frame,) boyutlu azaltım (dB)
+    """
+    n = len(samples)
+    if n == 0:
+        return np.zeros(0)
+    
+    power = np.einsum("ij,ij->i", samples, samples, dtype=np.float64)
+    power /= samples.shape[1]
+    window = min(n, max(1, int(sr * attack / 1000.0)))
+    cumulative = np.empty(n + 1)
+    cumulative[0] = 0.0
+    np.cumsum(power, out=cumulative[1:])
+    # Kayan pencere ortalaması; ilk window frame'de pencere baştan kısalır
+    mean_power = np.empty(n)
+    mean_power[window:] = (cumulative[window + 1:] - cumulative[1:n - window + 1]) / window
+    mean_power[:window] = cumulative[1:window + 1] / np.arange(1, window + 1)
+    
+    level_db = 10.0 * np.log10(np.maximum(mean_power, 1e-20))
+    # Eşik, pydub'daki gibi pencere RMS seviyesiyle (tam ölçeğe göre) karşılaştırılır
+    target = gain_computer(level_db, threshold, ratio)
+    if not target.any():
+        return target
+    
+    return envelope_follower(target, time_constant_coeff(attack, sr), time_constant_coeff(release, sr))
+
+def compress(
+    samples: np.ndarray,
+    sr: int,
+    threshold: float = None,
+    ratio: float = None,
+    attack: float = None,
+    release: float = None
+) -> np.ndarray:
+    """
+    Float örneklere kompresör uygular (kanallar bağlı).
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        sr: Sample rate
+        threshold: Eşik dBFS (None ise CompressorConfig.THRESHOLD)
+        ratio: Oran (None ise CompressorConfig.RATIO)
+        attack: Attack ms (None ise CompressorConfig.ATTACK)
+        release: Release ms (None ise CompressorConfig.RELEASE)
+    
+    Returns:
+        Sıkıştırılmış örnekler (yeni dizi)
+    """
+    threshold = CompressorConfig.THRESHOLD if threshold is None else threshold
+    ratio = CompressorConfig.RATIO if ratio is None else ratio
+    attack = CompressorConfig.ATTACK if attack is None else attack
+    release = CompressorConfig.RELEASE if release is None else release
+    
+    reduction = gain_reduction_db(samples, sr, threshold, ratio, attack, release)
+    if not reduction.any():
+        return samples.copy()
+    gains = np.exp(reduction.astype(np.float32) * np.float32(-np.log(10.0) / 20.0))
+    return samples * gains[:, None]
+
+def compress_dynamic_range(
+    seg: AudioSegment,
+    threshold: float = None,
+    ratio: float = None,
+    attack: float = None,
+    release: float = None
+) -> AudioSegment:
+    """
+    pydub.effects.compress_dynamic_range yerine vektörel kompresör.
+    
+    Parametre adları ve anlamları pydub ile aynıdır; varsayılanlar
+    CompressorConfig'ten gelir.
+    
+    Args:
+        seg: Ses segmenti
+        threshold: Eşik (dBFS)
+        ratio: Oran
+        attack: Attack (ms)
+        release: Release (ms)
+    
+    Returns:
+        Sıkıştırılmış segment
+    """
+    if len(seg) == 0:
+        return seg
+    samples = segment_to_float(seg)
+    return float_to_segment(compress(samples, seg.frame_rate, threshold, ratio, attack, release), seg)
+
+@lru_cache(maxsize=4)
+def _interpolation_phases(oversample: int, taps: int) -> np.ndarray:
+    """
+    True-peak ara noktaları için polifaz FIR kolları.
+    
+    oversample * taps + 1 uzunluğunda Kaiser pencereli alçak geçiren
+    filtre, örnek üzerinde merkezlenip kollara ayrılır. Faz 0 örneğin
+    kendisidir (filtre bu noktalarda sıfırdan geçer), bu yüzden yalnızca
+    1..oversample-1 fazları döner: satır k-1, x[i] ile x[i + 1] arasındaki
+    i + k/oversample noktasını convolve1d ile verir.
+    
+    Args:
+        oversample: Aşırı örnekleme katı
+        taps: Kol başına uzunluk (çift)
+    
+    Returns:
+        (oversample - 1, taps + 1) float32 katsayılar
+    """
+    from scipy.signal import firwin
+    
+    half = taps // 2
+    prototype = firwin(oversample * 2 * half + 1, 1.0 / oversample, window=("kaiser", 5.0)) * oversample
+    center = oversample * half
+    offsets = np.arange(-half, half + 1)
+    phases = np.zeros((oversample - 1, 2 * half + 1))
+    for k in range(1, oversample):
+        # convolve1d: y[i] = sum_j w[j + half] * x[i - j]; ara nokta i + k/os için j -> h[center + os*j + k]
+        index = center + oversample * offsets + k
+        valid = (index >= 0) & (index < len(prototype))
+        phases[k - 1, valid] = prototype[index[valid]]
+    return phases.astype(np.float32)
+
+def true_peak_envelope(samples: np.ndarray, oversample: int = None) -> np.ndarray:
+    """
+    Örnek başına true-peak (örnekler arası tepe dahil) genliği.
+    
+    Her kanal polifaz FIR kollarıyla (convolve1d, float32) ara noktalarda
+    hesaplanır; tam oversample katı tampon oluşturulmaz. i ile i + 1
+    arasındaki ara tepe her iki örneğe de yazılır, çünkü oradaki sinyal
+    iki örneğin kazancıyla birlikte ölçeklenir.
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        oversample: Aşırı örnekleme katı (None ise LimiterConfig.OVERSAMPLE)
+    
+    Returns:
+        (frame,) boyutlu tepe genliği (float64)
+    """
+    from scipy.ndimage import convolve1d
+    
+    if oversample is None:
+        oversample = LimiterConfig.OVERSAMPLE
+    n = len(samples)
+    if n == 0:
+        return np.zeros(0)
+    
+    samples = np.asarray(samples, dtype=np.float32)
+    peaks = np.abs(samples[:, 0])
+    for channel in range(1, samples.shape[1]):
+        np.maximum(peaks, np.abs(samples[:, channel]), out=peaks)
+    if oversample > 1:
+        inter = np.zeros(n, dtype=np.float32)
+        for weights in _interpolation_phases(oversample, LimiterConfig.INTERPOLATION_TAPS):
+            points = convolve1d(samples, weights, axis=0, mode="constant")
+            np.abs(points, out=points)
+            for channel in range(samples.shape[1]):
+                np.maximum(inter, points[:, channel], out=inter)
+        np.maximum(peaks, inter, out=peaks)
+        np.maximum(peaks[1:], inter[:-1], out=peaks[1:])
+    return peaks.astype(np.float64)
+
+def limiter_pre_gain_db(peaks: np.ndarray, sr: int, ceiling_db: float = None) -> float:
+    """
+    Limiter öncesi uygulanacak sabit kazanç (dB).
+    
+    Kazanç tek bir tepeye göre değil, blok tepelerinin yüksek bir
+    yüzdeliğine göre ayarlanır; bunun üzerindeki tekil tepeler limiter'a
+    bırakılır (en fazla LimiterConfig.MAX_GAIN_REDUCTION_DB).
+    
+    Args:
+        peaks: true_peak_envelope çıktısı
+        sr: Sample rate
+        ceiling_db: Tavan (None ise LimiterConfig.CEILING_DB)
+    
+    Returns:
+        Kazanç (dB); sessiz sinyalde 0
+    """
+    if ceiling_db is None:
+        ceiling_db = LimiterConfig.CEILING_DB
+    
+    block = max(1, int(sr * LimiterConfig.BLOCK_MS / 1000.0))
+    usable = len(peaks) // block * block
+    block_peaks = peaks[:usable].reshape(-1, block).max(axis=1) if usable else peaks
+    top = float(peaks.max()) if len(peaks) else 0.0
+    if top <= 1e-10:
+        return 0.0
+    
+    robust_db = 20.0 * np.log10(max(float(np.percentile(block_peaks, LimiterConfig.PEAK_PERCENTILE)), 1e-10))
+    top_db = 20.0 * np.log10(top)
+    return ceiling_db - max(robust_db, top_db - LimiterConfig.MAX_GAIN_REDUCTION_DB)
+
+def limit(
+    samples: np.ndarray,
+    sr: int,
+    ceiling_db: float = None,
+    pre_gain_db: float = 0.0,
+    lookahead_ms: float = None,
+    release_ms: float = None,
+    peaks: np.ndarray = None
+) -> np.ndarray:
+    """
+    Lookahead true-peak limiter.
+    
+    Gereken kazanç azaltımı (dB) lookahead penceresinde ileriye doğru tepe
+    tutulur ve aynı uzunlukta kayan ortalamayla yumuşatılır; böylece
+    azaltım tepeye ulaşıldığında tam olarak uygulanmış olur (gecikme
+    eklenmez, tüm tampon elde). Ardından azaltım anında yakalanıp release
+    zaman sabitiyle bırakılır (attack_coeff=0 zarf izleyicisi).
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        sr: Sample rate
+        ceiling_db: True-peak tavanı (None ise LimiterConfig.CEILING_DB)
+        pre_gain_db: Limiter öncesi sabit kazanç (dB)
+        lookahead_ms: Lookahead (None ise LimiterConfig.LOOKAHEAD_MS)
+        release_ms: Release (None ise LimiterConfig.RELEASE_MS)
+        peaks: Hazır true_peak_envelope (kazanç öncesi; None ise hesaplanır)
+    
+    Returns:
+        İşlenmiş örnekler (yeni dizi)
+    """
+    ceiling_db = LimiterConfig.CEILING_DB if ceiling_db is None else ceiling_db
+    lookahead_ms = LimiterConfig.LOOKAHEAD_MS if lookahead_ms is None else lookahead_ms
+    release_ms = LimiterConfig.RELEASE_MS if release_ms is None else release_ms
+    
+    n = len(samples)
+    if n == 0:
+        return samples.copy()
+    if peaks is None:
+        peaks = true_peak_envelope(samples)
+    
+    # Kazanç sonrası tepe seviyesinin tavanı aştığı miktar (dB)
+    level_db = 20.0 * np.log10(np.maximum(peaks, 1e-10)) + pre_gain_db
+    reduction = np.maximum(level_db - ceiling_db, 0.0)
+    
+    if reduction.any():
+        window = max(1, int(sr * lookahead_ms / 1000.0))
+        held = peak_hold(reduction, window)
+        # Kayan ortalama (pencere baştan kısalır): tepe anında ortalama = tutulan değer
+        cumulative = np.concatenate(([0.0], np.cumsum(held)))
+        smoothed = np.empty(n)
+        head = min(window, n)
+        smoothed[:head] = cumulative[1:head + 1] / np.arange(1, head + 1)
+        smoothed[head:] = (cumulative[head + 1:] - cumulative[1:n - head + 1]) / window
+        # Kümülatif toplam yuvarlaması tavanı aşmasın
+        smoothed = np.maximum(smoothed, reduction)
+        # Anında attack, tutulan değerden release_ms zaman sabitiyle düşüş
+        reduction = envelope_follower(smoothed, 0.0, time_constant_coeff(release_ms, sr))
+    
+    gains = np.exp((pre_gain_db - reduction) * (np.log(10.0) / 20.0)).astype(np.float32)
+    return samples * gains[:, None]
+
+def master_limit(seg: AudioSegment, ceiling_db: float = None) -> AudioSegment:
+    """
+    Tek geçişli mastering: kazanç ayarı + lookahead true-peak limiter.
+    
+    Peak normalizasyonu ve ardışık apply_gain geçişlerinin yerine geçer.
+    True-peak zarfı bir kez hesaplanır; hem kazanç ayarında hem limiter'da
+    kullanılır.
+    
+    Args:
+        seg: Ses segmenti
+        ceiling_db: True-peak tavanı (None ise LimiterConfig.CEILING_DB)
+    
+    Returns:
+        İşlenmiş segment
+    """
+    if ceiling_db is None:
+        ceiling_db = LimiterConfig.CEILING_DB
+    if len(seg) == 0:
+        return seg
+    samples = segment_to_float(seg)
+    peaks = true_peak_envelope(samples)
+    pre_gain = limiter_pre_gain_db(peaks, seg.frame_rate, ceiling_db)
+    out = limit(samples, seg.frame_rate, ceiling_db, pre_gain, peaks=peaks)
+    logger.debug(f"Mastering limiter: kazanç {pre_gain:+.2f} dB, tavan {ceiling_db:.1f} dBTP")
+    return float_to_segment(out, seg)
+
+def benchmark_compressor(duration_s: float = 10.0, sr: int = 44100) -> Dict[str, float]:
+    """
+    Vektörel kompresörü pydub'ınkiyle karşılaştırır.
+    
+    Sentetik sinyal: konuşma benzeri zarfla modüle edilmiş gürültü + sinüs,
+    stereo 16 bit.
+    
+    Args:
+        duration_s: Sinyal süresi (s)
+        sr: Sample rate
+    
+    Returns:
+        {"pydub_s", "numpy_s", "speedup", "level_diff_db"} ölçümleri
+    """
+    from pydub.effects import compress_dynamic_range as pydub_compress
+    from scipy.signal import lfilter  # noqa: F401 - içe aktarma süresi ölçüme girmesin
+    from .kernels import BACKEND
+    
+    rng = np.random.default_rng(0)
+    t = np.arange(int(duration_s * sr)) / sr
+    envelope = 0.2 + 0.8 * (np.sin(2 * np.pi * 0.7 * t) > 0)
+    mono = envelope * (0.4 * np.sin(2 * np.pi * 220 * t) + 0.2 * rng.standard_normal(len(t)))
+    stereo = np.stack([mono, mono * 0.9], axis=1)
+    seg = AudioSegment(
+        (np.clip(stereo, -1, 1) * 32767).astype("<i2").tobytes(),
+        frame_rate=sr, sample_width=2, channels=2
+    )
+    params = dict(
+        threshold=CompressorConfig.THRESHOLD, ratio=CompressorConfig.RATIO,
+        attack=CompressorConfig.ATTACK, release=CompressorConfig.RELEASE
+    )
+    
+    # Çekirdek derleme/yükleme süresi ölçüme girmesin (uygulamada warmup öder)
+    compress(np.full((64, 2), 0.5, dtype=np.float32), sr)
+    
+    started = time.perf_counter()
+    reference = pydub_compress(seg, **params)
+    pydub_s = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    result = compress_dynamic_range(seg, **params)
+    numpy_s = time.perf_counter() - started
+    
+    stats = {
+        "pydub_s": pydub_s,
+        "numpy_s": numpy_s,
+        "speedup": pydub_s / max(numpy_s, 1e-9),
+        "level_diff_db": result.dBFS - reference.dBFS,
+    }
+    logger.info(
+        f"Kompresör ölçümü ({duration_s:.0f}s): pydub {pydub_s:.2f}s, {BACKEND} {numpy_s * 1000:.1f}ms "
+        f"({stats['speedup']:.0f}x), seviye farkı {stats['level_diff_db']:+.2f} dB"
+    )
+    return stats
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(benchmark_compressor())
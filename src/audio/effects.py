@@ -1,12 +1,10 @@
 """Ses efektleri ve işleme fonksiyonları"""
 
 from typing import Literal
-import numpy as np
 from pydub import AudioSegment
-from io import BytesIO
 import logging
 
-from ..constants import AnalysisConfig
+from .envelope import apply_gain_ramp
 
 logger = logging.getLogger(__name__)
 
@@ -53,30 +51,13 @@ def apply_linear_gain_ramp(
         segment: İşlenecek ses segmenti
         start_gain_db: Başlangıç gain (dB)
         end_gain_db: Bitiş gain (dB)
-        step_ms: Adım süresi (ms), None ise varsayılan kullanılır
+        step_ms: Kullanılmaz (kazanç artık örnek başına uygulanır; eski çağrılar için korunur)
         
     Returns:
         İşlenmiş ses segmenti
     """
-    if step_ms is None:
-        step_ms = AnalysisConfig.LINEAR_GAIN_RAMP_STEP_MS
-    
     try:
-        if len(segment) == 0 or start_gain_db == end_gain_db:
-            return segment.apply_gain(start_gain_db)
-        
-        total_ms = len(segment)
-        steps = max(1, total_ms // step_ms)
-        output = AudioSegment.silent(duration=0, frame_rate=segment.frame_rate)
-        
-        for i in range(steps):
-            seg_start = i * step_ms
-            seg_end = total_ms if i == steps - 1 else (i + 1) * step_ms
-            t = (seg_start + seg_end) / 2.0 / max(1, total_ms)
-            current_gain = start_gain_db + (end_gain_db - start_gain_db) * t
-            output += segment[seg_start:seg_end].apply_gain(current_gain)
-        
-        return output
+        return apply_gain_ramp(segment, start_gain_db, end_gain_db, curve="linear")
     except Exception as e:
         logger.warning(f"Linear gain ramp hatası: {e}, sabit gain uygulanıyor")
         return segment.apply_gain(start_gain_db)
@@ -95,7 +76,7 @@ def apply_eased_gain_ramp(
         segment: İşlenecek ses segmenti
         start_gain_db: Başlangıç gain (dB)
         end_gain_db: Bitiş gain (dB)
-        step_ms: Adım süresi (ms), None ise varsayılan kullanılır
+        step_ms: Kullanılmaz (kazanç artık örnek başına uygulanır; eski çağrılar için korunur)
         curve: Eğri tipi
             - 'linear': Doğrusal
             - 'ease_in': Yavaş başlar, hızlanır (bitiriş için ideal)
@@ -105,39 +86,8 @@ def apply_eased_gain_ramp(
     Returns:
         İşlenmiş ses segmenti
     """
-    if step_ms is None:
-        step_ms = AnalysisConfig.GAIN_RAMP_STEP_MS
-    
     try:
-        if len(segment) == 0 or start_gain_db == end_gain_db:
-            return segment.apply_gain(start_gain_db)
-        
-        total_ms = len(segment)
-        steps = max(1, total_ms // step_ms)
-        out = AudioSegment.silent(duration=0, frame_rate=segment.frame_rate)
-        
-        def map_t(t: float) -> float:
-            """Eğri fonksiyonu"""
-            if curve == "linear":
-                return t
-            if curve == "ease_out":
-                return 1.0 - (1.0 - t) ** 2
-            if curve == "ease_in_out":
-                return 0.5 * (1 - np.cos(np.pi * t))
-            # default: ease_in (yumuşak başlar, sonda hızlanır)
-            return t ** 2
-        
-        for i in range(steps):
-            seg_start = i * step_ms
-            seg_end = total_ms if i == steps - 1 else (i + 1) * step_ms
-            # Segmentin ortasına göre t
-            t = (seg_start + seg_end) / 2.0 / max(1, total_ms)
-            t = float(np.clip(map_t(t), 0.0, 1.0))
-            current = start_gain_db + (end_gain_db - start_gain_db) * t
-            out += segment[seg_start:seg_end].apply_gain(current)
-        
-        return out
+        return apply_gain_ramp(segment, start_gain_db, end_gain_db, curve=curve)
     except Exception as e:
         logger.warning(f"Eased gain ramp hatası: {e}, sabit gain uygulanıyor")
         return segment.apply_gain(start_gain_db)
-
@@ -0,0 +1,209 @@
+"""Gain zarfı motoru - örnek hassasiyetinde kazanç eğrileri (NumPy)"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Literal, NamedTuple, Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float, float_to_segment
+from ..constants import AudioConfig
+
+logger = logging.getLogger(__name__)
+
+CurveType = Literal["linear", "ease_in", "ease_out", "ease_in_out"]
+GainScale = Literal["db", "amplitude"]
+
+def ease(t: np.ndarray, curve: CurveType = "linear") -> np.ndarray:
+    """
+    0-1 arası ilerlemeyi easing eğrisinden geçirir (vektörel).
+    
+    Args:
+        t: İlerleme değerleri (0-1)
+        curve: Eğri tipi
+            - 'linear': Doğrusal
+            - 'ease_in': Yavaş başlar, hızlanır (bitiriş için ideal)
+            - 'ease_out': Hızlı başlar, yavaşlar
+            - 'ease_in_out': Yavaş-hızlı-yavaş (S-curve)
+    
+    Returns:
+        Eğrilenmiş ilerleme (0-1)
+    """
+    if curve == "linear":
+        shaped = t
+    elif curve == "ease_out":
+        shaped = 1.0 - (1.0 - t) ** 2
+    elif curve == "ease_in_out":
+        shaped = 0.5 * (1.0 - np.cos(np.pi * t))
+    else:
+        # default: ease_in (yumuşak başlar, sonda hızlanır)
+        shaped = t ** 2
+    return np.clip(shaped, 0.0, 1.0)
+
+def db_to_amplitude(gain_db):
+    """dB kazancı doğrusal çarpana çevirir"""
+    return np.power(10.0, np.asarray(gain_db) / 20.0)
+
+def gain_curve(
+    n_samples: int,
+    start_gain_db: float,
+    end_gain_db: float,
+    curve: CurveType = "linear",
+    scale: GainScale = "db"
+) -> np.ndarray:
+    """
+    Örnek başına kazanç çarpanı eğrisi üretir.
+    
+    Her örnek kendi zamanındaki kazancı alır (basamak yok). scale='db' ise
+    eğri dB cinsinden, 'amplitude' ise doğrusal genlik cinsinden ilerler.
+    
+    Args:
+        n_samples: Örnek (frame) sayısı
+        start_gain_db: Başlangıç gain (dB)
+        end_gain_db: Bitiş gain (dB)
+        curve: Eğri tipi (bkz. ease)
+        scale: İnterpolasyon ölçeği
+    
+    Returns:
+        (n_samples,) boyutlu float32 çarpanlar
+    """
+    if n_samples <= 0:
+        return np.zeros(0, dtype=np.float32)
+    
+    # Örnek merkezleri: ilk ve son örnek uç değerlere yarım örnek mesafede
+    t = ease((np.arange(n_samples, dtype=np.float64) + 0.5) / n_samples, curve)
+    if scale == "amplitude":
+        start, end = db_to_amplitude(start_gain_db), db_to_amplitude(end_gain_db)
+        gains = start + (end - start) * t
+    else:
+        gains = db_to_amplitude(start_gain_db + (end_gain_db - start_gain_db) * t)
+    return gains.astype(np.float32)
+
+class CurveCacheStats(NamedTuple):
+    """Zarf eğrisi önbelleği sayaçları"""
+    hits: int
+    misses: int
+    size: int  # Önbellekteki eğri sayısı
+    
+    @property
+    def hit_rate(self) -> float:
+        """İsabet oranı (0-1; hiç istek yoksa 0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def since(self, earlier: "CurveCacheStats") -> "CurveCacheStats":
+        """earlier anından bu yana geçen isabet/ıska sayıları"""
+        return CurveCacheStats(self.hits - earlier.hits, self.misses - earlier.misses, self.size)
+    
+    def __str__(self) -> str:
+        total = self.hits + self.misses
+        return f"{self.hits}/{total} isabet (%{self.hit_rate * 100:.0f}), {self.size} eğri"
+
+_curve_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_curve_cache_lock = threading.Lock()
+_curve_hits = 0
+_curve_misses = 0
+
+def cached_gain_curve(
+    n_samples: int,
+    start_gain_db: float,
+    end_gain_db: float,
+    curve: CurveType = "linear",
+    scale: GainScale = "db",
+    sr: Optional[int] = None
+) -> np.ndarray:
+    """
+    gain_curve'ün LRU önbellekli hali.
+    
+    Toplu montajda spotların çoğu aynı intro rampasını (ve çoğu zaman aynı
+    outro düşüşünü) kullanır; eğri (uzunluk, dB uçları, eğri, ölçek, hız)
+    anahtarıyla bir kez hesaplanır. Dönen dizi salt okunurdur (paylaşılır;
+    değiştirmek için kopyalanmalı).
+    
+    Args:
+        n_samples: Örnek (frame) sayısı
+        start_gain_db: Başlangıç gain (dB)
+        end_gain_db: Bitiş gain (dB)
+        curve: Eğri tipi (bkz. ease)
+        scale: İnterpolasyon ölçeği
+        sr: Sample rate (yalnızca anahtar için)
+    
+    Returns:
+        (n_samples,) boyutlu salt okunur float32 çarpanlar
+    """
+    global _curve_hits, _curve_misses
+    
+    key = (int(n_samples), float(start_gain_db), float(end_gain_db), curve, scale, sr)
+    with _curve_cache_lock:
+        gains = _curve_cache.get(key)
+        if gains is not None:
+            _curve_cache.move_to_end(key)
+            _curve_hits += 1
+            return gains
+        _curve_misses += 1
+    
+    gains = gain_curve(n_samples, start_gain_db, end_gain_db, curve, scale)
+    gains.flags.writeable = False
+    with _curve_cache_lock:
+        _curve_cache[key] = gains
+        while len(_curve_cache) > AudioConfig.CURVE_CACHE_SIZE:
+            _curve_cache.popitem(last=False)
+    return gains
+
+def curve_cache_stats() -> CurveCacheStats:
+    """Zarf eğrisi önbelleğinin (süreç başından beri) sayaçları"""
+    with _curve_cache_lock:
+        return CurveCacheStats(_curve_hits, _curve_misses, len(_curve_cache))
+
+def clear_curve_cache() -> None:
+    """Zarf eğrisi önbelleğini ve sayaçlarını sıfırlar"""
+    global _curve_hits, _curve_misses
+    
+    with _curve_cache_lock:
+        _curve_cache.clear()
+        _curve_hits = 0
+        _curve_misses = 0
+
+def apply_gain_envelope(segment: AudioSegment, gains: np.ndarray) -> AudioSegment:
+    """
+    Örnek başına kazanç çarpanlarını tek çarpımla uygular.
+    
+    Args:
+        segment: İşlenecek ses segmenti
+        gains: (frame sayısı,) boyutlu çarpanlar (tüm kanallara aynı)
+    
+    Returns:
+        İşlenmiş ses segmenti
+    """
+    samples = segment_to_float(segment)
+    if len(gains) != len(samples):
+        raise ValueError(f"Zarf uzunluğu ({len(gains)}) frame sayısıyla ({len(samples)}) uyuşmuyor")
+    samples *= np.asarray(gains, dtype=np.float32)[:, None]
+    return float_to_segment(samples, segment)
+
+def apply_gain_ramp(
+    segment: AudioSegment,
+    start_gain_db: float,
+    end_gain_db: float,
+    curve: CurveType = "linear",
+    scale: GainScale = "db"
+) -> AudioSegment:
+    """
+    Segmente örnek hassasiyetinde gain ramp uygular.
+    
+    Args:
+        segment: İşlenecek ses segmenti
+        start_gain_db: Başlangıç gain (dB)
+        end_gain_db: Bitiş gain (dB)
+        curve: Eğri tipi (bkz. ease)
+        scale: İnterpolasyon ölçeği ('db' veya 'amplitude')
+    
+    Returns:
+        İşlenmiş ses segmenti
+    """
+    if len(segment) == 0 or start_gain_db == end_gain_db:
+        return segment.apply_gain(start_gain_db)
+    gains = cached_gain_curve(int(segment.frame_count()), start_gain_db, end_gain_db, curve, scale, segment.frame_rate)
+    return apply_gain_envelope(segment, gains)
@@ -0,0 +1,160 @@
+"""
+Fade ve crossfade - float tamponlar üzerinde yerinde (in-place) işlemler.
+
+pydub fade_in/fade_out ve append(crossfade=...) her çağrıda tüm segmenti
+kopyalar. Buradaki ilkel işlemler yalnızca fade bölgesini çarpar;
+append_with_crossfade ise sadece eklenen parçayı ve örtüşen kuyruğu float'a
+çevirir, ana segmentin geri kalanını ham bayt olarak aynen kullanır.
+"""
+
+import logging
+from typing import Literal
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float, float_to_segment
+
+logger = logging.getLogger(__name__)
+
+FadeShape = Literal["linear", "equal_power"]
+
+def fade_curve(n_samples: int, shape: FadeShape = "linear", rising: bool = True) -> np.ndarray:
+    """
+    Fade kazanç eğrisi (0 -> 1 veya 1 -> 0).
+    
+    'linear' genlikte doğrusaldır (pydub fade ile aynı). 'equal_power'
+    sin/cos çeyrek dalgasıdır: iki ilişkisiz sinyal arasında crossfade
+    boyunca toplam güç sabit kalır.
+    
+    Args:
+        n_samples: Örnek (frame) sayısı
+        shape: Eğri tipi
+        rising: True ise 0 -> 1 (fade-in), False ise 1 -> 0 (fade-out)
+    
+    Returns:
+        (n_samples,) boyutlu float32 çarpanlar
+    """
+    if n_samples <= 0:
+        return np.zeros(0, dtype=np.float32)
+    
+    # Örnek merkezleri (gain_curve ile aynı): uçlara yarım örnek mesafe
+    t = (np.arange(n_samples, dtype=np.float64) + 0.5) / n_samples
+    if not rising:
+        t = 1.0 - t
+    if shape == "equal_power":
+        gains = np.sin(0.5 * np.pi * t)
+    else:
+        gains = t
+    return gains.astype(np.float32)
+
+def fade_in(samples: np.ndarray, n_samples: int, shape: FadeShape = "linear") -> np.ndarray:
+    """
+    Tamponun ilk n_samples örneğine yerinde fade-in uygular.
+    
+    Args:
+        samples: (frame, kanal) float32 tampon (değiştirilir)
+        n_samples: Fade uzunluğu (örnek); tampondan uzunsa kırpılır
+        shape: Eğri tipi
+    
+    Returns:
+        Aynı tampon
+    """
+    n = min(max(int(n_samples), 0), len(samples))
+    if n:
+        samples[:n] *= fade_curve(n, shape, rising=True)[:, None]
+    return samples
+
+def fade_out(samples: np.ndarray, n_samples: int, shape: FadeShape = "linear") -> np.ndarray:
+    """
+    Tamponun son n_samples örneğine yerinde fade-out uygular.
+    
+    Args:
+        samples: (frame, kanal) float32 tampon (değiştirilir)
+        n_samples: Fade uzunluğu (örnek); tampondan uzunsa kırpılır
+        shape: Eğri tipi
+    
+    Returns:
+        Aynı tampon
+    """
+    n = min(max(int(n_samples), 0), len(samples))
+    if n:
+        samples[len(samples) - n:] *= fade_curve(n, shape, rising=False)[:, None]
+    return samples
+
+def crossfade(outgoing: np.ndarray, incoming: np.ndarray, shape: FadeShape = "equal_power") -> np.ndarray:
+    """
+    Eşit uzunluktaki iki parçayı yerinde karıştırır: outgoing azalır, incoming yükselir.
+    
+    Sonuç outgoing tamponuna yazılır; incoming değişmez.
+    
+    Args:
+        outgoing: (frame, kanal) float32 biten parça (değiştirilir)
+        incoming: (frame, kanal) float32 başlayan parça
+        shape: Eğri tipi
+    
+    Returns:
+        outgoing tamponu (karışım)
+    """
+    if len(outgoing) != len(incoming):
+        raise ValueError(f"Crossfade uzunlukları uyuşmuyor: {len(outgoing)} != {len(incoming)}")
+    n = len(outgoing)
+    if n:
+        outgoing *= fade_curve(n, shape, rising=False)[:, None]
+        outgoing += incoming * fade_curve(n, shape, rising=True)[:, None]
+    return outgoing
+
+def append_with_crossfade(
+    base: AudioSegment,
+    tail: AudioSegment,
+    crossfade_ms: int,
+    tail_fade_in_ms: int = 0,
+    base_fade_out_ms: int = 0,
+    shape: FadeShape = "linear"
+) -> AudioSegment:
+    """
+    tail'i base'in sonuna crossfade ile ekler (pydub append(crossfade=...) yerine).
+    
+    Yalnızca tail ve base'in örtüşen son crossfade_ms'i float'a çevrilir;
+    base'in geri kalanı ham bayt olarak kopyalanır. Maliyet tail uzunluğuyla
+    orantılıdır (tek bayt birleştirmesi hariç).
+    
+    Args:
+        base: Ana segment (frame rate ve kanal sayısı tail ile aynı olmalı)
+        tail: Eklenecek segment
+        crossfade_ms: Örtüşme süresi (ms); segmentlerden uzunsa kısaltılır
+        tail_fade_in_ms: tail başına ayrıca uygulanacak doğrusal fade-in (ms)
+        base_fade_out_ms: base sonuna crossfade'den önce uygulanacak doğrusal fade-out (ms)
+        shape: Crossfade eğrisi ("linear" pydub append ile aynı)
+    
+    Returns:
+        Yeni segment (len(base) + len(tail) - örtüşme)
+    """
+    if base.frame_rate != tail.frame_rate or base.channels != tail.channels:
+        raise ValueError(
+            f"Segment formatları uyuşmuyor: {base.frame_rate} Hz/{base.channels} kanal, "
+            f"{tail.frame_rate} Hz/{tail.channels} kanal"
+        )
+    if base.sample_width == 3:
+        # float_to_segment 24 bit yazmaz: birleştirme formatı tutarlı olsun
+        base = base.set_sample_width(4)
+    
+    sr = base.frame_rate
+    base_frames = int(base.frame_count())
+    samples = segment_to_float(tail)
+    overlap = min(int(crossfade_ms * sr / 1000), base_frames, len(samples))
+    base_fade = min(int(base_fade_out_ms * sr / 1000), base_frames)
+    # base'in float'a çevrilen kuyruğu: örtüşme ve fade-out bölgesinden uzun olanı
+    region = max(overlap, base_fade)
+    
+    fade_in(samples, int(tail_fade_in_ms * sr / 1000), "linear")
+    if region:
+        head = segment_to_float(base.get_sample_slice(base_frames - region, base_frames))
+        fade_out(head, base_fade, "linear")
+        if overlap:
+            samples[:overlap] = crossfade(head[region - overlap:], samples[:overlap], shape)
+        samples = np.concatenate([head[:region - overlap], samples])
+    
+    mixed = float_to_segment(samples, base)
+    prefix_bytes = (base_frames - region) * base.frame_width
+    return base._spawn(base.raw_data[:prefix_bytes] + mixed.raw_data)
@@ -0,0 +1,453 @@
+"""Fon müziği özellik önbelleği - beat ve enerji analizleri"""
+
+import os
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from ..constants import AnalysisConfig
+from ..utils.file_utils import get_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Özellik formatı değiştiğinde artırılır (eski disk önbelleği geçersiz olur)
+FEATURE_CACHE_VERSION = 2
+
+class FonFeatures(NamedTuple):
+    """Bir fon müziğinin outro tespiti için gereken analiz sonuçları"""
+    duration_ms: float
+    tempo: float
+    beat_times: np.ndarray  # Beat zamanları (ms)
+    rms: np.ndarray  # RMS enerji eğrisi
+    rms_times: np.ndarray  # RMS frame zamanları (ms)
+    rms_threshold: float  # Düşük enerji eşiği (medyan * RMS_THRESHOLD_RATIO)
+    downbeat_times: np.ndarray  # Ölçü başı zamanları (ms)
+    phrase_times: np.ndarray  # Cümle (PHRASE_BARS ölçü) sınırı zamanları (ms)
+    
+    @property
+    def low_energy_times(self) -> np.ndarray:
+        """Düşük enerjili frame zamanları (ms)"""
+        return self.rms_times[self.rms < self.rms_threshold]
+
+class LoopPoints(NamedTuple):
+    """Fon müziğini uzatmak için ölçü başlarına oturan döngü noktaları"""
+    start_ms: float  # Döngü başı: döngü sonuna gelince buraya dönülür
+    end_ms: float  # Döngü sonu
+    score: float  # Geçiş benzerliği (0-1, yüksek = daha temiz ek yeri)
+
+_memory_cache: Dict[str, FonFeatures] = {}
+_loop_cache: Dict[str, LoopPoints] = {}
+_key_locks: Dict[str, threading.Lock] = {}
+_cache_lock = threading.Lock()
+_prefetching = set()
+
+def _cache_key(fon_path: str, sr: int) -> str:
+    """Dosya yolu, boyutu, değişiklik zamanı, sample rate ve beat takipçisinden önbellek anahtarı üretir"""
+    path = os.path.abspath(fon_path)
+    stat = os.stat(path)
+    raw = f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{sr}|{AnalysisConfig.BEAT_TRACKER}|{FEATURE_CACHE_VERSION}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def _disk_cache_path(key: str, kind: str = "") -> str:
+    """Anahtara ait .npz dosyasının yolu (kind: "" özellikler, "loop" döngü noktaları)"""
+    name = f"{key}.{kind}.npz" if kind else f"{key}.npz"
+    return os.path.join(get_app_data_dir("cache", "features"), name)
+
+def _load_from_disk(key: str, cls=FonFeatures, kind: str = ""):
+    """Disk önbelleğinden NamedTuple kaydını okur (yoksa veya bozuksa None)"""
+    path = _disk_cache_path(key, kind)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            return cls(**{
+                name: data[name].item() if data[name].ndim == 0 else data[name]
+                for name in cls._fields
+            })
+    except Exception as e:
+        logger.debug(f"Özellik önbelleği okunamadı ({path}): {e}")
+        return None
+
+def _save_to_disk(key: str, record, kind: str = "") -> None:
+    """NamedTuple kaydını disk önbelleğine atomik olarak yazar"""
+    path = _disk_cache_path(key, kind)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **{name: np.asarray(value) for name, value in record._asdict().items()})
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.debug(f"Özellik önbelleği yazılamadı ({path}): {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _get_cached(key: str, memory: Dict, cls, kind: str, compute: Callable[[], Any], label: str):
+    """
+    Bellek -> disk -> hesaplama sırasıyla kaydı döndürür.
+    
+    Aynı kayıt için eşzamanlı iki hesaplama yapılmaz (anahtar başına kilit).
+    """
+    cached = memory.get(key)
+    if cached is not None:
+        return cached
+    
+    with _cache_lock:
+        key_lock = _key_locks.setdefault(f"{key}.{kind}", threading.Lock())
+    
+    with key_lock:
+        cached = memory.get(key)
+        if cached is not None:
+            return cached
+        
+        record = _load_from_disk(key, cls, kind)
+        if record is None:
+            logger.debug(f"{label} hesaplanıyor")
+            record = compute()
+            _save_to_disk(key, record, kind)
+        else:
+            logger.debug(f"{label} disk önbelleğinden yüklendi")
+        
+        memory[key] = record
+        return record
+
+def _analyze_signal(
+    y: np.ndarray,
+    sr: int,
+    offset_ms: float,
+    duration_ms: float,
+    tracker: str = None,
+    power: Optional[np.ndarray] = None
+) -> FonFeatures:
+    """
+    Mono sinyalden beat, RMS, downbeat ve cümle sınırı özelliklerini çıkarır.
+    
+    Args:
+        y: Mono ses sinyali
+        sr: Sample rate
+        offset_ms: Sinyalin dosya içindeki başlangıcı (ms), zamanlara eklenir
+        duration_ms: Dosyanın toplam süresi (ms)
+        tracker: "librosa" veya "numpy" (None ise AnalysisConfig.BEAT_TRACKER)
+        power: Sinyalin hazır STFT güç spektrumu (beat.power_spectrogram; None ise hesaplanır)
+        
+    Returns:
+        FonFeatures (zamanlar dosya başına göre)
+    """
+    if tracker is None:
+        tracker = AnalysisConfig.BEAT_TRACKER
+    
+    hop_length = AnalysisConfig.HOP_LENGTH
+    if tracker == "numpy":
+        # Hafif tahminci: numba/librosa gerektirmez
+        from .beat import beat_track, frame_rms
+        
+        tempo, beats = beat_track(y, sr, hop_length)
+        rms = frame_rms(y, AnalysisConfig.FRAME_LENGTH, hop_length)
+    else:
+        import librosa
+        
+        tempo, beats = librosa.beat.beat_track(y=y, sr=sr, hop_length=hop_length)
+        rms = librosa.feature.rms(
+            y=y,
+            frame_length=AnalysisConfig.FRAME_LENGTH,
+            hop_length=hop_length,
+            center=True
+        )[0]
+    
+    # Ölçü başları ve cümle sınırları (beat-senkron chroma/enerji yeniliği)
+    from .beat import chroma_from_power, downbeat_phrase_index, power_spectrogram
+    
+    if power is None:
+        power = power_spectrogram(y, AnalysisConfig.FRAME_LENGTH, hop_length)
+    chroma = chroma_from_power(power, sr, AnalysisConfig.FRAME_LENGTH)
+    downbeats, phrases = downbeat_phrase_index(beats, chroma, rms)
+    
+    # Frame -> ms
+    frame_ms = hop_length / sr * 1000.0
+    beat_times = np.asarray(beats, dtype=np.float64) * frame_ms + offset_ms
+    rms_times = np.arange(len(rms), dtype=np.float64) * frame_ms + offset_ms
+    
+    # Düşük enerji eşiği: medyanın %70'i
+    thr = float(np.median(rms) * AnalysisConfig.RMS_THRESHOLD_RATIO) if len(rms) else 0.0
+    
+    return FonFeatures(
+        duration_ms=float(duration_ms),
+        tempo=float(np.atleast_1d(tempo)[0]),
+        beat_times=beat_times.astype(np.float64),
+        rms=rms.astype(np.float32),
+        rms_times=rms_times.astype(np.float64),
+        rms_threshold=thr,
+        downbeat_times=downbeats.astype(np.float64) * frame_ms + offset_ms,
+        phrase_times=phrases.astype(np.float64) * frame_ms + offset_ms
+    )
+
+def compute_fon_features(fon_path: str, sr: int = None) -> FonFeatures:
+    """
+    Fon müziğini analiz eder (beat ve RMS enerji).
+    
+    Önbellek kullanmaz; normalde get_fon_features tercih edilmelidir.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+        
+    Returns:
+        FonFeatures
+    """
+    import librosa
+    
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    y, sr = librosa.load(fon_path, sr=sr, mono=True)
+    duration_ms = len(y) / sr * 1000.0
+    return _analyze_signal(y, sr, 0.0, duration_ms)
+
+def compute_window_features(
+    fon_path: str,
+    start_ms: float,
+    end_ms: float,
+    sr: int = None,
+    rms_threshold: Optional[float] = None
+) -> FonFeatures:
+    """
+    Fon müziğinin yalnızca [start_ms, end_ms) penceresini çözüp analiz eder.
+    
+    Dosyanın tamamı decode edilmez ve beat takibi yalnızca pencere üzerinde
+    çalışır. Zamanlar dosya başına göre döner. Düşük enerji eşiği tam
+    analizle aynı olsun diye şarkının tamamının eşiği verilmelidir; verilmezse
+    pencerenin RMS medyanından hesaplanır (aday seçimi tam analizden sapar).
+    Tempo ve downbeat/cümle ızgarası pencereye yereldir.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        start_ms: Pencere başlangıcı (ms)
+        end_ms: Pencere bitişi (ms)
+        sr: Sample rate (None ise varsayılan kullanılır)
+        rms_threshold: Şarkının tamamının düşük enerji eşiği (örn. preset indeksinden)
+        
+    Returns:
+        Pencereye ait FonFeatures (duration_ms dosyanın toplam süresidir)
+    """
+    import librosa
+    
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    total_ms = librosa.get_duration(path=fon_path) * 1000.0
+    start_ms = max(0.0, min(float(start_ms), total_ms))
+    end_ms = max(start_ms, min(float(end_ms), total_ms))
+    
+    y, sr = librosa.load(
+        fon_path,
+        sr=sr,
+        mono=True,
+        offset=start_ms / 1000.0,
+        duration=(end_ms - start_ms) / 1000.0
+    )
+    features = _analyze_signal(y, sr, start_ms, total_ms)
+    if rms_threshold is not None:
+        features = features._replace(rms_threshold=float(rms_threshold))
+    return features
+
+def get_fon_features(
+    fon_path: str,
+    sr: int = None,
+    signal: Optional[np.ndarray] = None,
+    power: Optional[np.ndarray] = None
+) -> FonFeatures:
+    """
+    Fon müziği özelliklerini önbellekten döndürür, yoksa hesaplar.
+    
+    Sonuçlar (fon, sr) başına bir kez hesaplanır; bellekte ve uygulama
+    veri klasöründe .npz olarak saklanır. Dosya değişirse (boyut veya
+    değişiklik zamanı) önbellek kendiliğinden geçersiz olur.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+        signal: Dosyanın sr hızında, mono olarak zaten decode edilmiş hali
+            (verilirse hesaplama için dosya yeniden okunmaz)
+        power: signal'in STFT güç spektrumu (beat.power_spectrogram, opsiyonel)
+    
+    Returns:
+        FonFeatures
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    def compute() -> FonFeatures:
+        if signal is None:
+            return compute_fon_features(fon_path, sr)
+        return _analyze_signal(signal, sr, 0.0, len(signal) / sr * 1000.0, power=power)
+    
+    key = _cache_key(fon_path, sr)
+    return _get_cached(key, _memory_cache, FonFeatures, "", compute, f"Fon özellikleri ({fon_path})")
+
+def prefetch_fon_features(fon_path: str, sr: int = None) -> None:
+    """
+    Fon özelliklerini arka planda hesaplatır (sonraki çağrılar önbellekten döner).
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    try:
+        key = _cache_key(fon_path, sr)
+    except OSError:
+        return
+    
+    with _cache_lock:
+        if key in _memory_cache or key in _prefetching:
+            return
+        _prefetching.add(key)
+    
+    def worker():
+        try:
+            get_fon_features(fon_path, sr)
+        except Exception as e:
+            logger.debug(f"Fon özellikleri arka planda hesaplanamadı ({fon_path}): {e}")
+        finally:
+            with _cache_lock:
+                _prefetching.discard(key)
+    
+    threading.Thread(target=worker, name="FonFeaturePrefetch", daemon=True).start()
+
+def is_fon_features_cached(fon_path: str, sr: int = None) -> bool:
+    """
+    Fon özelliklerinin bellekte veya diskte hazır olup olmadığını döndürür.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+    
+    Returns:
+        Önbellekte varsa True
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    try:
+        key = _cache_key(fon_path, sr)
+    except OSError:
+        return False
+    return key in _memory_cache or os.path.exists(_disk_cache_path(key))
+
+def compute_loop_points(fon_path: str, sr: int = None) -> LoopPoints:
+    """
+    Fonun kendine benzerliğinden en temiz döngü noktalarını bulur.
+    
+    Önbellekteki ölçü başları (downbeat) kullanılır; her ölçü için ortalama
+    chroma ve RMS enerji hesaplanır. Döngü sonu j ve döngü başı i ölçüleri,
+    j ile i ve önlerindeki LOOP_CONTEXT_BARS ölçünün chroma benzerliği ve
+    enerji yakınlığına göre puanlanır. Enerjisi düşen kuyruk (fade-out)
+    ölçüleri döngü sonu olamaz; eşit puanlarda daha uzun döngü tercih edilir.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+    
+    Returns:
+        LoopPoints (uygun ölçü yoksa dosyanın tamamı, skor 0)
+    """
+    import librosa
+    
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    features = get_fon_features(fon_path, sr)
+    whole = LoopPoints(0.0, float(features.duration_ms), 0.0)
+    
+    context = AnalysisConfig.LOOP_CONTEXT_BARS
+    bar_ms = features.downbeat_times
+    if len(bar_ms) < AnalysisConfig.LOOP_MIN_BARS + context + 2:
+        return whole
+    
+    y, sr = librosa.load(fon_path, sr=sr, mono=True)
+    hop_length = AnalysisConfig.HOP_LENGTH
+    chroma = librosa.feature.chroma_stft(y=y, sr=sr, hop_length=hop_length)
+    rms = features.rms[:chroma.shape[1]]
+    
+    # Ölçü başına ortalama chroma (birim vektör) ve log enerji
+    frame_ms = hop_length / sr * 1000.0
+    bar_frames = np.unique(np.clip(np.rint(bar_ms / frame_ms).astype(np.int64), 0, len(rms) - 1))
+    counts = np.diff(np.append(bar_frames, len(rms))).astype(np.float64)
+    bar_chroma = np.add.reduceat(chroma[:, :len(rms)], bar_frames, axis=1) / counts
+    bar_chroma /= np.maximum(np.linalg.norm(bar_chroma, axis=0), 1e-10)
+    bar_energy = np.log(np.maximum(np.add.reduceat(rms, bar_frames) / counts, 1e-10))
+    n_bars = len(bar_frames)
+    
+    # Ölçü çiftleri benzerliği: chroma kosinüs * enerji yakınlığı (2 kat fark ~ e^-1)
+    similarity = (bar_chroma.T @ bar_chroma) * np.exp(
+        -np.abs(bar_energy[:, None] - bar_energy[None, :]) / np.log(2.0)
+    )
+    
+    # Bağlamlı skor: score[i, j] = ortalama similarity[i - c, j - c], c = 0..context
+    score = np.full((n_bars, n_bars), -np.inf)
+    acc = np.zeros((n_bars - context, n_bars - context))
+    for c in range(context + 1):
+        acc += similarity[context - c:n_bars - c, context - c:n_bars - c]
+    score[context:, context:] = acc / (context + 1)
+    
+    # Geçerli çiftler: yeterince uzun döngü, son (yarım) ölçü hariç, kuyruk enerjisi yeterli
+    i_idx, j_idx = np.meshgrid(np.arange(n_bars), np.arange(n_bars), indexing="ij")
+    loud_enough = bar_energy >= np.median(bar_energy) + np.log(AnalysisConfig.RMS_THRESHOLD_RATIO)
+    valid = (j_idx - i_idx >= AnalysisConfig.LOOP_MIN_BARS) & (j_idx <= n_bars - 2) & loud_enough[None, :]
+    if not valid.any():
+        return whole
+    
+    ranked = np.where(valid, score + 0.05 * (j_idx - i_idx) / n_bars, -np.inf)
+    i, j = np.unravel_index(int(np.argmax(ranked)), ranked.shape)
+    return LoopPoints(
+        float(bar_frames[i] * frame_ms),
+        float(bar_frames[j] * frame_ms),
+        float(score[i, j])
+    )
+
+def get_loop_points(fon_path: str, sr: int = None) -> LoopPoints:
+    """
+    Fon döngü noktalarını önbellekten döndürür, yoksa hesaplar.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        sr: Sample rate (None ise varsayılan kullanılır)
+    
+    Returns:
+        LoopPoints
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    key = _cache_key(fon_path, sr)
+    return _get_cached(
+        key, _loop_cache, LoopPoints, "loop",
+        lambda: compute_loop_points(fon_path, sr),
+        f"Döngü noktaları ({fon_path})"
+    )
+
+def clear_feature_cache(disk: bool = False) -> None:
+    """
+    Bellek önbelleğini (ve istenirse disk önbelleğini) temizler.
+    
+    Args:
+        disk: True ise .npz dosyaları da silinir
+    """
+    with _cache_lock:
+        _memory_cache.clear()
+        _loop_cache.clear()
+        _key_locks.clear()
+    
+    if disk:
+        cache_dir = get_app_data_dir("cache", "features")
+        for name in os.listdir(cache_dir):
+            if name.endswith(".npz"):
+                try:
+                    os.remove(os.path.join(cache_dir, name))
+                except OSError:
+                    pass
@@ -0,0 +1,155 @@
+"""
+DSP çekirdekleri - zarf izleyici, kazanç hesaplayıcı ve tepe tutucu.
+
+numba kuruluysa derlenmiş (compiled.py, njit cache=True) uygulamalar,
+değilse saf NumPy/SciPy (reference.py) uygulamaları kullanılır. İki
+uygulama aynı çıktıyı verir (tests/test_kernels.py; çalışma anında
+verify_kernels). Derleme önbelleği, bu paket içe aktarılmadan önce
+utils.file_utils.configure_jit_cache ile uygulama veri klasörüne
+yönlendirilir; NUMBA_DISABLE_JIT=1 ile NumPy uygulamalarına geçilir.
+"""
+
+import logging
+from typing import Dict
+
+import numpy as np
+
+from . import reference
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import config as _numba_config
+    from . import compiled
+    # JIT kapalıysa derlenmiş fonksiyonlar saf Python döngüsü olur: NumPy daha hızlı
+    HAS_NUMBA = not _numba_config.DISABLE_JIT
+except ImportError:  # numba yok: NumPy uygulamaları
+    compiled = None
+    HAS_NUMBA = False
+
+_backend = compiled if HAS_NUMBA else reference
+BACKEND = "numba" if HAS_NUMBA else "numpy"
+
+def _as_float64(signal) -> np.ndarray:
+    return np.ascontiguousarray(signal, dtype=np.float64)
+
+def time_constant_coeff(time_ms: float, sr: int) -> float:
+    """
+    Zaman sabitinden (ms) tek kutuplu filtre katsayısı.
+    
+    Args:
+        time_ms: Zaman sabiti (ms)
+        sr: Örnekleme hızı (Hz)
+    
+    Returns:
+        Kutup katsayısı (0-1)
+    """
+    return float(np.exp(-1.0 / max(time_ms / 1000.0 * sr, 1.0)))
+
+def one_pole(signal: np.ndarray, coeff: float) -> np.ndarray:
+    """Tek kutuplu alçak geçiren filtre (başlangıç durumu ilk örnek)"""
+    return _backend.one_pole(_as_float64(signal), float(coeff))
+
+def envelope_follower(signal: np.ndarray, attack_coeff: float, release_coeff: float) -> np.ndarray:
+    """
+    Attack/release zarf izleyici.
+    
+    Tek durum tutulur: giriş zarfın üstündeyse attack, altındaysa release
+    katsayısıyla izlenir (attack_coeff=0 anında yakalar, sonra release ile
+    düşer).
+    
+    Args:
+        signal: Giriş (örn. kazanç azaltımı, dB)
+        attack_coeff: Attack katsayısı (bkz. time_constant_coeff)
+        release_coeff: Release katsayısı
+    
+    Returns:
+        Zarf (float64)
+    """
+    return _backend.envelope_follower(_as_float64(signal), float(attack_coeff), float(release_coeff))
+
+def gain_computer(level_db: np.ndarray, threshold: float, ratio: float, knee_db: float = 0.0) -> np.ndarray:
+    """
+    Kazanç hesaplayıcı: eşiği aşan seviye için kazanç azaltımı (dB, pozitif).
+    
+    Args:
+        level_db: Algılanan seviye (dB)
+        threshold: Eşik (dB)
+        ratio: Oran (float("inf") = limiter)
+        knee_db: Yumuşak diz genişliği (dB)
+    
+    Returns:
+        Kazanç azaltımı (dB, float64)
+    """
+    return _backend.gain_computer(_as_float64(level_db), float(threshold), float(ratio), float(knee_db))
+
+def peak_hold(signal: np.ndarray, window: int) -> np.ndarray:
+    """
+    İleriye bakan tepe tutucu: y[i] = max(|x[i:i + window]|).
+    
+    Args:
+        signal: Giriş
+        window: Pencere (örnek)
+    
+    Returns:
+        Tepe zarfı (float64)
+    """
+    return _backend.peak_hold(_as_float64(signal), int(window))
+
+def verify_kernels(n: int = 200_000, seed: int = 0) -> Dict[str, bool]:
+    """
+    Derlenmiş ve NumPy çekirdeklerinin aynı çıktıyı verdiğini doğrular.
+    
+    Rastgele sinyaller ve sınır durumları (boş, tek örnek, pencereden kısa)
+    üzerinde iki uygulamayı karşılaştırır. numba yoksa boş sözlük döner.
+    
+    Args:
+        n: Sinyal uzunluğu
+        seed: Rastgele sayı seed'i
+    
+    Returns:
+        Çekirdek adı -> eşit mi
+    """
+    if not HAS_NUMBA:
+        logger.info("numba yok, çekirdek doğrulaması atlandı")
+        return {}
+    
+    rng = np.random.default_rng(seed)
+    signals = [
+        rng.standard_normal(n) * 10.0,
+        np.abs(rng.standard_normal(n)).cumsum() % 7.0,
+        np.zeros(0),
+        np.array([3.0]),
+        rng.standard_normal(5),
+    ]
+    cases = {
+        "one_pole": lambda m, x: m.one_pole(x, 0.995),
+        "envelope_follower": lambda m, x: m.envelope_follower(x, 0.9, 0.9995),
+        "gain_computer": lambda m, x: m.gain_computer(x, -2.0, 3.0, 0.0),
+        "gain_computer_knee": lambda m, x: m.gain_computer(x, -2.0, 4.0, 6.0),
+        "gain_computer_limiter": lambda m, x: m.gain_computer(x, -1.0, np.inf, 0.0),
+        "peak_hold": lambda m, x: m.peak_hold(x, 64),
+        "peak_hold_window_1": lambda m, x: m.peak_hold(x, 1),
+        "peak_hold_long_window": lambda m, x: m.peak_hold(x, 4096),
+    }
+    
+    results = {}
+    for name, run in cases.items():
+        results[name] = all(
+            np.array_equal(run(compiled, _as_float64(x)), run(reference, _as_float64(x)))
+            for x in signals
+        )
+        if not results[name]:
+            logger.warning(f"Çekirdek uyuşmazlığı: {name}")
+    return results
+
+__all__ = [
+    "HAS_NUMBA",
+    "BACKEND",
+    "time_constant_coeff",
+    "one_pole",
+    "envelope_follower",
+    "gain_computer",
+    "peak_hold",
+    "verify_kernels",
+]
@@ -0,0 +1,14 @@
+"""Çekirdek doğrulaması: python -m src.audio.kernels"""
+
+import logging
+
+from . import BACKEND, verify_kernels
+
+# src.audio paketi bu modülden önce yüklenir; JIT önbellek klasörü için
+# NUMBA_CACHE_DIR ortam değişkeni çalıştırmadan önce ayarlanmalıdır
+logging.basicConfig(level=logging.INFO)
+
+results = verify_kernels()
+print(f"Backend: {BACKEND}")
+for name, ok in results.items():
+    print(f"  {name}: {'aynı' if ok else 'FARKLI'}")
@@ -0,0 +1,75 @@
+"""DSP çekirdeklerinin numba ile derlenmiş uygulamaları (reference.py ile aynı çıktı)"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def one_pole(signal, coeff):
+    n = signal.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    gain = 1.0 - coeff
+    state = signal[0]
+    for i in range(n):
+        state = gain * signal[i] + coeff * state
+        out[i] = state
+    return out
+
+@njit(cache=True)
+def envelope_follower(signal, attack_coeff, release_coeff):
+    n = signal.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    state = signal[0]
+    for i in range(n):
+        coeff = attack_coeff if signal[i] > state else release_coeff
+        state = (1.0 - coeff) * signal[i] + coeff * state
+        out[i] = state
+    return out
+
+@njit(cache=True)
+def gain_computer(level_db, threshold, ratio, knee_db):
+    n = level_db.shape[0]
+    out = np.empty(n)
+    slope = 1.0 - 1.0 / ratio
+    half = knee_db / 2.0
+    for i in range(n):
+        over = level_db[i] - threshold
+        if knee_db > 0.0 and abs(over) <= half:
+            shifted = over + half
+            out[i] = slope * (shifted * shifted) / (2.0 * knee_db)
+        else:
+            out[i] = slope * max(over, 0.0)
+    return out
+
+@njit(cache=True)
+def peak_hold(signal, window):
+    n = signal.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    if window < 1:
+        window = 1
+    blocks = (n + window - 1 + window - 1) // window
+    size = blocks * window
+    forward = np.zeros(size)
+    backward = np.zeros(size)
+    for b in range(blocks):
+        start = b * window
+        running = 0.0
+        for j in range(window):
+            k = start + j
+            value = abs(signal[k]) if k < n else 0.0
+            running = max(running, value)
+            forward[k] = running
+        running = 0.0
+        for j in range(window - 1, -1, -1):
+            k = start + j
+            value = abs(signal[k]) if k < n else 0.0
+            running = max(running, value)
+            backward[k] = running
+    for i in range(n):
+        out[i] = max(backward[i], forward[i + window - 1])
+    return out
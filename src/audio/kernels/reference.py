@@ -0,0 +1,116 @@
+"""DSP çekirdeklerinin saf NumPy/SciPy uygulamaları (numba yoksa kullanılır)"""
+
+import numpy as np
+
+def one_pole(signal: np.ndarray, coeff: float) -> np.ndarray:
+    """
+    Tek kutuplu alçak geçiren filtre: y[n] = (1 - c) * x[n] + c * y[n - 1].
+    
+    Başlangıç durumu ilk örnektir (filtre sıfırdan yükselerek başlamaz).
+    
+    Args:
+        signal: Giriş (float64)
+        coeff: Kutup katsayısı c (0-1)
+    
+    Returns:
+        Filtrelenmiş sinyal
+    """
+    from scipy.signal import lfilter
+    
+    if len(signal) == 0:
+        return np.zeros(0)
+    out, _ = lfilter([1.0 - coeff], [1.0, -coeff], signal, zi=[coeff * signal[0]])
+    return out
+
+def envelope_follower(signal: np.ndarray, attack_coeff: float, release_coeff: float) -> np.ndarray:
+    """
+    Attack/release zarf izleyici.
+    
+    Tek durumlu özyineleme: giriş durumun üstündeyse attack, değilse
+    release katsayısıyla y[n] = (1 - c) * x[n] + c * y[n - 1]. Aynı kipte
+    kalınan her aralık sabit katsayılı tek kutuplu filtredir; aralıklar
+    lfilter ile parça parça (kip değişene kadar, uzunluğu ikiye katlanan
+    bloklarla) hesaplanır.
+    
+    Args:
+        signal: Giriş (örn. dB cinsinden kazanç azaltımı), float64
+        attack_coeff: Attack kutup katsayısı (0 = anında)
+        release_coeff: Release kutup katsayısı
+    
+    Returns:
+        Zarf
+    """
+    from scipy.signal import lfilter
+    
+    n = len(signal)
+    out = np.empty(n)
+    if n == 0:
+        return out
+    
+    state = signal[0]
+    start = 0
+    length = 16
+    while start < n:
+        rising = signal[start] > state
+        coeff = attack_coeff if rising else release_coeff
+        chunk = signal[start:start + length]
+        y, _ = lfilter([1.0 - coeff], [1.0, -coeff], chunk, zi=[coeff * state])
+        # Her örnekte kip bir önceki çıktıya göre seçilir; ilk uymayan örnekte aralık biter
+        previous = np.concatenate(([state], y[:-1]))
+        switched = np.flatnonzero((chunk > previous) != rising)
+        end = int(switched[0]) if len(switched) else len(chunk)
+        out[start:start + end] = y[:end]
+        state = y[end - 1]
+        start += end
+        length = length * 2 if end == len(chunk) else 16
+    return out
+
+def gain_computer(level_db: np.ndarray, threshold: float, ratio: float, knee_db: float = 0.0) -> np.ndarray:
+    """
+    Kompresör kazanç hesaplayıcı: eşiği aşan seviye için kazanç azaltımı (dB, pozitif).
+    
+    Args:
+        level_db: Algılanan seviye (dB)
+        threshold: Eşik (dB)
+        ratio: Oran (inf = limiter)
+        knee_db: Yumuşak diz genişliği (dB, 0 = sert diz)
+    
+    Returns:
+        Kazanç azaltımı (dB)
+    """
+    slope = 1.0 - 1.0 / ratio
+    over = level_db - threshold
+    reduction = slope * np.maximum(over, 0.0)
+    if knee_db > 0.0:
+        half = knee_db / 2.0
+        in_knee = np.abs(over) <= half
+        shifted = over[in_knee] + half
+        reduction[in_knee] = slope * (shifted * shifted) / (2.0 * knee_db)
+    return reduction
+
+def peak_hold(signal: np.ndarray, window: int) -> np.ndarray:
+    """
+    İleriye bakan tepe tutucu: y[i] = max(|x[i:i + window]|).
+    
+    van Herk/Gil-Werman yöntemi: blok içi ileri ve geri kümülatif
+    maksimumlarla pencere boyundan bağımsız O(n).
+    
+    Args:
+        signal: Giriş
+        window: Pencere uzunluğu (örnek)
+    
+    Returns:
+        Tepe zarfı (float64)
+    """
+    n = len(signal)
+    window = max(1, int(window))
+    if n == 0:
+        return np.zeros(0)
+    
+    blocks = -(-(n + window - 1) // window)
+    padded = np.zeros(blocks * window)
+    padded[:n] = np.abs(signal)
+    tiles = padded.reshape(blocks, window)
+    forward = np.maximum.accumulate(tiles, axis=1).ravel()
+    backward = np.maximum.accumulate(tiles[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(backward[:n], forward[window - 1:window - 1 + n])
@@ -0,0 +1,191 @@
+"""Sanal döngülü fon kaynağı - fonu kopyalamadan döngü noktalarından uzatır"""
+
+import logging
+from typing import Optional, Union
+
+import numpy as np
+from pydub import AudioSegment
+
+from ..constants import AudioConfig
+
+logger = logging.getLogger(__name__)
+
+# Döngü periyodu bundan kısaysa (ms) dosyanın tamamı döngülenir
+MIN_LOOP_PERIOD_MS = 1000
+
+class LoopedSource:
+    """
+    Fon müziğini döngü noktaları üzerinden sanal olarak uzatan kaynak.
+    
+    Zaman çizelgesi: fon baştan döngü sonuna kadar çalar, ardından döngü
+    başı ile sonu arasını tekrar eder. Her ek yerinde döngü sonundan önceki
+    kısa bölge, döngü başından önceki bölgeyle equal-power crossfade edilir.
+    Döngü başından önce yeterli malzeme yoksa (örn. dosyanın tamamı
+    döngüleniyorsa) döngü başı crossfade süresi kadar ileri alınır; ek
+    yerinde fonun ilk crossfade_ms'i gelen taraf olur, sert kesik oluşmaz.
+    Yalnızca istenen dilim üretilir; fon bellekte tek kopya olarak kalır.
+    
+    AudioSegment gibi dilimlenir (ms) ve len() ile uzunluğu (ms) okunur.
+    """
+    
+    def __init__(
+        self,
+        segment: AudioSegment,
+        loop_start_ms: float,
+        loop_end_ms: float,
+        length_ms: float,
+        crossfade_ms: Optional[float] = None
+    ):
+        """
+        LoopedSource oluşturur.
+        
+        Args:
+            segment: Kaynak fon
+            loop_start_ms: Döngü başı (ms)
+            loop_end_ms: Döngü sonu (ms)
+            length_ms: Sanal toplam uzunluk (ms)
+            crossfade_ms: Ek yeri crossfade süresi (None ise AudioConfig.LOOP_CROSSFADE_MS)
+        """
+        if crossfade_ms is None:
+            crossfade_ms = AudioConfig.LOOP_CROSSFADE_MS
+        
+        # 8 bit (WAV'da işaretsiz) ve 24 bit örnekler NumPy tamsayı görünümüne
+        # doğrudan uymaz: pydub ile 16/32 bit'e genişletilir (ek yeri hesabı bozulmasın)
+        if segment.sample_width == 1:
+            segment = segment.set_sample_width(2)
+        elif segment.sample_width == 3:
+            segment = segment.set_sample_width(4)
+        
+        self.segment = segment
+        self.frame_rate = segment.frame_rate
+        self.channels = segment.channels
+        self.sample_width = segment.sample_width
+        
+        # raw_data üzerinde görünüm (kopya yok)
+        dtype = np.dtype(f"<i{segment.sample_width}")
+        self._samples = np.frombuffer(segment.raw_data, dtype=dtype).reshape(-1, segment.channels)
+        self._dtype = self._samples.dtype
+        n = len(self._samples)
+        
+        loop_start = int(np.clip(self._frames(loop_start_ms), 0, n))
+        loop_end = int(np.clip(self._frames(loop_end_ms), 0, n))
+        if loop_end - loop_start < self._frames(MIN_LOOP_PERIOD_MS):
+            loop_start, loop_end = 0, n
+        
+        # Crossfade döngü başından önceki malzemeyle yapılır; yoksa döngü başı ileri alınır
+        fade = int(min(self._frames(crossfade_ms), (loop_end - loop_start) // 2))
+        loop_start = max(loop_start, fade)
+        
+        self._loop_start = loop_start
+        self._loop_end = loop_end
+        self._period = max(1, loop_end - loop_start)
+        self._crossfade = fade
+        self._length = max(0, self._frames(length_ms))
+    
+    def _frames(self, ms: float) -> int:
+        return int(ms * self.frame_rate / 1000.0)
+    
+    def __len__(self) -> int:
+        return int(round(self._length / self.frame_rate * 1000.0))
+    
+    def __repr__(self) -> str:
+        return (
+            f"LoopedSource({len(self)}ms, döngü "
+            f"{self._loop_start / self.frame_rate:.2f}-{self._loop_end / self.frame_rate:.2f}s)"
+        )
+    
+    def _source_positions(self, positions: np.ndarray) -> np.ndarray:
+        """Sanal frame konumlarını kaynak frame konumlarına çevirir"""
+        source = positions.copy()
+        looped = positions >= self._loop_end
+        source[looped] = self._loop_start + (positions[looped] - self._loop_end) % self._period
+        return source
+    
+    def render(self, start_frame: int, end_frame: int) -> np.ndarray:
+        """
+        [start_frame, end_frame) sanal aralığını üretir.
+        
+        Args:
+            start_frame: Başlangıç frame'i
+            end_frame: Bitiş frame'i (hariç)
+        
+        Returns:
+            (frame, kanal) boyutlu örnek dizisi (kaynak dtype'ında)
+        """
+        start_frame = max(0, start_frame)
+        end_frame = min(self._length, end_frame)
+        if end_frame <= start_frame:
+            return np.zeros((0, self.channels), dtype=self._dtype)
+        
+        positions = np.arange(start_frame, end_frame, dtype=np.int64)
+        source = self._source_positions(positions)
+        
+        # Crossfade bölgesine düşmeyen dilim doğrudan kaynaktan okunur
+        fade = self._crossfade
+        fade_start = self._loop_end - fade
+        in_fade = source >= fade_start
+        if fade > 0:
+            # Ek yeri sanal uzunluk içinde kalıyorsa crossfade uygula
+            in_fade &= positions + (self._loop_end - source) < self._length
+        if not in_fade.any():
+            return self._samples[source]
+        
+        out = self._samples[source].astype(np.float64)
+        t = (source[in_fade] - fade_start + 0.5) / fade
+        fade_out = np.cos(t * np.pi / 2)[:, None]
+        fade_in = np.sin(t * np.pi / 2)[:, None]
+        incoming = self._samples[source[in_fade] - self._period].astype(np.float64)
+        out[in_fade] = out[in_fade] * fade_out + incoming * fade_in
+        
+        info = np.iinfo(self._dtype)
+        return np.clip(np.rint(out), info.min, info.max).astype(self._dtype)
+    
+    def __getitem__(self, item: Union[slice, int]) -> AudioSegment:
+        """AudioSegment gibi ms ile dilimler (adım desteklenmez)"""
+        total_ms = len(self)
+        if isinstance(item, slice):
+            start = 0 if item.start is None else item.start
+            stop = total_ms if item.stop is None else item.stop
+        else:
+            start, stop = item, item + 1
+        
+        if start < 0:
+            start += total_ms
+        if stop < 0:
+            stop += total_ms
+        start = max(0, min(start, total_ms))
+        stop = max(start, min(stop, total_ms))
+        
+        samples = self.render(self._frames(start), self._frames(stop))
+        return self.segment._spawn(samples.tobytes())
+
+def loop_source(
+    segment: AudioSegment,
+    length_ms: float,
+    loop_start_ms: Optional[float] = None,
+    loop_end_ms: Optional[float] = None
+) -> Union[AudioSegment, LoopedSource]:
+    """
+    Fonu en az length_ms uzunluğa getirir.
+    
+    Fon zaten yeterince uzunsa olduğu gibi döner; değilse döngü noktaları
+    (verilmemişse dosyanın tamamı) üzerinden sanal olarak uzatılır.
+    
+    Args:
+        segment: Fon müziği
+        length_ms: Gereken uzunluk (ms)
+        loop_start_ms: Döngü başı (ms, opsiyonel)
+        loop_end_ms: Döngü sonu (ms, opsiyonel)
+    
+    Returns:
+        AudioSegment veya LoopedSource
+    """
+    if len(segment) >= length_ms:
+        return segment
+    
+    if loop_start_ms is None or loop_end_ms is None:
+        loop_start_ms, loop_end_ms = 0, len(segment)
+    
+    source = LoopedSource(segment, loop_start_ms, loop_end_ms, length_ms)
+    logger.debug(f"Fon döngüyle uzatıldı: {source!r}")
+    return source
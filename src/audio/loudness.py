@@ -0,0 +1,223 @@
+"""
+Loudness ölçümü (ITU-R BS.1770-4 / EBU R128) ve LUFS hedefli mastering.
+
+K ağırlıklı sinyal (yüksek raf + yüksek geçiren, sosfilt) 100 ms alt
+bloklara bölünüp kareler toplanır; 400 ms bloklar (%75 örtüşme) dört
+ardışık alt bloğun toplamıdır, böylece tüm bloklar tek geçişte vektörel
+hesaplanır. Entegre loudness -70 LUFS mutlak ve -10 LU göreli kapıyla
+bulunur.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float, float_to_segment
+from .dynamics import limit, true_peak_envelope
+from ..constants import LoudnessConfig
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=8)
+def k_weighting_sos(sr: int) -> np.ndarray:
+    """
+    BS.1770 K ağırlık filtresinin ikinci dereceden bölümleri (önbellekli).
+    
+    Standart 48 kHz katsayıları verir; diğer örnekleme hızları için aynı
+    analog prototipten (raf: 1682 Hz, +4 dB; yüksek geçiren: 38 Hz)
+    bilineer dönüşümle hesaplanır.
+    
+    Args:
+        sr: Sample rate
+    
+    Returns:
+        (2, 6) sos dizisi (scipy.signal.sosfilt biçimi)
+    """
+    # Aşama 1: kafa etkisini modelleyen yüksek raf filtresi
+    f0, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = np.tan(np.pi * f0 / sr)
+    vh = 10.0 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = [
+        (vh + vb * k / q + k * k) / a0,
+        2.0 * (k * k - vh) / a0,
+        (vh - vb * k / q + k * k) / a0,
+        1.0,
+        2.0 * (k * k - 1.0) / a0,
+        (1.0 - k / q + k * k) / a0,
+    ]
+    
+    # Aşama 2: RLB yüksek geçiren filtre
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * f0 / sr)
+    a0 = 1.0 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0, 1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    
+    sos = np.array([shelf, highpass])
+    sos.flags.writeable = False
+    return sos
+
+def block_loudness(samples: np.ndarray, sr: int) -> np.ndarray:
+    """
+    400 ms blokların (%75 örtüşme) loudness değerleri.
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        sr: Sample rate
+    
+    Returns:
+        (blok,) boyutlu LUFS değerleri (sessiz blok -inf)
+    """
+    from scipy.signal import sosfilt
+    
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    step = int(round(sr * LoudnessConfig.STEP_MS / 1000.0))
+    sub_blocks = len(samples) // step
+    per_block = LoudnessConfig.BLOCK_MS // LoudnessConfig.STEP_MS
+    if sub_blocks < per_block:
+        return np.zeros(0)
+    
+    # sosfilt salt okunur katsayı kabul etmez; önbellekteki dizi paylaşıldığı için kopya
+    weighted = sosfilt(k_weighting_sos(sr).copy(), samples[:sub_blocks * step], axis=0)
+    # Kanal ağırlıkları (L, R, C = 1.0); mono/stereo için kanallar toplanır
+    np.square(weighted, out=weighted)
+    energy = weighted.reshape(sub_blocks, step, -1).sum(axis=(1, 2))
+    cumulative = np.concatenate(([0.0], np.cumsum(energy)))
+    block_energy = (cumulative[per_block:] - cumulative[:-per_block]) / (per_block * step)
+    
+    with np.errstate(divide="ignore"):
+        return -0.691 + 10.0 * np.log10(block_energy)
+
+def integrated_loudness(samples: np.ndarray, sr: int) -> float:
+    """
+    Kapılı entegre loudness (LUFS).
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        sr: Sample rate
+    
+    Returns:
+        LUFS; 400 ms'den kısa veya sessiz sinyalde -inf
+    """
+    loudness = block_loudness(samples, sr)
+    gated = loudness[loudness > LoudnessConfig.ABSOLUTE_GATE_LUFS]
+    if len(gated) == 0:
+        return float("-inf")
+    
+    # Göreli kapı: mutlak kapıyı geçen blokların ortalama enerjisinin 10 LU altı
+    energy = np.power(10.0, (gated + 0.691) / 10.0)
+    relative_gate = -0.691 + 10.0 * np.log10(energy.mean()) + LoudnessConfig.RELATIVE_GATE_LU
+    energy = energy[gated > relative_gate]
+    return float(-0.691 + 10.0 * np.log10(energy.mean()))
+
+def measure_loudness(seg: AudioSegment) -> float:
+    """Segmentin entegre loudness değeri (LUFS)"""
+    return integrated_loudness(segment_to_float(seg), seg.frame_rate)
+
+def master_loudness(
+    seg: AudioSegment,
+    target_lufs: Optional[float] = None,
+    ceiling_db: Optional[float] = None
+) -> AudioSegment:
+    """
+    LUFS hedefli mastering: hedefe kazanç + true-peak tavanlı limiter.
+    
+    Kazanç ölçülen loudness'tan hesaplanır ve true-peak limiter'a ön kazanç
+    olarak verilir (tek çarpım). Limiter tepeleri kısıp loudness'ı hedefin
+    altına düşürürse fark ölçülüp kazanca eklenir (en fazla MAX_ITERATIONS
+    tur).
+    
+    Args:
+        seg: Ses segmenti
+        target_lufs: Hedef (None ise LoudnessConfig.TARGET_LUFS)
+        ceiling_db: True-peak tavanı (None ise LoudnessConfig.TRUE_PEAK_CEILING_DB)
+    
+    Returns:
+        İşlenmiş segment (ölçülemeyecek kadar kısa/sessizse seg'in kendisi)
+    """
+    target_lufs = LoudnessConfig.TARGET_LUFS if target_lufs is None else target_lufs
+    ceiling_db = LoudnessConfig.TRUE_PEAK_CEILING_DB if ceiling_db is None else ceiling_db
+    
+    samples = segment_to_float(seg)
+    sr = seg.frame_rate
+    measured = integrated_loudness(samples, sr)
+    if not np.isfinite(measured):
+        logger.debug("Loudness ölçülemedi (kısa veya sessiz), mastering atlandı")
+        return seg
+    
+    peaks = true_peak_envelope(samples)
+    gain_db = target_lufs - measured
+    for _ in range(LoudnessConfig.MAX_ITERATIONS):
+        out = limit(samples, sr, ceiling_db, pre_gain_db=gain_db, peaks=peaks)
+        achieved = integrated_loudness(out, sr)
+        error = target_lufs - achieved
+        if abs(error) <= LoudnessConfig.TOLERANCE_LU:
+            break
+        gain_db += error
+    
+    logger.debug(
+        f"Loudness mastering: {measured:.1f} -> {achieved:.1f} LUFS "
+        f"(hedef {target_lufs:.1f}, kazanç {gain_db:+.1f} dB, tavan {ceiling_db:.1f} dBTP)"
+    )
+    return float_to_segment(out, seg)
+
+def benchmark_loudness(duration_s: float = 60.0, sr: int = 44100) -> dict:
+    """
+    Ölçüm hızını ve LUFS mastering doğruluğunu ölçer.
+    
+    Sentetik sinyal: stereo 16 bit, genliği değişen gürültü + 220 Hz ton
+    (kapıların devreye girdiği sessiz bölümlerle).
+    
+    Args:
+        duration_s: Sinyal süresi (s)
+        sr: Sample rate
+    
+    Returns:
+        {"measure_s", "master_s", "lufs", "true_peak_db"} ölçümleri
+    """
+    import time
+    
+    rng = np.random.default_rng(0)
+    t = np.arange(int(duration_s * sr)) / sr
+    envelope = 0.02 + 0.5 * (np.sin(2 * np.pi * 0.2 * t) > -0.5)
+    mono = envelope * (0.3 * np.sin(2 * np.pi * 220 * t) + 0.2 * rng.standard_normal(len(t)))
+    stereo = np.stack([mono, mono * 0.9], axis=1)
+    seg = AudioSegment(
+        (np.clip(stereo, -1, 1) * 32767).astype("<i2").tobytes(),
+        frame_rate=sr, sample_width=2, channels=2
+    )
+    samples = segment_to_float(seg)
+    
+    # scipy içe aktarma ve çekirdek derleme süresi ölçüme girmesin
+    master_loudness(seg.get_sample_slice(0, sr))
+    
+    started = time.perf_counter()
+    measured = integrated_loudness(samples, sr)
+    measure_s = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    result = master_loudness(seg)
+    master_s = time.perf_counter() - started
+    
+    stats = {
+        "measure_s": measure_s,
+        "master_s": master_s,
+        "lufs": measure_loudness(result),
+        "true_peak_db": float(20 * np.log10(true_peak_envelope(segment_to_float(result)).max())),
+    }
+    logger.info(
+        f"Loudness ölçümü ({duration_s:.0f}s): {measure_s * 1000:.1f}ms ({measured:.1f} LUFS); "
+        f"mastering {master_s * 1000:.0f}ms -> {stats['lufs']:.2f} LUFS, {stats['true_peak_db']:.2f} dBTP "
+        f"(hedef {LoudnessConfig.TARGET_LUFS:.1f} LUFS / {LoudnessConfig.TRUE_PEAK_CEILING_DB:.1f} dBTP)"
+    )
+    return stats
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(benchmark_loudness())
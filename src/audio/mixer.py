@@ -1,18 +1,227 @@
-"""Müzikal bitiş noktası tespiti"""
+"""Müzikal bitiş noktası ve fon başlangıç noktası tespiti"""
 
 import logging
-import librosa
 import numpy as np
-from typing import Optional
+from typing import Optional, Sequence, Union
 
+from .features import (
+    FonFeatures, get_fon_features, compute_window_features,
+    is_fon_features_cached, prefetch_fon_features
+)
 from ..constants import AnalysisConfig
 
 logger = logging.getLogger(__name__)
 
+def outro_candidates(features: FonFeatures) -> np.ndarray:
+    """
+    Outro aday noktalarını (beat'ler + düşük enerji anları) döndürür.
+    
+    Args:
+        features: Fon müziği özellikleri
+        
+    Returns:
+        Sıralı, tekrarsız aday zamanları (ms)
+    """
+    return np.unique(np.concatenate((features.beat_times, features.low_energy_times)))
+
+def snap_outro_points(features: FonFeatures, outro_points_ms, mode: Optional[str] = None) -> np.ndarray:
+    """
+    Bitiş noktalarını sonraki cümle sonuna veya ölçü başına oturtur.
+    
+    Her nokta için önceden hesaplanmış cümle/downbeat dizisinde
+    np.searchsorted ile O(log n) arama yapılır. Nokta yalnızca ileri
+    kaydırılır ve en fazla OUTRO_SNAP_MAX_EXTEND_MS uzatılır; 'phrase'
+    modunda yakında cümle sonu yoksa ölçü başı denenir.
+    
+    Args:
+        features: Fon müziği özellikleri
+        outro_points_ms: Bitiş noktaları (ms)
+        mode: "phrase", "downbeat" veya "none" (None ise AnalysisConfig.OUTRO_SNAP)
+        
+    Returns:
+        Oturtulmuş bitiş noktaları (ms, float64 dizi)
+    """
+    if mode is None:
+        mode = AnalysisConfig.OUTRO_SNAP
+    
+    points = np.asarray(outro_points_ms, dtype=np.float64).reshape(-1)
+    if mode == "phrase":
+        grids = (features.phrase_times, features.downbeat_times)
+    elif mode == "downbeat":
+        grids = (features.downbeat_times,)
+    else:
+        return points
+    
+    snapped = points.copy()
+    pending = np.ones(len(points), dtype=bool)
+    for grid in grids:
+        if len(grid) == 0 or not pending.any():
+            continue
+        idx = np.searchsorted(grid, points, side="left")
+        target = grid[np.minimum(idx, len(grid) - 1)]
+        ok = (
+            pending
+            & (idx < len(grid))
+            & (target - points <= AnalysisConfig.OUTRO_SNAP_MAX_EXTEND_MS)
+            & (target <= features.duration_ms)
+        )
+        snapped[ok] = target[ok]
+        pending &= ~ok
+    
+    return snapped
+
+def outro_points_from_features(
+    features: FonFeatures,
+    start_points_ms,
+    snap: Optional[str] = None
+) -> np.ndarray:
+    """
+    Birden fazla konuşma bitişi için müzikal bitiş noktalarını tek seferde seçer.
+    
+    Aday dizisi bir kez sıralanır; her bitiş için ilk aday np.searchsorted
+    ile bulunur (tek tek aramadaki kural: hedeften sonraki ilk aday + bir
+    ölçü). outro_point_from_features bu fonksiyonun tek noktalı halidir.
+    Bulunan noktalar son olarak snap_outro_points ile cümle sonuna veya
+    ölçü başına oturtulur; bu adım noktayı en fazla OUTRO_SNAP_MAX_EXTEND_MS
+    ileri kaydırır. snap="none" oturtmasız (eski) bitişleri verir.
+    
+    Args:
+        features: Fon müziği özellikleri
+        start_points_ms: Konuşma bitiş noktaları (ms)
+        snap: Oturtma modu (None ise AnalysisConfig.OUTRO_SNAP)
+        
+    Returns:
+        Önerilen bitiş noktaları (ms, float64 dizi)
+    """
+    starts = np.asarray(start_points_ms, dtype=np.float64).reshape(-1)
+    duration_ms = features.duration_ms
+    beat_times = features.beat_times
+    
+    # Konuşma bitimi + minimum tutma süresi
+    target_starts = starts + AnalysisConfig.MIN_HOLD_MS
+    
+    # İlk aday: target_start'tan kesin büyük ilk beat veya düşük enerji anı
+    candidates = outro_candidates(features)
+    idx = np.searchsorted(candidates, target_starts, side="right")
+    has_candidate = idx < len(candidates)
+    
+    # 1 ölçü süresi (4 beat) tahmini
+    if len(beat_times) > 4:
+        one_measure = float(np.median(np.diff(beat_times)) * 4.0)
+    else:
+        # Tempo bilgisi yoksa ölçüyü varsayılan değerle
+        one_measure = AnalysisConfig.ONE_MEASURE_FALLBACK_MS
+    
+    if len(candidates):
+        first = candidates[np.minimum(idx, len(candidates) - 1)]
+    else:
+        first = np.zeros_like(starts)
+    
+    # Müziğin sonunu aşma
+    outro_points = np.minimum(first + one_measure, duration_ms)
+    
+    # Toplamda çok kısa kalan bitişleri biraz daha uzat
+    too_short = outro_points - starts < AnalysisConfig.MIN_TOTAL_OUTRO_MS
+    outro_points = np.where(
+        too_short,
+        np.minimum(duration_ms, starts + AnalysisConfig.FALLBACK_OUTRO_MS),
+        outro_points
+    )
+    
+    # Aday yoksa: güvenli fallback
+    if not has_candidate.all():
+        logger.debug(f"{int(np.count_nonzero(~has_candidate))} bitiş için aday bulunamadı, fallback kullanılıyor")
+        outro_points = np.where(
+            has_candidate,
+            outro_points,
+            np.minimum(duration_ms, target_starts + AnalysisConfig.FALLBACK_OUTRO_MS)
+        )
+    
+    # Cümle sonu / ölçü başına oturt
+    return snap_outro_points(features, outro_points, snap)
+
+def outro_point_from_features(
+    features: FonFeatures,
+    start_point_ms: float,
+    snap: Optional[str] = None
+) -> float:
+    """
+    Önceden hesaplanmış fon özelliklerinden müzikal bitiş noktasını seçer.
+    
+    Args:
+        features: Fon müziği özellikleri
+        start_point_ms: Konuşma bitiş noktası (ms)
+        snap: Oturtma modu (None ise AnalysisConfig.OUTRO_SNAP)
+        
+    Returns:
+        Önerilen bitiş noktası (ms)
+    """
+    return float(outro_points_from_features(features, [start_point_ms], snap)[0])
+
+def _full_song_reference(fon_path: str) -> Optional[dict]:
+    """Preset indeksindeki tam şarkı tempo ve düşük enerji eşiği (kayıt yoksa None)"""
+    try:
+        from .preset_index import get_preset_index
+        
+        entry = get_preset_index().get(fon_path)
+    except Exception as e:
+        logger.debug(f"Preset indeksi okunamadı: {e}")
+        return None
+    if entry is None or "rms_threshold" not in entry:
+        return None
+    return entry
+
+def _window_features(
+    fon_path: str,
+    start_point_ms: float,
+    sr: int,
+    require_reference: bool
+) -> Optional[FonFeatures]:
+    """
+    Outro arama bölgesini kapsayan pencerenin özelliklerini hesaplar.
+    
+    Şarkının tamamının düşük enerji eşiği preset indeksinden alınır, böylece
+    aday seçimi tam analizle aynı eşiği kullanır. Pencerenin tempo tahmini
+    indeksteki tempodan oktav kadar saparsa (kısa bağlamda sık görülür)
+    pencere sonucu kullanılmaz.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        start_point_ms: Konuşma bitiş noktası (ms)
+        sr: Sample rate
+        require_reference: True ise indeks kaydı olmayan fon için pencere analizi yapılmaz
+    
+    Returns:
+        Pencere özellikleri; tam analiz gerekiyorsa None
+    """
+    reference = _full_song_reference(fon_path)
+    if reference is None and require_reference:
+        return None
+    
+    target_start = start_point_ms + AnalysisConfig.MIN_HOLD_MS
+    features = compute_window_features(
+        fon_path,
+        target_start - AnalysisConfig.OUTRO_WINDOW_CONTEXT_MS,
+        target_start + AnalysisConfig.OUTRO_WINDOW_LOOKAHEAD_MS,
+        sr,
+        rms_threshold=reference["rms_threshold"] if reference else None
+    )
+    
+    if reference and reference.get("tempo", 0) > 0 and features.tempo > 0:
+        ratio = features.tempo / reference["tempo"]
+        if max(ratio, 1.0 / ratio) > AnalysisConfig.OUTRO_WINDOW_MAX_TEMPO_RATIO:
+            logger.debug(
+                f"Pencere temposu ({features.tempo:.1f}) şarkınınkinden "
+                f"({reference['tempo']:.1f}) sapıyor, tam analiz yapılacak"
+            )
+            return None
+    return features
+
 def find_musical_outro_point(
     fon_path: str,
     start_point_ms: float,
-    sr: int = None
+    sr: int = None,
+    mode: Optional[str] = None
 ) -> float:
     """
     Geliştirilmiş müzikal bitiş noktası tespiti.
@@ -24,81 +233,204 @@ def find_musical_outro_point(
         fon_path: Fon müziği dosya yolu
         start_point_ms: Konuşma bitiş noktası (ms)
         sr: Sample rate (None ise varsayılan kullanılır)
+        mode: Analiz modu (None ise AnalysisConfig.OUTRO_ANALYSIS_MODE)
+            - 'full': Tüm şarkı analiz edilir ve önbelleğe alınır
+            - 'window': Yalnızca hedef çevresindeki pencere decode edilip analiz edilir
+            - 'auto': Önbellek varsa kullanılır; yoksa fon preset indeksindeyse
+              (tam şarkı eşiği ve temposu) pencere analizi yapılır ve tam analiz
+              sonraki spotlar için arka planda başlatılır, değilse tam analiz
+            Pencere sonucunda cümle/ölçü oturtması yapılmaz (ızgara fazı
+            pencereye yereldir); pencere temposu oktav hatası verirse tam
+            analize dönülür.
         
     Returns:
         Önerilen bitiş noktası (ms)
     """
     if sr is None:
         sr = AnalysisConfig.SAMPLE_RATE
+    if mode is None:
+        mode = AnalysisConfig.OUTRO_ANALYSIS_MODE
     
     try:
         logger.debug(f"Müzikal bitiş analizi: {fon_path}, başlangıç: {start_point_ms}ms")
         
-        # Ses dosyasını yükle
-        y, sr = librosa.load(fon_path, sr=sr, mono=True)
-        duration_ms = len(y) / sr * 1000.0
-        
-        # Beat analizi
-        tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
-        beat_times = librosa.frames_to_time(beats, sr=sr) * 1000.0  # ms
-        
-        # Enerji (RMS) analizi
-        frame_length = AnalysisConfig.FRAME_LENGTH
-        hop_length = AnalysisConfig.HOP_LENGTH
-        rms = librosa.feature.rms(
-            y=y,
-            frame_length=frame_length,
-            hop_length=hop_length,
-            center=True
-        )[0]
-        rms_times = librosa.frames_to_time(
-            np.arange(len(rms)),
-            sr=sr,
-            hop_length=hop_length
-        ) * 1000.0
-        
-        # Düşük enerji eşiği: medyanın %70'i
-        thr = float(np.median(rms) * AnalysisConfig.RMS_THRESHOLD_RATIO)
-        low_energy_times = rms_times[rms < thr]
-        
-        # Konuşma bitimi + minimum tutma süresi
-        min_hold_ms = AnalysisConfig.MIN_HOLD_MS
-        target_start = start_point_ms + min_hold_ms
-        
-        # Adaylar: target_start sonrasındaki beat'ler + düşük enerji anları
-        candidates = sorted(set([
-            t for t in np.concatenate((beat_times, low_energy_times))
-            if t > target_start
-        ]))
-        
-        if not candidates:
-            # Aday yoksa: güvenli fallback
-            fallback = min(duration_ms, target_start + AnalysisConfig.FALLBACK_OUTRO_MS)
-            logger.debug(f"Aday bulunamadı, fallback kullanılıyor: {fallback}ms")
-            return fallback
-        
-        first = candidates[0]
-        
-        # 1 ölçü süresi (4 beat) tahmini
-        if len(beat_times) > 4:
-            one_measure = float(np.median(np.diff(beat_times)) * 4.0)
-        else:
-            # Tempo bilgisi yoksa ölçüyü varsayılan değerle
-            one_measure = AnalysisConfig.ONE_MEASURE_FALLBACK_MS
-        
-        outro_point = first + one_measure
-        # Müziğin sonunu aşma
-        outro_point = min(outro_point, duration_ms)
-        
-        # Eğer outro_point, target_start'tan toplamda çok kısa kalıyorsa biraz daha uzat
-        if outro_point - start_point_ms < AnalysisConfig.MIN_TOTAL_OUTRO_MS:
-            outro_point = min(duration_ms, start_point_ms + AnalysisConfig.FALLBACK_OUTRO_MS)
+        features = None
+        snap = None
+        if mode == "window" or (mode == "auto" and not is_fon_features_cached(fon_path, sr)):
+            # Soğuk fon: yalnızca outro arama bölgesini analiz et
+            features = _window_features(fon_path, start_point_ms, sr, require_reference=(mode == "auto"))
+            if features is not None:
+                # Pencere ızgarasının fazı keyfi: cümle/ölçü başına oturtma yapılmaz
+                snap = "none"
+                if mode == "auto":
+                    prefetch_fon_features(fon_path, sr)
+        if features is None:
+            # Beat ve enerji analizi fon başına bir kez yapılır (önbellek)
+            features = get_fon_features(fon_path, sr)
+        outro_point = outro_point_from_features(features, start_point_ms, snap)
         
         logger.debug(f"Müzikal bitiş noktası bulundu: {outro_point}ms")
-        return float(outro_point)
+        return outro_point
         
     except Exception as e:
         logger.warning(f"Müzikal bitiş analizi başarısız: {e}, fallback kullanılıyor")
         # En az 7 sn sonrasına koy
         return float(start_point_ms + AnalysisConfig.FALLBACK_OUTRO_MS)
 
+def find_musical_outro_points(
+    fon_path: str,
+    start_points_ms,
+    sr: int = None,
+    mode: Optional[str] = None
+) -> np.ndarray:
+    """
+    Aynı fonu kullanan birden fazla spot için müzikal bitiş noktalarını bulur.
+    
+    Fon özellikleri bir kez alınır ve tüm bitişler tek vektörel çağrıda
+    hesaplanır. 'auto' modda birden fazla bitiş varsa tam analiz tercih
+    edilir (tek decode tüm spotlara yeter); 'window' modda her bitiş kendi
+    penceresiyle find_musical_outro_point üzerinden hesaplanır.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        start_points_ms: Konuşma bitiş noktaları (ms)
+        sr: Sample rate (None ise varsayılan kullanılır)
+        mode: Analiz modu (None ise AnalysisConfig.OUTRO_ANALYSIS_MODE)
+        
+    Returns:
+        Önerilen bitiş noktaları (ms, float64 dizi)
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    if mode is None:
+        mode = AnalysisConfig.OUTRO_ANALYSIS_MODE
+    
+    starts = np.asarray(start_points_ms, dtype=np.float64).reshape(-1)
+    if len(starts) == 0:
+        return starts
+    if mode == "window" or (mode == "auto" and len(starts) == 1):
+        return np.array(
+            [find_musical_outro_point(fon_path, p, sr, mode) for p in starts],
+            dtype=np.float64
+        )
+    
+    try:
+        logger.debug(f"Müzikal bitiş analizi: {fon_path}, {len(starts)} spot")
+        features = get_fon_features(fon_path, sr)
+        return outro_points_from_features(features, starts)
+    except Exception as e:
+        logger.warning(f"Müzikal bitiş analizi başarısız: {e}, fallback kullanılıyor")
+        return starts + AnalysisConfig.FALLBACK_OUTRO_MS
+
+# Ardışık spotların başlangıçlarını adaylara eşit yaymak için altın oran adımı
+_GOLDEN_STEP = (np.sqrt(5.0) - 1.0) / 2.0
+
+def fon_start_candidates(features: FonFeatures, window_ms: float) -> np.ndarray:
+    """
+    Fonun başlatılabileceği ölçü başlarını (downbeat) döndürür.
+    
+    Her downbeat'ten sonraki window_ms boyunca ortalama RMS, RMS prefix
+    toplamlarıyla vektörel hesaplanır; ortalaması fonun medyan enerjisinin
+    FON_START_MIN_ENERGY_RATIO katından düşük (zayıf giriş) adaylar elenir.
+    
+    Args:
+        features: Fon müziği özellikleri
+        window_ms: Enerjisi kontrol edilen pencere (ms, genelde intro süresi)
+    
+    Returns:
+        Sıralı aday başlangıçlar (ms); dosya başı (0 ms) da aday olarak değerlendirilir
+    """
+    rms = features.rms.astype(np.float64)
+    downbeats = features.downbeat_times
+    if len(rms) == 0 or len(downbeats) == 0:
+        return np.zeros(1)
+    
+    frame_ms = float(features.rms_times[1] - features.rms_times[0]) if len(rms) > 1 else 1.0
+    prefix = np.concatenate(([0.0], np.cumsum(rms)))
+    
+    starts = np.concatenate(([0.0], downbeats))
+    first = np.clip(np.rint((starts - features.rms_times[0]) / frame_ms).astype(np.int64), 0, len(rms) - 1)
+    last = np.clip(first + max(1, int(round(window_ms / frame_ms))), 1, len(rms))
+    window_energy = (prefix[last] - prefix[first]) / np.maximum(last - first, 1)
+    
+    strong = window_energy >= np.median(rms) * AnalysisConfig.FON_START_MIN_ENERGY_RATIO
+    return np.unique(starts[strong])
+
+def pick_fon_start(
+    candidates: np.ndarray,
+    duration_ms: float,
+    required_ms: float,
+    spot_number: int
+) -> float:
+    """
+    Spot için aday başlangıçlardan birini seçer (sabit zamanlı).
+    
+    Sonrasında required_ms kalan adaylar sıralı dizinin bir önekidir; spot
+    numarası altın oran adımıyla bu öneke yayılır, böylece aynı fonu
+    kullanan spotlar farklı yerlerden başlar. İlk spot (0) ilk adayı alır.
+    
+    Args:
+        candidates: fon_start_candidates çıktısı (sıralı, ms)
+        duration_ms: Fon süresi (ms)
+        required_ms: Başlangıçtan sonra gereken fon uzunluğu (ms)
+        spot_number: 0 tabanlı spot numarası
+    
+    Returns:
+        Başlangıç noktası (ms); uygun aday yoksa 0
+    """
+    count = int(np.searchsorted(candidates, duration_ms - required_ms, side="right"))
+    if count == 0:
+        return 0.0
+    return float(candidates[int((spot_number * _GOLDEN_STEP) % 1.0 * count)])
+
+def select_fon_start_offsets(
+    fon_path: str,
+    required_ms,
+    intro_ms: float,
+    first_spot_number: Union[int, Sequence[int]] = 0,
+    sr: int = None
+) -> np.ndarray:
+    """
+    Aynı fonu kullanan spotlar için fon başlangıç noktalarını seçer.
+    
+    Fon özellikleri önbellekte yoksa ve tek spot varsa analiz beklenmez:
+    başlangıç 0 kalır ve tam analiz sonraki montajlar için arka planda
+    başlatılır. AnalysisConfig.FON_START_SELECTION "zero" ise hep 0 döner.
+    
+    Args:
+        fon_path: Fon müziği dosya yolu
+        required_ms: Spot başına başlangıçtan sonra gereken fon uzunluğu (ms)
+        intro_ms: Intro süresi (ms), enerji penceresi olarak kullanılır
+        first_spot_number: İlk spotun 0 tabanlı numarası (dosya numarasıyla aynı sıra)
+            veya spot başına numaralar (spotlar ardışık değilse)
+        sr: Sample rate (None ise varsayılan kullanılır)
+    
+    Returns:
+        Spot başına başlangıç noktaları (ms, float64 dizi)
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    required = np.asarray(required_ms, dtype=np.float64).reshape(-1)
+    offsets = np.zeros(len(required))
+    spot_numbers = np.asarray(first_spot_number, dtype=np.int64).reshape(-1)
+    if len(spot_numbers) == 1:
+        spot_numbers = spot_numbers[0] + np.arange(len(required))
+    if AnalysisConfig.FON_START_SELECTION == "zero" or len(required) == 0:
+        return offsets
+    
+    try:
+        if len(required) == 1 and not is_fon_features_cached(fon_path, sr):
+            prefetch_fon_features(fon_path, sr)
+            return offsets
+        
+        features = get_fon_features(fon_path, sr)
+        candidates = fon_start_candidates(features, intro_ms)
+        for i, needed in enumerate(required):
+            offsets[i] = pick_fon_start(candidates, features.duration_ms, needed, int(spot_numbers[i]))
+        logger.debug(f"Fon başlangıç noktaları: {np.round(offsets).astype(int).tolist()}")
+    except Exception as e:
+        logger.warning(f"Fon başlangıç noktası seçilemedi, baştan başlanacak: {e}")
+        offsets[:] = 0.0
+    
+    return offsets
@@ -0,0 +1,404 @@
+"""Preset kütüphanesi indeksi - arka planda fon özelliklerini önceden hesaplar"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .beat import power_spectrogram
+from .features import get_fon_features
+from .classifier import compute_preset_descriptors, classify_presets
+from .tonality import estimate_key
+from ..constants import AnalysisConfig, PRESET_CATEGORIES, ENDING_CATEGORIES
+from ..utils.file_utils import get_resource_path, get_app_data_dir
+
+logger = logging.getLogger(__name__)
+
+# İndeks formatı değiştiğinde artırılır
+PRESET_INDEX_VERSION = 5
+
+PRESET_AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".aac", ".ogg")
+
+def iter_preset_files(categories: Optional[Dict[str, str]] = None) -> List[Tuple[str, str]]:
+    """
+    Kategori klasörlerindeki ses dosyalarını listeler.
+    
+    Args:
+        categories: Kategori adı -> göreli klasör sözlüğü
+            (None ise PRESET_CATEGORIES ve ENDING_CATEGORIES)
+    
+    Returns:
+        (kategori adı, dosya yolu) tuple'larının listesi
+    """
+    if categories is None:
+        categories = {**PRESET_CATEGORIES, **ENDING_CATEGORIES}
+    
+    files = []
+    for category, relative_path in categories.items():
+        folder = os.path.normpath(get_resource_path(relative_path))
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            path = os.path.join(folder, name)
+            if os.path.isfile(path) and name.lower().endswith(PRESET_AUDIO_EXTENSIONS):
+                files.append((category, path))
+    return files
+
+class PresetIndex:
+    """
+    Preset dosyalarının özet bilgilerini tutan tek dosyalık indeks.
+    
+    Her kayıt dosya boyutu ve değişiklik zamanı ile saklanır; dosya
+    değişince kayıt geçersiz sayılır. Beat grid ve RMS zarfı gibi büyük
+    diziler features modülünün .npz önbelleğinde (sidecar) durur.
+    """
+    
+    def __init__(self, index_file: Optional[str] = None):
+        """
+        PresetIndex başlatır.
+        
+        Args:
+            index_file: İndeks dosyası yolu (None ise uygulama veri klasörü)
+        """
+        if index_file is None:
+            index_file = os.path.join(get_app_data_dir("cache"), "preset_index.json")
+        
+        self.index_file = index_file
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        # Kayıtlar her değiştiğinde artar (türetilmiş önbellekler için)
+        self.revision = 0
+        self.load()
+    
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+    
+    @staticmethod
+    def _stat_signature(path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def load(self) -> None:
+        """İndeksi dosyadan yükler (yoksa veya sürüm farklıysa boş başlar)"""
+        with self._lock:
+            self._entries = {}
+            try:
+                if os.path.exists(self.index_file):
+                    with open(self.index_file, "r", encoding="utf-8") as f:
+                        content = json.load(f)
+                    if content.get("version") == PRESET_INDEX_VERSION:
+                        self._entries = content.get("entries", {})
+            except Exception as e:
+                logger.warning(f"Preset indeksi okunamadı, yeniden oluşturulacak: {e}")
+            self.revision += 1
+    
+    def save(self) -> bool:
+        """
+        İndeksi dosyaya atomik olarak yazar.
+        
+        Returns:
+            Başarılı ise True
+        """
+        with self._lock:
+            content = {"version": PRESET_INDEX_VERSION, "entries": self._entries}
+            tmp_file = self.index_file + ".tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(content, f, ensure_ascii=False)
+                os.replace(tmp_file, self.index_file)
+                return True
+            except Exception as e:
+                logger.warning(f"Preset indeksi kaydedilemedi: {e}")
+                return False
+    
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Dosyanın güncel indeks kaydını döndürür.
+        
+        Args:
+            path: Preset dosya yolu
+        
+        Returns:
+            Kayıt sözlüğü; kayıt yoksa veya dosya değişmişse None
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+        if entry is None:
+            return None
+        try:
+            if tuple(entry["signature"]) != self._stat_signature(path):
+                return None
+        except OSError:
+            return None
+        return entry
+    
+    def entries(self) -> List[Dict[str, Any]]:
+        """Tüm kayıtların listesi"""
+        with self._lock:
+            return list(self._entries.values())
+    
+    def is_current(self, path: str) -> bool:
+        """Dosyanın güncel kaydı varsa True"""
+        return self.get(path) is not None
+    
+    def update(self, path: str, category: str) -> Dict[str, Any]:
+        """
+        Dosyayı analiz eder ve kaydını günceller.
+        
+        Dosya bir kez decode edilir ve güç spektrumu bir kez hesaplanır; fon
+        özellikleri (önbellekte yoksa) ve sınıflandırma özellikleri aynı
+        sinyal ve spektrumdan çıkarılır. Beat grid ve RMS zarfı
+        get_fon_features ile .npz sidecar'a yazılır; indekse tempo, düşük
+        enerji eşiği (pencereli outro analizi için), süre, ses yüksekliği,
+        spektral merkez, dinamik aralık, MFCC ve chroma ortalamaları ile
+        chroma'dan tahmin edilen ton girer. Sanal kategoriler classify() ile
+        atanır.
+        
+        Args:
+            path: Preset dosya yolu
+            category: Dosyanın bulunduğu kategori
+        
+        Returns:
+            Yeni kayıt sözlüğü
+        """
+        import librosa
+        
+        y, sr = librosa.load(path, sr=AnalysisConfig.SAMPLE_RATE, mono=True)
+        power = power_spectrogram(y)
+        features = get_fon_features(path, sr, signal=y, power=power)
+        descriptors = compute_preset_descriptors(y, sr, features, power)
+        key = estimate_key(descriptors["chroma_mean"])
+        
+        entry = {
+            "path": os.path.abspath(path),
+            "name": os.path.basename(path),
+            "category": category,
+            "signature": list(self._stat_signature(path)),
+            "duration_ms": features.duration_ms,
+            "tempo": features.tempo,
+            "beat_count": int(len(features.beat_times)),
+            "rms_threshold": features.rms_threshold,
+            "loudness_db": descriptors["loudness_db"],
+            "centroid_hz": descriptors["centroid_hz"],
+            "dynamic_range_db": descriptors["dynamic_range_db"],
+            "mfcc_mean": descriptors["mfcc_mean"],
+            "chroma_mean": descriptors["chroma_mean"],
+            "key_tonic": key.tonic,
+            "key_mode": key.mode,
+            "key_confidence": key.confidence,
+        }
+        with self._lock:
+            self._entries[self._key(path)] = entry
+            self.revision += 1
+        return entry
+    
+    def needs_classification(self) -> bool:
+        """Sanal kategorisi atanmamış fon kaydı varsa True"""
+        with self._lock:
+            return any(
+                "auto_categories" not in e for e in self._entries.values()
+                if e.get("category") not in ENDING_CATEGORIES
+            )
+    
+    def classify(self) -> int:
+        """
+        Tüm fon kayıtlarını sanal kategorilere (Enerjik, Orta Ritimli, ...) atar.
+        
+        Sınıflandırma kütüphaneye görelidir; bu yüzden her seferinde tüm
+        kayıtlar birlikte değerlendirilir. Bitiş sesleri sınıflandırılmaz.
+        
+        Returns:
+            Sınıflandırılan kayıt sayısı
+        """
+        with self._lock:
+            entries = [
+                e for e in self._entries.values()
+                if e.get("category") not in ENDING_CATEGORIES and "centroid_hz" in e
+            ]
+            for entry, categories in zip(entries, classify_presets(entries)):
+                entry["auto_categories"] = categories
+            self.revision += 1
+        return len(entries)
+    
+    def paths_in_category(self, category: str) -> List[str]:
+        """
+        Sanal olarak kategoriye atanmış, hâlâ var olan dosyaları listeler.
+        
+        Args:
+            category: Kategori adı (örn. "Enerjik")
+        
+        Returns:
+            Dosya yolları (ada göre sıralı)
+        """
+        with self._lock:
+            paths = [
+                e["path"] for e in self._entries.values()
+                if category in e.get("auto_categories", ())
+            ]
+        return sorted((p for p in paths if os.path.isfile(p)), key=lambda p: os.path.basename(p).lower())
+    
+    def prune(self, existing_paths: List[str]) -> int:
+        """
+        Artık var olmayan dosyaların kayıtlarını siler.
+        
+        Args:
+            existing_paths: Mevcut preset dosyaları
+        
+        Returns:
+            Silinen kayıt sayısı
+        """
+        keep = {self._key(p) for p in existing_paths}
+        with self._lock:
+            stale = [k for k in self._entries if k not in keep]
+            for k in stale:
+                del self._entries[k]
+            if stale:
+                self.revision += 1
+        return len(stale)
+
+_preset_index: Optional[PresetIndex] = None
+_preset_index_lock = threading.Lock()
+
+def get_preset_index() -> PresetIndex:
+    """Paylaşılan PresetIndex örneğini döndürür"""
+    global _preset_index
+    with _preset_index_lock:
+        if _preset_index is None:
+            _preset_index = PresetIndex()
+        return _preset_index
+
+class PresetIndexer(threading.Thread):
+    """
+    Preset kütüphanesini arka planda indeksleyen thread.
+    
+    Güncel olmayan dosyaları tek tek analiz eder. İndeks her save_every
+    dosyada veya save_interval saniyede bir ve sonda bir kez kaydedilir
+    (her dosyada tüm JSON'u yeniden yazmak büyük kütüphanelerde karesel
+    G/Ç olur). Montaj sırasında pause() ile durdurulup resume() ile devam
+    ettirilebilir.
+    """
+    
+    def __init__(
+        self,
+        index: Optional[PresetIndex] = None,
+        categories: Optional[Dict[str, str]] = None,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        idle_delay: float = 0.2,
+        save_every: int = 25,
+        save_interval: float = 10.0
+    ):
+        """
+        PresetIndexer oluşturur.
+        
+        Args:
+            index: Kullanılacak indeks (None ise paylaşılan indeks)
+            categories: Taranacak kategoriler (None ise tüm preset ve bitiş kategorileri)
+            on_progress: İlerleme callback'i (tamamlanan, toplam, dosya yolu)
+            idle_delay: Dosyalar arası bekleme (s), arayüzü rahatlatmak için
+            save_every: Ara kayıt için dosya sayısı
+            save_interval: Ara kayıt için en uzun süre (s)
+        """
+        super().__init__(name="PresetIndexer", daemon=True)
+        self.index = index
+        self.categories = categories
+        self.on_progress = on_progress
+        self.idle_delay = idle_delay
+        self.save_every = max(1, int(save_every))
+        self.save_interval = save_interval
+        self._running = threading.Event()
+        self._running.set()
+        self._stopped = threading.Event()
+    
+    def pause(self) -> None:
+        """İndekslemeyi duraklatır (mevcut dosya bittikten sonra)"""
+        self._running.clear()
+    
+    def resume(self) -> None:
+        """Duraklatılmış indekslemeyi sürdürür"""
+        self._running.set()
+    
+    def stop(self) -> None:
+        """İndekslemeyi sonlandırır"""
+        self._stopped.set()
+        self._running.set()
+    
+    def run(self) -> None:
+        """Thread ana döngüsü"""
+        try:
+            index = self.index or get_preset_index()
+            files = iter_preset_files(self.categories)
+            pending = [(c, p) for c, p in files if not index.is_current(p)]
+            if index.prune([p for _, p in files]):
+                index.save()
+            
+            if not pending:
+                if index.needs_classification():
+                    index.classify()
+                    index.save()
+                logger.debug("Preset indeksi güncel")
+                return
+            
+            logger.info(f"Preset indeksleme başladı: {len(pending)} dosya")
+            started = time.perf_counter()
+            last_save = started
+            unsaved = 0
+            for done, (category, path) in enumerate(pending, 1):
+                self._running.wait()
+                if self._stopped.is_set():
+                    break
+                try:
+                    index.update(path, category)
+                    unsaved += 1
+                except Exception as e:
+                    logger.warning(f"Preset indekslenemedi ({path}): {e}")
+                # Ara kayıt: uygulama kapanırsa yapılan iş kaybolmasın
+                now = time.perf_counter()
+                if unsaved and (unsaved >= self.save_every or now - last_save >= self.save_interval):
+                    index.save()
+                    last_save = now
+                    unsaved = 0
+                if self.on_progress:
+                    self.on_progress(done, len(pending), path)
+                time.sleep(self.idle_delay)
+            
+            # Sınıflandırma kütüphaneye göreli olduğundan analizler bitince toplu yapılır
+            logger.info(f"Preset sınıflandırması: {index.classify()} fon")
+            index.save()
+            logger.info(f"Preset indeksleme tamamlandı ({time.perf_counter() - started:.1f}s)")
+        except Exception as e:
+            logger.error(f"Preset indeksleme hatası: {e}", exc_info=True)
+
+def start_background_indexing(
+    on_progress: Optional[Callable[[int, int, str], None]] = None
+) -> PresetIndexer:
+    """
+    Preset indekslemeyi arka planda başlatır.
+    
+    Args:
+        on_progress: İlerleme callback'i (tamamlanan, toplam, dosya yolu)
+    
+    Returns:
+        Çalışan PresetIndexer thread'i
+    """
+    indexer = PresetIndexer(on_progress=on_progress)
+    indexer.start()
+    return indexer
+
+def build_preset_index() -> int:
+    """
+    Tüm preset kütüphanesini ön planda indeksler (kurulum sırasında kullanım için).
+    
+    Returns:
+        İndekslenen dosya sayısı
+    """
+    indexer = PresetIndexer(idle_delay=0.0)
+    indexer.run()
+    return len(get_preset_index().entries())
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    count = build_preset_index()
+    print(f"Preset indeksi hazır: {count} dosya")
@@ -1,17 +1,26 @@
 """Ana ses montaj işlemcisi"""
 
 import os
-import math
 import logging
-from typing import List, Tuple, Optional, Callable, Dict
+from typing import List, Tuple, Optional, Callable, Dict, Sequence
+import numpy as np
 from pydub import AudioSegment
-from pydub.effects import compress_dynamic_range, normalize
 
 from .analyzer import analyze_audio_segments
-from .effects import normalize_audio_in_memory, apply_eased_gain_ramp
-from .mixer import find_musical_outro_point
+from .automation import fon_automation_lane
+from .effects import normalize_audio_in_memory
+from .ducking import sidechain_gain_db
+from .envelope import apply_gain_envelope, curve_cache_stats, db_to_amplitude
+from .dynamics import compress_dynamic_range, master_limit
+from .fades import append_with_crossfade
+from .loudness import master_loudness
+from .features import LoopPoints, get_loop_points
+from .looping import loop_source
+from .mixer import find_musical_outro_points, select_fon_start_offsets
+from .resample import resample_segment
+from .segments import SegmentIndex
 from ..constants import (
-    AudioConfig, AudioLevels, CompressorConfig, AnalysisConfig
+    AudioConfig, AudioLevels, CompressorConfig, AnalysisConfig, DuckingConfig, LoudnessConfig, ResampleConfig
 )
 
 logger = logging.getLogger(__name__)
@@ -33,7 +42,8 @@ def ses_montaj(
     outro_rise_duration: Optional[int] = None,
     outro_fall_duration: Optional[int] = None,
     spot_index_offset: int = 0,
-    ending_path: Optional[str] = None
+    ending_path: Optional[str] = None,
+    spot_numbers: Optional[Sequence[int]] = None
 ) -> List[str]:
     """
     Ana ses montaj fonksiyonu.
@@ -58,6 +68,9 @@ def ses_montaj(
         outro_fall_duration: Outro düşüş süresi (ms, opsiyonel)
         spot_index_offset: Spot index offset (dosya isimlendirme için, varsayılan: 0)
         ending_path: Bitiş sesi dosya yolu (opsiyonel, seçilirse ham ses bitimiyle fon bitimi aynı ana getirilir ve bitiş eklenir)
+        spot_numbers: merged_ranges ile aynı sırada, spot başına 0 tabanlı numaralar
+            (ardışık olmayan spotlar tek çağrıda işlenirken; verilirse spot_index_offset yerine
+            dosya adı ve fon başlangıcı seçimi için kullanılır)
         
     Returns:
         Oluşturulan dosya yollarının listesi
@@ -67,6 +80,7 @@ def ses_montaj(
     """
     try:
         logger.info(f"Montaj başlatılıyor: {ham_path}")
+        curve_stats_start = curve_cache_stats()
         
         # Gelişmiş ayarları kullan veya parametreleri kontrol et
         if advanced_settings:
@@ -78,6 +92,8 @@ def ses_montaj(
             mid_fon_db_val = float(advanced_settings.get("mid_fon_db", AudioLevels.MID_FON_DB))
             voice_db_val = float(advanced_settings.get("voice_db", AudioLevels.VOICE_DB))
             max_gap_ms_val = int(advanced_settings.get("max_gap_ms", AnalysisConfig.MAX_GAP_MS))
+            min_spot_ms_val = int(advanced_settings.get("min_spot_ms", AnalysisConfig.MIN_SPOT_DURATION_MS))
+            max_spot_ms_val = int(advanced_settings.get("max_spot_ms", AnalysisConfig.MAX_SPOT_DURATION_MS))
         else:
             # Parametrelerden al veya varsayılanları kullan
             intro_duration_val = int(intro_duration) if intro_duration is not None else AudioConfig.INTRO_DURATION_MS
@@ -88,6 +104,8 @@ def ses_montaj(
             mid_fon_db_val = float(mid_fon_db) if mid_fon_db is not None else AudioLevels.MID_FON_DB
             voice_db_val = float(voice_db) if voice_db is not None else AudioLevels.VOICE_DB
             max_gap_ms_val = AnalysisConfig.MAX_GAP_MS
+            min_spot_ms_val = AnalysisConfig.MIN_SPOT_DURATION_MS
+            max_spot_ms_val = AnalysisConfig.MAX_SPOT_DURATION_MS
         
         # Yerel değişkenlere atama (kodun geri kalanında kullanım için)
         intro_duration = intro_duration_val
@@ -98,7 +116,22 @@ def ses_montaj(
         mid_fon_db = mid_fon_db_val
         voice_db = voice_db_val
         silence_gap_ms = AudioConfig.SILENCE_GAP_MS
-        peak_headroom_db = AudioLevels.PEAK_HEADROOM_DB
+        
+        # Sidechain ducking (gelişmiş ayarlarda yoksa DuckingConfig varsayılanları)
+        ducking_settings = advanced_settings or {}
+        ducking_enabled = bool(ducking_settings.get("ducking_enabled", DuckingConfig.ENABLED))
+        ducking_threshold_db = float(ducking_settings.get("ducking_threshold_db", DuckingConfig.THRESHOLD_DB))
+        ducking_attack_ms = float(ducking_settings.get("ducking_attack_ms", DuckingConfig.ATTACK_MS))
+        ducking_release_ms = float(ducking_settings.get("ducking_release_ms", DuckingConfig.RELEASE_MS))
+        
+        # Mastering modu: tepe limiter (varsayılan) veya LUFS hedefi
+        loudness_mastering = bool(ducking_settings.get("loudness_mastering", LoudnessConfig.ENABLED))
+        target_lufs = float(ducking_settings.get("target_lufs", LoudnessConfig.TARGET_LUFS))
+        
+        # Frame rate dönüşümü: varsayılan set_frame_rate, kademe verilirse polifaz FIR
+        resample_quality = ducking_settings.get("resample_quality", ResampleConfig.QUALITY)
+        if resample_quality not in ResampleConfig.QUALITY_TIERS:
+            resample_quality = None
         
         # Ses dosyalarını yükle
         logger.debug("Ses dosyaları yükleniyor...")
@@ -108,19 +141,8 @@ def ses_montaj(
         if fon_raw is None:
             raise ValueError("Fon müziği dosyası belirtilmedi")
         
-        # Frame rate uyumluluğu - önemli!
-        # Tüm sesler aynı frame rate'de olmalı (senkronizasyon için)
-        target_frame_rate = 44100  # Profesyonel kalite
-        
-        if ham_raw.frame_rate != target_frame_rate:
-            logger.debug(f"Ham ses frame rate dönüştürülüyor: {ham_raw.frame_rate} -> {target_frame_rate}")
-            ham_raw = ham_raw.set_frame_rate(target_frame_rate)
-        
-        if fon_raw.frame_rate != target_frame_rate:
-            logger.debug(f"Fon müziği frame rate dönüştürülüyor: {fon_raw.frame_rate} -> {target_frame_rate}")
-            fon_raw = fon_raw.set_frame_rate(target_frame_rate)
-        
         # Channels uyumluluğu (mono'ya çevir, daha stabil)
+        # Önce mono: frame rate dönüşümü tek kanal üzerinde yapılsın
         if ham_raw.channels != 1:
             logger.debug(f"Ham ses mono'ya dönüştürülüyor: {ham_raw.channels} kanal")
             ham_raw = ham_raw.set_channels(1)
@@ -129,6 +151,19 @@ def ses_montaj(
             logger.debug(f"Fon müziği mono'ya dönüştürülüyor: {fon_raw.channels} kanal")
             fon_raw = fon_raw.set_channels(1)
         
+        # Frame rate uyumluluğu - önemli!
+        # Tüm sesler aynı frame rate'de olmalı (senkronizasyon için)
+        # resample_quality verilmişse polifaz FIR (resample.py), yoksa set_frame_rate
+        target_frame_rate = ResampleConfig.TARGET_FRAME_RATE
+        
+        if ham_raw.frame_rate != target_frame_rate:
+            logger.debug(f"Ham ses frame rate dönüştürülüyor: {ham_raw.frame_rate} -> {target_frame_rate}")
+            ham_raw = resample_segment(ham_raw, target_frame_rate, resample_quality)
+        
+        if fon_raw.frame_rate != target_frame_rate:
+            logger.debug(f"Fon müziği frame rate dönüştürülüyor: {fon_raw.frame_rate} -> {target_frame_rate}")
+            fon_raw = resample_segment(fon_raw, target_frame_rate, resample_quality)
+        
         # Normalize et (sadece gerektiğinde - hız optimizasyonu)
         # Ham ses için normalize kontrolü
         if ham_raw.max_dBFS < -0.5:  # Eğer çok düşükse normalize et
@@ -146,22 +181,31 @@ def ses_montaj(
         if ham.frame_rate != fon.frame_rate:
             logger.warning(f"Frame rate uyumsuzluğu: ham={ham.frame_rate}, fon={fon.frame_rate}")
             # Fon'u ham'in frame rate'ine uyarla
-            fon = fon.set_frame_rate(ham.frame_rate)
+            fon = resample_segment(fon, ham.frame_rate, resample_quality)
         
         # Segment analizi
         if not merged_ranges:
             logger.debug("Ses analizi yapılıyor...")
-            merged_ranges = analyze_audio_segments(ham_path, max_gap_ms=max_gap_ms_val)
+            merged_ranges = analyze_audio_segments(
+                ham_path,
+                max_gap_ms=max_gap_ms_val,
+                min_spot_ms=min_spot_ms_val,
+                max_spot_ms=max_spot_ms_val
+            )
         
         if not merged_ranges:
             raise ValueError("Analiz sonucu konuşma bölümü bulunamadı")
         
         # Minimum uzunluk filtresi
         min_length = AnalysisConfig.MIN_SEGMENT_LENGTH_MS
-        valid_segments = [
-            seg for seg in merged_ranges
-            if (seg[1] - seg[0]) >= min_length
-        ]
+        index = SegmentIndex.from_ranges(merged_ranges)
+        valid_segments = index.valid(min_length).to_ranges()
+        if spot_numbers is None:
+            spot_numbers = spot_index_offset + np.arange(len(valid_segments))
+        else:
+            # from_ranges başlangıca göre kararlı sıralar; numaralar aynı sırayı ve filtreyi izler
+            order = np.argsort([start for start, _ in merged_ranges], kind="stable")
+            spot_numbers = np.asarray(spot_numbers, dtype=np.int64)[order][index.valid_mask(min_length)]
         
         if not valid_segments:
             raise ValueError(f"Geçerli uzunlukta spot bulunamadı (minimum {min_length}ms)")
@@ -170,6 +214,22 @@ def ses_montaj(
         total_segments = len(valid_segments)
         logger.info(f"{total_segments} spot işlenecek")
         
+        # Fon başlangıç noktaları: aynı fonu kullanan spotlar farklı, enerjili bir ölçü başından başlar
+        ham_len = len(ham)
+        base_lens = np.array(
+            [intro_duration + min(end, ham_len) - min(start, ham_len) for start, end in valid_segments],
+            dtype=np.float64
+        )
+        required_lens = base_lens if ending_path else base_lens + AnalysisConfig.FALLBACK_OUTRO_MS + outro_fall_duration
+        fon_offsets = select_fon_start_offsets(fon_path, required_lens, intro_duration, spot_numbers)
+        
+        # Müzikal bitiş noktaları: tüm spotlar için tek seferde (aynı fon, spot zamanına göre)
+        if not ending_path:
+            outro_targets = find_musical_outro_points(fon_path, fon_offsets + base_lens) - fon_offsets
+        
+        # Döngü noktaları yalnızca fon yetmediğinde, ilk ihtiyaçta hesaplanır
+        loop_points = None
+        
         # Her segment için montaj
         for idx, (start, end) in enumerate(valid_segments, 1):
             if is_cancelled():
@@ -184,7 +244,6 @@ def ses_montaj(
             
             # Ham ses segmenti
             ham_segment = ham[start:end]
-            base_len = intro_duration + len(ham_segment)
             
             # Müzikal bitiş noktası
             if ending_path:
@@ -193,51 +252,58 @@ def ses_montaj(
                 total_needed = outro_target_ms
             else:
                 # Bitiş seçilmemişse: Normal müzikal bitiş
-                outro_target_ms = find_musical_outro_point(fon_path, base_len)
+                outro_target_ms = outro_targets[idx - 1]
                 total_needed = int(outro_target_ms) + outro_fall_duration
             
-            # Fon müziğini uzat (gerekirse)
+            # Fon müziğini uzat (gerekirse): döngü noktalarından sanal olarak, kopyalamadan
+            # (minimum outro body uzatması için de pay bırakılır)
+            fon_offset = int(fon_offsets[idx - 1])
+            total_needed += fon_offset
             if len(fon) < total_needed:
-                repeat_count = math.ceil(total_needed / len(fon))
-                fon_extended = fon * repeat_count
+                if loop_points is None:
+                    try:
+                        loop_points = get_loop_points(fon_path)
+                    except Exception as e:
+                        logger.warning(f"Döngü noktaları bulunamadı, fonun tamamı döngülenecek: {e}")
+                        # Ek yeri LOOP_CROSSFADE_MS ile fonun başına crossfade edilir (LoopedSource)
+                        loop_points = LoopPoints(0.0, float(len(fon)), 0.0)
+                fon_extended = loop_source(
+                    fon,
+                    total_needed + AudioConfig.MIN_OUTRO_BODY_MS,
+                    loop_points.start_ms,
+                    loop_points.end_ms
+                )
             else:
                 fon_extended = fon
             
-            # === INTRO ===
-            # Ham ses seviyesi (VOICE_DB) → %35 seviyesi giriş fade-out (ease_out: hızlı başlar, yavaşlar)
-            raw_intro = fon_extended[:intro_duration]
-            intro_fon = apply_eased_gain_ramp(
-                raw_intro,
-                start_fon_db,  # Ham ses seviyesi ile aynı (VOICE_DB = -3.0 dB)
-                ducked_fon_db,  # %35 seviyesi (-10.2 dB)
-                curve="ease_out"
-            )
-            
-            # === BODY ===
-            # Ham ses boyunca sabit %35 seviyesi
-            body_fon = fon_extended[
-                intro_duration:intro_duration + len(ham_segment)
-            ].apply_gain(ducked_fon_db)
+            # Seçilen başlangıç noktasından itibaren kullan
+            if fon_offset > 0:
+                fon_extended = fon_extended[fon_offset:]
+                logger.debug(f"Fon {fon_offset}ms noktasından başlatılıyor")
             
-            # === OUTRO ===
+            # === FON OTOMASYONU ===
+            # Intro (giriş seviyesi → %35, ease_out), gövde (ham ses boyunca %35) ve
+            # outro düşüşü (%35 → %0, ease_in) tek bir otomasyon şeridi olarak tanımlanır;
+            # fona ayrı parçalar halinde değil, tek kazanç dizisiyle (tek çarpım) uygulanır
             outro_start = intro_duration + len(ham_segment)
             
             if ending_path:
                 # Bitiş seçilmişse: Ham ses bitimiyle fon ses bitimini aynı ana getir
                 # Fon sesini ham ses bitiminde kes (fade-out yok)
-                outro_down = AudioSegment.silent(duration=0, frame_rate=fon.frame_rate)
+                fon_lane = fon_automation_lane(intro_duration, len(ham_segment), start_fon_db, ducked_fon_db)
+                background_end = outro_start
                 
                 # Bitiş dosyasını yükle ve hazırla
                 ending_raw = AudioSegment.from_file(ending_path)
                 
-                # Frame rate uyumluluğu (target_frame_rate fonksiyon başında tanımlı)
-                if ending_raw.frame_rate != target_frame_rate:
-                    ending_raw = ending_raw.set_frame_rate(target_frame_rate)
-                
-                # Channels uyumluluğu
+                # Channels uyumluluğu (önce mono, dönüşüm tek kanalda)
                 if ending_raw.channels != 1:
                     ending_raw = ending_raw.set_channels(1)
                 
+                # Frame rate uyumluluğu (target_frame_rate fonksiyon başında tanımlı)
+                if ending_raw.frame_rate != target_frame_rate:
+                    ending_raw = resample_segment(ending_raw, target_frame_rate, resample_quality)
+                
                 # Normalize et
                 ending_segment = normalize_audio_in_memory(ending_raw)
                 
@@ -254,78 +320,56 @@ def ses_montaj(
                     outro_total_end = outro_start + AudioConfig.MIN_OUTRO_BODY_MS
                 
                 # Fade-out direkt ham ses bitiminden başlamalı (geriye dönme yok)
-                # outro_start'ten başla, outro_total_end'e kadar fade-out yap
-                actual_fade_start = outro_start  # Ham ses bitimi = fade-out başlangıcı
-                
-                # Fade-out için yeterli ses var mı kontrol et
-                available_audio = len(fon_extended) - actual_fade_start
-                # Fade-out süresi: outro_total_end'e kadar veya mevcut ses kadar
-                fade_out_end = min(outro_total_end, len(fon_extended))
-                actual_fall_duration = fade_out_end - actual_fade_start
-                
-                if actual_fall_duration > 100:  # Minimum 100ms fade-out
-                    raw_outro_fall = fon_extended[
-                        actual_fade_start:fade_out_end
-                    ]
-                    
-                    # %35 (ducked_fon_db) → %0 (sessizlik), yumuşak bitiş (ease_in)
-                    # Ham ses bitimindeki seviyeden direkt fade-out
-                    outro_down = apply_eased_gain_ramp(
-                        raw_outro_fall,
-                        ducked_fon_db,  # %35 seviyesi (ham ses boyunca olan seviye)
-                        AudioLevels.SILENCE_DB,  # %0 seviyesi
-                        curve="ease_in"
-                    )
-                else:
-                    # Yeterli ses yoksa, mevcut sesi fade-out yap
-                    if available_audio > 0:
-                        raw_outro_fall = fon_extended[actual_fade_start:]
-                        # %35'den başlayarak fade-out uygula
-                        outro_down = apply_eased_gain_ramp(
-                            raw_outro_fall,
-                            ducked_fon_db,  # %35 seviyesi
-                            AudioLevels.SILENCE_DB,  # %0 seviyesi
-                            curve="ease_in"
-                        )
-                    else:
-                        # Hiç ses yoksa sessizlik ekle
-                        outro_down = AudioSegment.silent(
-                            duration=outro_fall_duration,
-                            frame_rate=fon.frame_rate
-                        )
+                # Süre: outro_total_end'e kadar veya mevcut ses kadar
+                background_end = min(outro_total_end, len(fon_extended))
+                fon_lane = fon_automation_lane(
+                    intro_duration,
+                    len(ham_segment),
+                    start_fon_db,
+                    ducked_fon_db,
+                    fall_ms=max(background_end - outro_start, 0)
+                )
                 
                 ending_segment = None
             
-            # === KOMPOZİSYON ===
-            # Tüm segmentlerin frame rate'ini uyumlu hale getir (optimize edilmiş)
-            target_frame_rate = intro_fon.frame_rate
+            logger.debug(f"Fon otomasyonu: {fon_lane!r}")
+            fon_bed = fon_extended[:background_end]
+            fon_gains = fon_lane.compile(int(fon_bed.frame_count()), fon_bed.frame_rate)
             
-            # Frame rate dönüşümlerini sadece gerektiğinde yap (hız optimizasyonu)
-            if body_fon.frame_rate != target_frame_rate:
-                body_fon = body_fon.set_frame_rate(target_frame_rate)
-            if outro_down.frame_rate != target_frame_rate:
-                outro_down = outro_down.set_frame_rate(target_frame_rate)
+            if ducking_enabled and len(fon_gains):
+                # Gövde boyunca sabit %35 yerine konuşma zarfına bağlı seviye:
+                # konuşmada ducked_fon_db, duraklamalarda mid_fon_db'ye açılır
+                try:
+                    body_gain_db = sidechain_gain_db(
+                        ham_segment,
+                        ducked_fon_db,
+                        mid_fon_db,
+                        threshold_db=ducking_threshold_db,
+                        attack_ms=ducking_attack_ms,
+                        release_ms=ducking_release_ms
+                    )
+                    body_start = min(int(round(intro_duration * fon_bed.frame_rate / 1000.0)), len(fon_gains))
+                    body_end = min(body_start + len(body_gain_db), len(fon_gains))
+                    fon_gains[body_start:body_end] = db_to_amplitude(body_gain_db[:body_end - body_start])
+                except Exception as e:
+                    logger.warning(f"Sidechain ducking hatası, sabit seviye kullanılıyor: {e}")
             
-            # Fon müziği arka planını oluştur (kompresör henüz uygulanmayacak)
-            prelim_background = (
-                intro_fon
-                .append(body_fon, crossfade=0)
-            )
+            final_background = apply_gain_envelope(fon_bed, fon_gains) if len(fon_gains) else fon_bed
             
-            # Frame rate kontrolü (append sonrası - genelde aynı kalır, kontrol et)
-            if prelim_background.frame_rate != target_frame_rate:
-                prelim_background = prelim_background.set_frame_rate(target_frame_rate)
+            if not ending_path and background_end <= outro_start:
+                # Ham ses bitiminden sonra hiç fon yoksa sessizlik ekle
+                final_background += AudioSegment.silent(
+                    duration=outro_fall_duration,
+                    frame_rate=final_background.frame_rate
+                )
             
-            # Fade-out kısmı ekle (veya bitiş ekleme)
+            # Bitiş ekleme
             if ending_path and ending_segment:
                 # Bitiş seçilmişse: Fon sesini ham ses bitiminde kes, ardına bitişi ekle
-                # Fon sesini ham ses bitimine kadar kullan (fade-out yok)
-                final_background = prelim_background
-                
                 # Bitiş sesini final_background ile uyumlu hale getir
                 # Frame rate uyumluluğu
                 if ending_segment.frame_rate != final_background.frame_rate:
-                    ending_segment = ending_segment.set_frame_rate(final_background.frame_rate)
+                    ending_segment = resample_segment(ending_segment, final_background.frame_rate, resample_quality)
                 
                 # Channels uyumluluğu
                 if ending_segment.channels != final_background.channels:
@@ -334,36 +378,29 @@ def ses_montaj(
                 # Bitiş sesinin başlangıcına daha uzun ve yumuşak fade-in ekle
                 # İlk 200-300ms'ye fade-in uygula (daha yumuşak geçiş için)
                 fade_in_duration = min(300, max(200, len(ending_segment) // 3))  # 200-300ms veya bitiş sesinin %33'ü
-                if fade_in_duration > 50:  # Minimum 50ms fade-in
-                    # Pydub'un fade_in metodunu kullan (daha yumuşak ve doğal)
-                    ending_segment = ending_segment.fade_in(fade_in_duration)
-                    logger.debug(f"Bitiş sesine {fade_in_duration}ms yumuşak fade-in uygulandı")
-                
-                # Fon müziğinin sonuna kısa fade-out ekle (yumuşak geçiş için)
-                # Son 50ms'ye fade-out uygula
-                fade_out_duration = 50
-                if len(final_background) > fade_out_duration:
-                    bg_end = final_background[-fade_out_duration:]
-                    bg_rest = final_background[:-fade_out_duration]
-                    bg_end = bg_end.fade_out(fade_out_duration)
-                    final_background = bg_rest + bg_end
-                    logger.debug(f"Fon müziğinin sonuna {fade_out_duration}ms fade-out uygulandı")
+                if fade_in_duration <= 50:  # Minimum 50ms fade-in
+                    fade_in_duration = 0
                 
-                # Append işlemi - crossfade ile yumuşak geçiş
-                crossfade_ms = 50  # 50ms crossfade
-                final_background = final_background.append(ending_segment, crossfade=crossfade_ms)
-            else:
-                # Bitiş seçilmemişse: Normal fade-out
-                final_background = (
-                    prelim_background
-                    .append(outro_down, crossfade=0)
+                # Fon sonuna kısa fade-out, ardından bitiş başıyla crossfade
+                # Yalnızca bitiş ve fonun son kısmı işlenir; fonun geri kalanı kopyalanmaz
+                final_background = append_with_crossfade(
+                    final_background,
+                    ending_segment,
+                    AudioConfig.ENDING_CROSSFADE_MS,
+                    tail_fade_in_ms=fade_in_duration,
+                    base_fade_out_ms=AudioConfig.ENDING_FADE_OUT_MS,
+                    shape=AudioConfig.ENDING_CROSSFADE_SHAPE
+                )
+                logger.debug(
+                    f"Bitiş eklendi: {fade_in_duration}ms fade-in, {AudioConfig.ENDING_FADE_OUT_MS}ms fon fade-out, "
+                    f"{AudioConfig.ENDING_CROSSFADE_MS}ms crossfade ({AudioConfig.ENDING_CROSSFADE_SHAPE})"
                 )
             
             # Frame rate final kontrolü ve ham ses uyumu
             if final_background.frame_rate != ham_segment.frame_rate:
                 logger.debug(f"Frame rate uyumluluğu: final_background={final_background.frame_rate}, ham={ham_segment.frame_rate}")
                 # Ham'i final_background'in frame rate'ine uyarla
-                ham_segment = ham_segment.set_frame_rate(final_background.frame_rate)
+                ham_segment = resample_segment(ham_segment, final_background.frame_rate, resample_quality)
             
             # Konuşma bindirme (frame rate uyumlu)
             final_voice = ham_segment.apply_gain(voice_db)
@@ -408,37 +445,21 @@ def ses_montaj(
                 logger.warning(f"Kompresör hatası, devam ediliyor: {e}")
             
             # === MASTERING ===
-            # 1. Peak sınırlama (clipping önleme)
-            peak = getattr(final_result, "max_dBFS", None)
-            if peak is not None and peak > peak_headroom_db:
-                gain_reduction = peak_headroom_db - peak
-                final_result = final_result.apply_gain(gain_reduction)
-                logger.debug(f"Peak sınırlama uygulandı: {peak:.2f} dB -> {final_result.max_dBFS:.2f} dB")
-            
-            # 2. Dinamik aralık normalizasyonu (pürüzsüz çıkış için)
-            # Optimize edilmiş: Sadece gerekli durumlarda normalize et
+            # LUFS modu: entegre loudness hedefe getirilir, true-peak tavanını
+            # limiter korur. Tepe modu: tek geçişli lookahead true-peak limiter,
+            # kazanç blok tepelerine göre ayarlanır, tekil tepeleri limiter yakalar
             try:
-                current_peak = final_result.max_dBFS
-                # Eğer peak zaten uygun aralıktaysa normalize etme (hız artışı)
-                if current_peak < -0.3 or current_peak > 0.0:
-                    # Önce normalize et (peak normalizasyonu)
-                    final_result = normalize(final_result)
-                    
-                    # Sonra hafif bir soft limiting uygula (pürüzsüz geçişler için)
-                    # Peak'i -0.3 dB'e sınırla (clipping önleme + headroom)
-                    current_peak = final_result.max_dBFS
-                    if current_peak > -0.3:
-                        final_result = final_result.apply_gain(-0.3 - current_peak)
-                        logger.debug(f"Soft limiting uygulandı: {current_peak:.2f} dB -> {final_result.max_dBFS:.2f} dB")
+                if loudness_mastering:
+                    final_result = master_loudness(final_result, target_lufs)
                 else:
-                    logger.debug(f"Normalizasyon atlandı (peak zaten uygun: {current_peak:.2f} dB)")
+                    final_result = master_limit(final_result)
             except Exception as e:
                 logger.warning(f"Mastering hatası, devam ediliyor: {e}")
             
             # === KAYIT ===
             ham_name = os.path.splitext(os.path.basename(ham_path))[0]
-            # Spot index'i offset ile ayarla (birden fazla spot için doğru numaralandırma)
-            spot_num = idx + spot_index_offset
+            # Dosya numarası spotun tüm spotlar içindeki sırasından (1 tabanlı)
+            spot_num = int(spot_numbers[idx - 1]) + 1
             out_name = f"{ham_name} {spot_num}.{output_format}"
             out_path = os.path.join(output_dir, out_name)
             
@@ -479,6 +500,7 @@ def ses_montaj(
             progress_callback(100, "Montaj tamamlandı!")
         
         logger.info(f"Montaj tamamlandı: {len(out_files)} dosya oluşturuldu")
+        logger.info(f"Zarf eğrisi önbelleği: {curve_cache_stats().since(curve_stats_start)}")
         return out_files
         
     except Exception as e:
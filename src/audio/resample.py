@@ -0,0 +1,189 @@
+"""
+Örnekleme hızı dönüşümü - polifaz FIR (scipy resample_poly).
+
+pydub set_frame_rate, audioop.ratecv ile doğrusal enterpolasyon yapar
+(alçak geçiren filtre yok, örtüşme/aliasing bırakır). Burada hız oranı
+up/down kesrine indirgenir, Kaiser pencereli FIR her (kaynak, hedef,
+kalite) üçlüsü için bir kez tasarlanıp önbelleğe alınır ve uzun girişler
+bloklar halinde işlenir (blok kenarlarında filtre uzunluğu kadar bağlam
+eklendiği için sonuç tek seferde işlemeyle aynıdır).
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from pydub import AudioSegment
+
+from .buffers import segment_to_float, float_to_segment
+from ..constants import ResampleConfig
+
+logger = logging.getLogger(__name__)
+
+def rate_ratio(src_rate: int, dst_rate: int) -> Tuple[int, int]:
+    """Hız oranını indirgenmiş (up, down) çiftine çevirir"""
+    g = math.gcd(int(src_rate), int(dst_rate))
+    return int(dst_rate) // g, int(src_rate) // g
+
+@lru_cache(maxsize=16)
+def resample_filter(src_rate: int, dst_rate: int, quality: str = None) -> np.ndarray:
+    """
+    Dönüşüm için alçak geçiren FIR katsayıları (önbellekli, salt okunur).
+    
+    Args:
+        src_rate: Kaynak örnekleme hızı (Hz)
+        dst_rate: Hedef örnekleme hızı (Hz)
+        quality: Kalite kademesi (ResampleConfig.QUALITY_TIERS anahtarı;
+            None ise ResampleConfig.POLYPHASE_QUALITY)
+    
+    Returns:
+        float32 katsayılar (resample_poly window parametresi; up ile ölçeklenmemiş)
+    """
+    from scipy.signal import firwin
+    
+    quality = quality or ResampleConfig.POLYPHASE_QUALITY
+    if quality not in ResampleConfig.QUALITY_TIERS:
+        raise ValueError(f"Bilinmeyen resample kalitesi: {quality}")
+    half_factor, beta, rolloff = ResampleConfig.QUALITY_TIERS[quality]
+    
+    up, down = rate_ratio(src_rate, dst_rate)
+    max_rate = max(up, down)
+    # Kesim hedef Nyquist'in biraz altında: geçiş bandı Nyquist'i aşıp örtüşme bırakmasın
+    taps = firwin(2 * half_factor * max_rate + 1, rolloff / max_rate, window=("kaiser", beta))
+    taps = taps.astype(np.float32)
+    taps.flags.writeable = False
+    logger.debug(f"Resample filtresi: {src_rate} -> {dst_rate} Hz ({quality}), {len(taps)} katsayı")
+    return taps
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int, quality: str = None) -> np.ndarray:
+    """
+    Float örnekleri yeni örnekleme hızına dönüştürür.
+    
+    Giriş BLOCK_SECONDS uzunluğunda (down katı) bloklara bölünür; her bloğa
+    her iki yandan filtre yarım uzunluğunu karşılayan bağlam eklenir ve
+    çıktının blok aralığına düşen kısmı alınır.
+    
+    Args:
+        samples: (frame, kanal) float örnekler
+        src_rate: Kaynak örnekleme hızı (Hz)
+        dst_rate: Hedef örnekleme hızı (Hz)
+        quality: Kalite kademesi (None ise ResampleConfig.POLYPHASE_QUALITY)
+    
+    Returns:
+        (ceil(frame * dst / src), kanal) float32 örnekler
+    """
+    from scipy.signal import resample_poly
+    
+    samples = np.asarray(samples, dtype=np.float32)
+    up, down = rate_ratio(src_rate, dst_rate)
+    if up == down:
+        return samples.copy()
+    
+    taps = resample_filter(src_rate, dst_rate, quality)
+    n = len(samples)
+    n_out = -(-n * up // down)
+    
+    # Bağlam: filtre yarım uzunluğu (giriş örneği), down katına yuvarlanmış
+    half_len = (len(taps) - 1) // 2
+    context = -(-(half_len // up + 2) // down) * down
+    block = max(down, int(ResampleConfig.BLOCK_SECONDS * src_rate) // down * down)
+    
+    if n <= block + 2 * context:
+        return resample_poly(samples, up, down, axis=0, window=taps).astype(np.float32, copy=False)
+    
+    out = np.empty((n_out,) + samples.shape[1:], dtype=np.float32)
+    written = 0
+    for start in range(0, n, block):
+        chunk_start = max(0, start - context)
+        chunk_end = min(n, start + block + context)
+        converted = resample_poly(samples[chunk_start:chunk_end], up, down, axis=0, window=taps)
+        offset = (start - chunk_start) * up // down
+        count = min(block * up // down, n_out - written)
+        out[written:written + count] = converted[offset:offset + count]
+        written += count
+    return out
+
+def resample_segment(seg: AudioSegment, frame_rate: int, quality: str = None) -> AudioSegment:
+    """
+    Segmenti yeni hıza dönüştürür.
+    
+    Kalite kademesi yoksa (ResampleConfig.QUALITY varsayılanı None) pydub
+    set_frame_rate kullanılır: en hızlısı odur, polifaz kademeleri
+    (benchmark_resample) daha yavaştır. Polifaz FIR yalnızca kademe açıkça
+    istendiğinde devreye girer.
+    
+    Args:
+        seg: Ses segmenti
+        frame_rate: Hedef örnekleme hızı (Hz)
+        quality: Kalite kademesi (None ise ResampleConfig.QUALITY)
+    
+    Returns:
+        Yeni segment (hız zaten aynıysa seg'in kendisi)
+    """
+    if seg.frame_rate == frame_rate:
+        return seg
+    quality = quality or ResampleConfig.QUALITY
+    if quality is None:
+        return seg.set_frame_rate(frame_rate)
+    like = seg._spawn(b"", overrides={"frame_rate": frame_rate})
+    if len(seg.raw_data) == 0:
+        return like
+    converted = resample(segment_to_float(seg), seg.frame_rate, frame_rate, quality)
+    return float_to_segment(converted, like)
+
+def benchmark_resample(duration_s: float = 30.0, src_rate: int = 48000, dst_rate: int = 44100) -> dict:
+    """
+    Polifaz dönüştürücüyü set_frame_rate ile karşılaştırır.
+    
+    Sentetik sinyal: stereo 16 bit, 1 kHz sinüs + hedef Nyquist'in üstünde
+    (kaynak Nyquist'in altında) bir ton. Doğru dönüşüm üst tonu bastırmalıdır; hedefte dst - ton frekansına düşen örtüşme
+    (aliasing) bileşeni 1 kHz'e göre ölçülür.
+    
+    Args:
+        duration_s: Sinyal süresi (s)
+        src_rate: Kaynak hız
+        dst_rate: Hedef hız
+    
+    Returns:
+        Kademe/pydub -> {"seconds", "alias_db"} ölçümleri
+    """
+    import time
+    
+    t = np.arange(int(duration_s * src_rate)) / src_rate
+    alias_tone = (dst_rate / 2 + src_rate / 2) / 2
+    mono = 0.5 * np.sin(2 * np.pi * 1000 * t) + 0.25 * np.sin(2 * np.pi * alias_tone * t)
+    stereo = np.stack([mono, mono * 0.9], axis=1)
+    seg = AudioSegment(
+        (stereo * 32767).astype("<i2").tobytes(), frame_rate=src_rate, sample_width=2, channels=2
+    )
+    alias_hz = dst_rate - alias_tone
+    
+    def alias_level_db(result: AudioSegment) -> float:
+        x = segment_to_float(result)[:, 0]
+        spectrum = np.abs(np.fft.rfft(x * np.hanning(len(x))))
+        freqs = np.fft.rfftfreq(len(x), 1.0 / result.frame_rate)
+        band = np.abs(freqs - alias_hz) < 20
+        ref = np.abs(freqs - 1000.0) < 20
+        return float(20 * np.log10(spectrum[band].max() / spectrum[ref].max()))
+    
+    runners = {"pydub": lambda: seg.set_frame_rate(dst_rate)}
+    for tier in ResampleConfig.QUALITY_TIERS:
+        runners[tier] = lambda tier=tier: resample_segment(seg, dst_rate, tier)
+        resample_filter(src_rate, dst_rate, tier)
+    
+    stats = {}
+    for name, run in runners.items():
+        started = time.perf_counter()
+        result = run()
+        stats[name] = {"seconds": time.perf_counter() - started, "alias_db": alias_level_db(result)}
+        logger.info(
+            f"Resample {name}: {stats[name]['seconds'] * 1000:.0f}ms, "
+            f"{alias_hz:.0f} Hz örtüşme {stats[name]['alias_db']:.1f} dB"
+        )
+    return stats
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    benchmark_resample()
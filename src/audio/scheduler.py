@@ -0,0 +1,172 @@
+"""Spot iş planlayıcı - fon/bitiş atamasını dengeli ve tekrarlanabilir yapar"""
+
+import os
+import random
+import hashlib
+import logging
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# En uyumlu bitişe bu kadar yakın skorlu bitişler de aday sayılır (çeşitlilik için)
+KEY_MATCH_TOLERANCE = 0.1
+
+class SpotJob(NamedTuple):
+    """Tek spotluk montaj işi"""
+    spot_index: int  # Tüm spotlar içindeki sıra (0'dan başlar, dosya numarası için)
+    ham_path: str
+    start_ms: int
+    end_ms: int
+    fon_path: Optional[str]
+    ending_path: Optional[str]
+
+def schedule_seed(
+    spots: Sequence[Tuple[str, int, int]],
+    fon_paths: Sequence[str],
+    ending_paths: Sequence[str]
+) -> int:
+    """
+    Girdilerden kararlı bir seed türetir.
+    
+    Aynı ham dosyalar, aralıklar, fonlar ve bitişler her çalıştırmada aynı
+    seed'i verir; böylece atamalar (ve onlara bağlı önbellekler) tekrar eder.
+    Dosya adları kullanılır, klasör yolu seed'i etkilemez.
+    
+    Args:
+        spots: (ham dosya yolu, başlangıç ms, bitiş ms) listesi
+        fon_paths: Seçilen fonlar
+        ending_paths: Seçilen bitiş sesleri
+    
+    Returns:
+        32 bit seed
+    """
+    digest = hashlib.sha1()
+    for ham_path, start, end in spots:
+        digest.update(f"{os.path.basename(ham_path)}:{int(start)}:{int(end)};".encode("utf-8"))
+    for path in list(fon_paths) + ["|"] + list(ending_paths):
+        digest.update(f"{os.path.basename(path)};".encode("utf-8"))
+    return int.from_bytes(digest.digest()[:4], "big")
+
+def balanced_assignment(count: int, choices: Sequence[str], rng: random.Random) -> List[Optional[str]]:
+    """
+    count adet atamayı seçenekler arasında dengeli dağıtır.
+    
+    Seçenekler tur tur karıştırılarak sıralanır: her turda her seçenek bir
+    kez kullanılır, bu yüzden kullanım sayıları en fazla 1 farklıdır.
+    Tur geçişlerinde aynı seçenek arka arkaya gelmez (tek seçenek hariç).
+    
+    Args:
+        count: Atama sayısı
+        choices: Seçenekler
+        rng: Seed'li rastgele sayı üreteci
+    
+    Returns:
+        count uzunluğunda atama listesi
+    """
+    if not choices:
+        return [None] * count
+    
+    assignment = []
+    while len(assignment) < count:
+        round_order = rng.sample(list(choices), len(choices))
+        if assignment and len(round_order) > 1 and round_order[0] == assignment[-1]:
+            round_order[0], round_order[-1] = round_order[-1], round_order[0]
+        assignment.extend(round_order)
+    return assignment[:count]
+
+def compatible_assignment(
+    fons: Sequence[Optional[str]],
+    fon_paths: Sequence[str],
+    ending_paths: Sequence[str],
+    compatibility: np.ndarray,
+    rng: random.Random
+) -> List[Optional[str]]:
+    """
+    Her spota fonuyla ton uyumlu bir bitiş atar.
+    
+    Spotun fonu için en yüksek uyum skoruna KEY_MATCH_TOLERANCE kadar yakın
+    bitişler aday olur; adaylardan en az kullanılan seçilir (eşitlikte
+    seed'li karışık sıra). Skorlar eşitse bu, dengeli atamaya dönüşür.
+    
+    Args:
+        fons: Spot başına atanmış fonlar
+        fon_paths: Fon listesi (compatibility satırları)
+        ending_paths: Bitiş listesi (compatibility sütunları)
+        compatibility: (fon, bitiş) uyum matrisi
+        rng: Seed'li rastgele sayı üreteci
+    
+    Returns:
+        Spot başına bitiş listesi
+    """
+    fon_rows = {path: i for i, path in enumerate(fon_paths)}
+    tie_order = rng.sample(range(len(ending_paths)), len(ending_paths))
+    usage = np.zeros(len(ending_paths), dtype=np.int64)
+    
+    endings = []
+    for fon in fons:
+        row = compatibility[fon_rows[fon]] if fon in fon_rows else np.zeros(len(ending_paths))
+        candidates = np.flatnonzero(row >= row.max() - KEY_MATCH_TOLERANCE)
+        choice = min(candidates, key=lambda j: (usage[j], tie_order.index(j)))
+        usage[choice] += 1
+        endings.append(ending_paths[choice])
+    return endings
+
+def schedule_spots(
+    spots: Sequence[Tuple[str, int, int]],
+    fon_paths: Sequence[str],
+    ending_paths: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+    compatibility: Optional[np.ndarray] = None
+) -> List[SpotJob]:
+    """
+    Spotlara fon ve bitiş atar ve render sırasını belirler.
+    
+    Fonlar ve bitişler seçilenler arasında dengeli dağıtılır; uyum matrisi
+    verilirse bitişler fonla ton uyumlu olanlardan seçilir. İşler aynı
+    fonu (ve fon içinde aynı bitişi) kullananlar art arda gelecek şekilde
+    sıralanır; böylece fon özellik/döngü önbellekleri ve diskteki dosya
+    önbelleği sıcakken kullanılır. Dosya numaraları spot_index'ten gelir,
+    render sırasından etkilenmez.
+    
+    Args:
+        spots: Spot sırasındaki (ham dosya yolu, başlangıç ms, bitiş ms) listesi
+        fon_paths: Seçilen fonlar
+        ending_paths: Seçilen bitiş sesleri (opsiyonel)
+        seed: Atama seed'i (None ise girdilerden türetilir)
+        compatibility: (fon, bitiş) ton uyum matrisi (opsiyonel,
+            bkz. tonality.ending_compatibility_matrix)
+    
+    Returns:
+        Render sırasında SpotJob listesi
+    """
+    ending_paths = list(ending_paths or [])
+    if seed is None:
+        seed = schedule_seed(spots, fon_paths, ending_paths)
+    
+    rng = random.Random(seed)
+    fons = balanced_assignment(len(spots), fon_paths, rng)
+    if compatibility is not None and len(ending_paths) > 1:
+        endings = compatible_assignment(fons, fon_paths, ending_paths, compatibility, rng)
+    else:
+        endings = balanced_assignment(len(spots), ending_paths, rng)
+    
+    jobs = [
+        SpotJob(i, ham_path, int(start), int(end), fon, ending)
+        for i, ((ham_path, start, end), fon, ending) in enumerate(zip(spots, fons, endings))
+    ]
+    
+    # Gruplar ilk göründükleri spot sırasıyla; grup içinde spot sırası korunur
+    fon_order = {}
+    ending_order = {}
+    for job in jobs:
+        fon_order.setdefault(job.fon_path, len(fon_order))
+        ending_order.setdefault(job.ending_path, len(ending_order))
+    jobs.sort(key=lambda j: (fon_order[j.fon_path], ending_order[j.ending_path], j.spot_index))
+    
+    logger.debug(
+        f"Spot planı (seed={seed}): {len(jobs)} spot, {len(fon_order)} fon, "
+        f"{len(ending_paths)} bitiş"
+    )
+    return jobs
@@ -0,0 +1,292 @@
+"""Spot segment indeksi - NumPy structured array tabanlı segment listesi"""
+
+from typing import Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+import logging
+import numpy as np
+
+from ..constants import AnalysisConfig
+
+logger = logging.getLogger(__name__)
+
+# Segment kaydı: zaman aralığı (ms), durum bayrakları ve seviye istatistiği
+SEGMENT_DTYPE = np.dtype([
+    ("start", np.int64),
+    ("end", np.int64),
+    ("flags", np.uint8),
+    ("level_db", np.float32),
+])
+
+# Segment bayrakları
+FLAG_SPLIT = 1  # Bölme işlemiyle oluştu
+FLAG_MERGED = 2  # Birleştirme işlemiyle oluştu
+FLAG_NUDGED = 4  # Sınırları elle kaydırıldı
+FLAG_DISABLED = 8  # Montaja dahil edilmeyecek
+
+class SegmentIndex:
+    """
+    Bir ham ses dosyasının spot segmentleri.
+    
+    Segmentler başlangıca göre sıralı ve çakışmasız tutulur. Filtreleme,
+    sayma ve birleştirme vektörel çalışır; konum araması np.searchsorted
+    ile O(log n)'dir. (başlangıç, bitiş) tuple listesi gibi iterate edilir.
+    
+    Düzenleme maliyeti: nudge ve set_disabled yerinde O(1)'dir; split ve
+    merge_with_next ise tek kayıt ekleyip sildiği için diziyi kopyalar,
+    O(n)'dir. Bir ham dosyada segment sayısı onlarla sınırlı olduğundan
+    (kopya birkaç KB) parçalı bir yapı yerine düz dizi tercih edildi.
+    """
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, data: Optional[np.ndarray] = None):
+        """
+        SegmentIndex oluşturur.
+        
+        Args:
+            data: SEGMENT_DTYPE tipinde sıralı dizi (None ise boş indeks)
+        """
+        if data is None:
+            data = np.zeros(0, dtype=SEGMENT_DTYPE)
+        self._data = data
+    
+    @classmethod
+    def from_ranges(
+        cls,
+        ranges: Union["SegmentIndex", Iterable[Tuple[int, int]]],
+        levels_db: Optional[Iterable[float]] = None
+    ) -> "SegmentIndex":
+        """
+        (başlangıç, bitiş) listesinden indeks oluşturur.
+        
+        Args:
+            ranges: Segment listesi (ms) veya mevcut SegmentIndex
+            levels_db: Segment seviyeleri (dBFS, opsiyonel)
+        
+        Returns:
+            Sıralı SegmentIndex
+        """
+        if isinstance(ranges, SegmentIndex):
+            return SegmentIndex(ranges._data.copy())
+        
+        ranges = list(ranges)
+        data = np.zeros(len(ranges), dtype=SEGMENT_DTYPE)
+        if ranges:
+            bounds = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+            data["start"] = bounds[:, 0]
+            data["end"] = bounds[:, 1]
+        data["level_db"] = np.nan if levels_db is None else np.asarray(list(levels_db), dtype=np.float32)
+        data.sort(order="start", kind="stable")
+        return cls(data)
+    
+    # --- Okuma ---
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __bool__(self) -> bool:
+        return len(self._data) > 0
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self.to_ranges())
+    
+    def __getitem__(self, i: Union[int, slice]) -> Union[Tuple[int, int], "SegmentIndex"]:
+        if isinstance(i, slice):
+            return SegmentIndex(self._data[i].copy())
+        row = self._data[i]
+        return int(row["start"]), int(row["end"])
+    
+    def __repr__(self) -> str:
+        return f"SegmentIndex({len(self)} segment)"
+    
+    @property
+    def data(self) -> np.ndarray:
+        """Ham structured array (salt okunur kullanım için)"""
+        return self._data
+    
+    @property
+    def starts(self) -> np.ndarray:
+        return self._data["start"]
+    
+    @property
+    def ends(self) -> np.ndarray:
+        return self._data["end"]
+    
+    @property
+    def durations(self) -> np.ndarray:
+        return self._data["end"] - self._data["start"]
+    
+    def to_ranges(self) -> List[Tuple[int, int]]:
+        """(başlangıç, bitiş) tuple listesi döndürür"""
+        return list(zip(self._data["start"].tolist(), self._data["end"].tolist()))
+    
+    # --- Vektörel sorgular ---
+    
+    def valid_mask(self, min_length: Optional[int] = None) -> np.ndarray:
+        """
+        Montaja girecek segmentlerin maskesi.
+        
+        Args:
+            min_length: Minimum segment uzunluğu (ms), None ise varsayılan
+        
+        Returns:
+            Boolean maske
+        """
+        if min_length is None:
+            min_length = AnalysisConfig.MIN_SEGMENT_LENGTH_MS
+        return (self.durations >= min_length) & ((self._data["flags"] & FLAG_DISABLED) == 0)
+    
+    def valid(self, min_length: Optional[int] = None) -> "SegmentIndex":
+        """Geçerli segmentlerden oluşan yeni indeks döndürür"""
+        return SegmentIndex(self._data[self.valid_mask(min_length)])
+    
+    def count_valid(self, min_length: Optional[int] = None) -> int:
+        """Geçerli segment sayısını döndürür"""
+        return int(np.count_nonzero(self.valid_mask(min_length)))
+    
+    def merged(self, max_gap: Optional[int] = None) -> "SegmentIndex":
+        """
+        Aralarındaki boşluk max_gap'ten küçük segmentleri birleştirir.
+        
+        Analizdeki birleştirme adımıdır (merge_close_segments bunu sarar):
+        boşluk max_gap'e eşit veya küçükse segmentler tek grupta toplanır.
+        
+        Args:
+            max_gap: Birleştirme için maksimum boşluk (ms)
+        
+        Returns:
+            Birleştirilmiş yeni indeks
+        """
+        if max_gap is None:
+            max_gap = AnalysisConfig.MAX_GAP_MS
+        
+        data = self._data
+        if len(data) < 2:
+            return SegmentIndex(data.copy())
+        
+        # Çakışan segmentlerde de doğru çalışması için kümülatif bitiş
+        run_end = np.maximum.accumulate(data["end"])
+        new_group = np.empty(len(data), dtype=bool)
+        new_group[0] = True
+        new_group[1:] = data["start"][1:] - run_end[:-1] > max_gap
+        
+        group_starts = np.flatnonzero(new_group)
+        group_ends = np.append(group_starts[1:], len(data)) - 1
+        
+        out = np.zeros(len(group_starts), dtype=SEGMENT_DTYPE)
+        out["start"] = data["start"][group_starts]
+        out["end"] = run_end[group_ends]
+        out["flags"] = np.bitwise_or.reduceat(data["flags"], group_starts)
+        out["flags"][group_ends > group_starts] |= FLAG_MERGED
+        out["level_db"] = np.fmax.reduceat(data["level_db"], group_starts)
+        return SegmentIndex(out)
+    
+    def find(self, position_ms: int) -> int:
+        """
+        Verilen konumu içeren segmentin index'ini bulur (O(log n)).
+        
+        Args:
+            position_ms: Konum (ms)
+        
+        Returns:
+            Segment index'i, konum bir segmentin içinde değilse -1
+        """
+        i = int(np.searchsorted(self._data["start"], position_ms, side="right")) - 1
+        if i >= 0 and position_ms < self._data["end"][i]:
+            return i
+        return -1
+    
+    # --- Düzenleme ---
+    
+    def split(self, position_ms: int) -> int:
+        """
+        Konumu içeren segmenti o noktadan ikiye böler.
+        
+        Konum araması O(log n), yeni kaydın eklenmesi (np.insert) O(n)'dir.
+        
+        Args:
+            position_ms: Bölme noktası (ms)
+        
+        Returns:
+            Sağ parçanın index'i
+        
+        Raises:
+            ValueError: Konum bir segmentin içinde değilse
+        """
+        i = self.find(position_ms)
+        if i < 0 or position_ms <= self._data["start"][i]:
+            raise ValueError(f"Bölme noktası bir segmentin içinde değil: {position_ms}ms")
+        
+        right = self._data[i].copy()
+        right["start"] = position_ms
+        right["flags"] |= FLAG_SPLIT
+        self._data["end"][i] = position_ms
+        self._data["flags"][i] |= FLAG_SPLIT
+        self._data = np.insert(self._data, i + 1, right)
+        return i + 1
+    
+    def merge_with_next(self, i: int) -> None:
+        """
+        i. segmenti bir sonraki segmentle birleştirir.
+        
+        Sonraki kaydın silinmesi (np.delete) diziyi kopyalar, O(n)'dir.
+        
+        Args:
+            i: Segment index'i
+        
+        Raises:
+            IndexError: Sonraki segment yoksa
+        """
+        if not 0 <= i < len(self._data) - 1:
+            raise IndexError(f"Birleştirilecek sonraki segment yok: {i}")
+        
+        nxt = self._data[i + 1]
+        self._data["end"][i] = max(self._data["end"][i], nxt["end"])
+        self._data["flags"][i] |= nxt["flags"] | FLAG_MERGED
+        self._data["level_db"][i] = np.fmax(self._data["level_db"][i], nxt["level_db"])
+        self._data = np.delete(self._data, i + 1)
+    
+    def nudge(self, i: int, start_delta_ms: int = 0, end_delta_ms: int = 0) -> Tuple[int, int]:
+        """
+        i. segmentin sınırlarını kaydırır (komşu segmentlere taşmadan).
+        
+        Args:
+            i: Segment index'i
+            start_delta_ms: Başlangıç kaydırma miktarı (ms)
+            end_delta_ms: Bitiş kaydırma miktarı (ms)
+        
+        Returns:
+            Yeni (başlangıç, bitiş)
+        """
+        data = self._data
+        lower = int(data["end"][i - 1]) if i > 0 else 0
+        upper = int(data["start"][i + 1]) if i + 1 < len(data) else None
+        
+        start = max(lower, int(data["start"][i]) + start_delta_ms)
+        end = int(data["end"][i]) + end_delta_ms
+        if upper is not None:
+            end = min(upper, end)
+        end = max(start + 1, end)
+        
+        data["start"][i] = start
+        data["end"][i] = end
+        data["flags"][i] |= FLAG_NUDGED
+        return start, end
+    
+    def set_disabled(self, i: int, disabled: bool = True) -> None:
+        """i. segmenti montaj dışı bırakır veya tekrar dahil eder"""
+        if disabled:
+            self._data["flags"][i] |= FLAG_DISABLED
+        else:
+            self._data["flags"][i] &= ~np.uint8(FLAG_DISABLED)
+
+def count_valid_spots(segment_map: Mapping[str, SegmentIndex]) -> int:
+    """
+    Tüm ham sesler için toplam geçerli spot sayısını döndürür.
+    
+    Args:
+        segment_map: Ham ses yolu -> SegmentIndex eşlemesi
+    
+    Returns:
+        Toplam geçerli spot sayısı
+    """
+    return sum(index.count_valid() for index in segment_map.values())
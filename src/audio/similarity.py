@@ -0,0 +1,190 @@
+"""Benzer fon önerisi - preset özellik vektörleri üzerinde en yakın komşu araması"""
+
+import os
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .preset_index import PresetIndex, get_preset_index
+from ..constants import ENDING_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# Özellik grupları ve mesafedeki ağırlıkları; her grup boyut sayısından
+# bağımsız olarak toplam mesafeye ağırlığı kadar katkı yapar
+FEATURE_GROUP_WEIGHTS = {
+    "tempo": 1.0,
+    "energy": 1.0,
+    "timbre": 1.0,
+    "key": 0.5,
+}
+
+def feature_groups(entry: Dict[str, Any]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    İndeks kaydından grup grup ham özellik vektörlerini çıkarır.
+    
+    Args:
+        entry: PresetIndex kaydı
+    
+    Returns:
+        Grup adı -> vektör sözlüğü; kayıtta benzerlik özellikleri yoksa None
+    """
+    try:
+        chroma = np.asarray(entry["chroma_mean"], dtype=np.float64)
+        return {
+            "tempo": np.array([np.log2(max(entry["tempo"], 1.0))]),
+            "energy": np.array([
+                entry["loudness_db"],
+                entry["dynamic_range_db"],
+                np.log2(max(entry["centroid_hz"], 1.0)),
+            ]),
+            "timbre": np.asarray(entry["mfcc_mean"], dtype=np.float64),
+            # Tonalite profili: toplamı 1 olan chroma dağılımı
+            "key": chroma / max(chroma.sum(), 1e-10),
+        }
+    except (KeyError, TypeError):
+        return None
+
+class SimilarityIndex:
+    """
+    Preset özellik vektörleri üzerinde kaba kuvvet (brute-force) en yakın komşu indeksi.
+    
+    Vektörler kütüphane içinde boyut boyut standartlaştırılır ve grup
+    ağırlıklarıyla ölçeklenir; sorgu tek bir matris-vektör çarpımıdır.
+    Binlerce preset için milisaniyeler içinde yanıt verir.
+    """
+    
+    def __init__(self, entries: Sequence[Dict[str, Any]]):
+        """
+        SimilarityIndex oluşturur.
+        
+        Args:
+            entries: PresetIndex kayıtları (benzerlik özellikleri olmayanlar atlanır)
+        """
+        paths = []
+        rows = []
+        for entry in entries:
+            groups = feature_groups(entry)
+            if groups is None:
+                continue
+            paths.append(entry["path"])
+            rows.append(groups)
+        
+        self.paths = paths
+        self._positions = {self._key(p): i for i, p in enumerate(paths)}
+        
+        if not rows:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+            self._sq_norms = np.zeros(0, dtype=np.float32)
+            return
+        
+        blocks = []
+        for name, weight in FEATURE_GROUP_WEIGHTS.items():
+            block = np.stack([r[name] for r in rows])
+            std = block.std(axis=0)
+            block = (block - block.mean(axis=0)) / np.where(std > 0, std, 1.0)
+            blocks.append(block * (weight / np.sqrt(block.shape[1])))
+        
+        self.matrix = np.ascontiguousarray(np.hstack(blocks), dtype=np.float32)
+        self._sq_norms = np.einsum("ij,ij->i", self.matrix, self.matrix)
+    
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __contains__(self, path: str) -> bool:
+        return self._key(path) in self._positions
+    
+    def similar_to(
+        self,
+        path: str,
+        k: int = 5,
+        exclude: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Verilen presete en benzer k preseti bulur.
+        
+        Args:
+            path: Referans preset dosya yolu
+            k: İstenen sonuç sayısı
+            exclude: Sonuçlara alınmayacak dosyalar (örn. zaten seçilenler)
+        
+        Returns:
+            (dosya yolu, mesafe) listesi, en benzerden başlayarak;
+            referans indekste yoksa boş liste
+        """
+        position = self._positions.get(self._key(path))
+        if position is None or k <= 0:
+            return []
+        
+        query = self.matrix[position]
+        distances = self._sq_norms - 2.0 * (self.matrix @ query) + self._sq_norms[position]
+        distances[position] = np.inf
+        for excluded in exclude or ():
+            excluded_position = self._positions.get(self._key(excluded))
+            if excluded_position is not None:
+                distances[excluded_position] = np.inf
+        
+        available = int(np.isfinite(distances).sum())
+        k = min(k, available)
+        if k <= 0:
+            return []
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        return [(self.paths[i], float(np.sqrt(max(distances[i], 0.0)))) for i in nearest]
+
+_similarity_cache: Dict[int, Tuple[int, SimilarityIndex]] = {}
+_similarity_lock = threading.Lock()
+
+def get_similarity_index(index: Optional[PresetIndex] = None) -> SimilarityIndex:
+    """
+    Preset indeksinden benzerlik indeksini döndürür (indeks değişmedikçe önbellekten).
+    
+    Bitiş sesleri benzerlik indeksine alınmaz.
+    
+    Args:
+        index: Kaynak PresetIndex (None ise paylaşılan indeks)
+    
+    Returns:
+        SimilarityIndex
+    """
+    if index is None:
+        index = get_preset_index()
+    
+    with _similarity_lock:
+        revision = index.revision
+        cached = _similarity_cache.get(id(index))
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        
+        entries = [e for e in index.entries() if e.get("category") not in ENDING_CATEGORIES]
+        similarity = SimilarityIndex(entries)
+        _similarity_cache[id(index)] = (revision, similarity)
+        logger.debug(f"Benzerlik indeksi oluşturuldu: {len(similarity)} fon")
+        return similarity
+
+def find_similar_presets(
+    path: str,
+    k: int = 5,
+    exclude: Optional[Sequence[str]] = None,
+    index: Optional[PresetIndex] = None
+) -> List[str]:
+    """
+    Verilen fona en benzer k fonun yollarını döndürür.
+    
+    Args:
+        path: Referans fon dosya yolu
+        k: İstenen sonuç sayısı
+        exclude: Sonuçlara alınmayacak dosyalar
+        index: Kaynak PresetIndex (None ise paylaşılan indeks)
+    
+    Returns:
+        Dosya yolları (silinmiş dosyalar atlanır); referans indekslenmemişse boş liste
+    """
+    similarity = get_similarity_index(index)
+    return [p for p, _ in similarity.similar_to(path, k, exclude) if os.path.isfile(p)]
@@ -0,0 +1,125 @@
+"""Tonalite tahmini - chroma profilinden ton ve fon/bitiş ton uyumu"""
+
+import logging
+from typing import Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Krumhansl-Kessler ton profilleri (C'den başlayarak)
+MAJOR_PROFILE = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
+MINOR_PROFILE = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
+
+PITCH_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Tonu belirsiz (veya indekslenmemiş) dosyalar için nötr uyum skoru
+NEUTRAL_COMPATIBILITY = 0.5
+
+class KeyEstimate(NamedTuple):
+    """Tahmin edilen ton"""
+    tonic: int  # Perde sınıfı (0 = C)
+    mode: str  # "major" veya "minor"
+    confidence: float  # En iyi profil korelasyonu (0-1)
+
+def _profile_matrix() -> np.ndarray:
+    """24 tonun (12 majör + 12 minör) merkezlenmiş birim profilleri, (24, 12); iç çarpım = korelasyon"""
+    rows = [np.roll(MAJOR_PROFILE, t) for t in range(12)] + [np.roll(MINOR_PROFILE, t) for t in range(12)]
+    profiles = np.array(rows)
+    profiles -= profiles.mean(axis=1, keepdims=True)
+    return profiles / np.linalg.norm(profiles, axis=1, keepdims=True)
+
+_PROFILES = _profile_matrix()
+
+def estimate_key(chroma: Sequence[float]) -> KeyEstimate:
+    """
+    Ortalama chroma vektöründen tonu tahmin eder (Krumhansl-Schmuckler).
+    
+    24 tonun profiliyle korelasyon tek matris çarpımıyla hesaplanır.
+    
+    Args:
+        chroma: 12 elemanlı chroma ortalaması (C'den başlayarak)
+    
+    Returns:
+        KeyEstimate; chroma düzse güven 0
+    """
+    chroma = np.asarray(chroma, dtype=np.float64)
+    centered = chroma - chroma.mean()
+    norm = np.linalg.norm(centered)
+    if chroma.shape != (12,) or norm < 1e-10:
+        return KeyEstimate(0, "major", 0.0)
+    
+    correlations = _PROFILES @ (centered / norm)
+    best = int(np.argmax(correlations))
+    return KeyEstimate(best % 12, "major" if best < 12 else "minor", float(max(correlations[best], 0.0)))
+
+def key_name(tonic: int, mode: str) -> str:
+    """Ton adı (örn. "C", "Am")"""
+    return PITCH_NAMES[tonic % 12] + ("m" if mode == "minor" else "")
+
+def _wheel_position(tonic: int, mode: str) -> int:
+    """Beşliler çemberindeki konum; minör ton, relatif majörüyle aynı konumdadır"""
+    relative_major = tonic if mode == "major" else (tonic + 3) % 12
+    return (7 * relative_major) % 12
+
+def key_compatibility(a: KeyEstimate, b: KeyEstimate) -> float:
+    """
+    İki tonun uyum skoru (0-1).
+    
+    Beşliler çemberindeki her adım 0.2, mod farkı 0.15 düşürür: aynı ton 1.0,
+    relatif majör/minör 0.85, komşu ton 0.8. Tahminlerden biri güvensizse
+    skor nötr değere (0.5) doğru çekilir.
+    
+    Args:
+        a: Birinci ton
+        b: İkinci ton
+    
+    Returns:
+        Uyum skoru
+    """
+    steps = abs(_wheel_position(a.tonic, a.mode) - _wheel_position(b.tonic, b.mode))
+    steps = min(steps, 12 - steps)
+    score = max(0.0, 1.0 - 0.2 * steps - (0.15 if a.mode != b.mode else 0.0))
+    confidence = min(a.confidence, b.confidence)
+    return NEUTRAL_COMPATIBILITY + (score - NEUTRAL_COMPATIBILITY) * confidence
+
+def entry_key(entry: Optional[Dict]) -> Optional[KeyEstimate]:
+    """PresetIndex kaydındaki ton tahminini döndürür (yoksa None)"""
+    if not entry or "key_tonic" not in entry:
+        return None
+    return KeyEstimate(int(entry["key_tonic"]), entry["key_mode"], float(entry["key_confidence"]))
+
+def ending_compatibility_matrix(
+    fon_paths: Sequence[str],
+    ending_paths: Sequence[str],
+    index=None
+) -> np.ndarray:
+    """
+    Fon x bitiş ton uyum matrisini preset indeksinden oluşturur.
+    
+    Render sırasında analiz yapılmaz: tonlar indekste hazırdır. İndekste
+    olmayan dosyalar (örn. kullanıcının kendi fonu) nötr skor alır.
+    
+    Args:
+        fon_paths: Fonlar
+        ending_paths: Bitiş sesleri
+        index: PresetIndex (None ise paylaşılan indeks)
+    
+    Returns:
+        (fon sayısı, bitiş sayısı) boyutlu uyum skorları
+    """
+    if index is None:
+        from .preset_index import get_preset_index
+        index = get_preset_index()
+    
+    fon_keys = [entry_key(index.get(p)) for p in fon_paths]
+    ending_keys = [entry_key(index.get(p)) for p in ending_paths]
+    
+    matrix = np.full((len(fon_paths), len(ending_paths)), NEUTRAL_COMPATIBILITY)
+    for i, fon_key in enumerate(fon_keys):
+        if fon_key is None:
+            continue
+        for j, ending_key in enumerate(ending_keys):
+            if ending_key is not None:
+                matrix[i, j] = key_compatibility(fon_key, ending_key)
+    return matrix
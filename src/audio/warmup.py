@@ -0,0 +1,132 @@
+"""Analiz ısınması - librosa/numba derleme maliyetini ilk spottan önce öder"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from ..constants import AnalysisConfig
+from ..utils.file_utils import configure_jit_cache
+
+logger = logging.getLogger(__name__)
+
+_warmup_thread: Optional[threading.Thread] = None
+_warmup_lock = threading.Lock()
+_warmup_done = threading.Event()
+
+def _warmup_signal(sr: int, seconds: float = 3.0) -> np.ndarray:
+    """Beat takibinin boş dönmemesi için 120 BPM tıklardan oluşan kısa sinyal"""
+    y = np.zeros(int(sr * seconds), dtype=np.float32)
+    click = np.hanning(64).astype(np.float32)
+    for pos in range(0, len(y) - len(click), sr // 2):
+        y[pos:pos + len(click)] += click
+    return y
+
+def warm_up(sr: int = None) -> float:
+    """
+    Analiz zincirini kısa bir sentetik sinyalle bir kez çalıştırır.
+    
+    librosa içe aktarılır, beat/RMS analizi (AnalysisConfig.BEAT_TRACKER'a
+    göre) ve DSP çekirdekleri derlenir; sonraki çağrılar derleme beklemez.
+    
+    Args:
+        sr: Sample rate (None ise AnalysisConfig.SAMPLE_RATE)
+    
+    Returns:
+        Geçen süre (s)
+    """
+    from .features import _analyze_signal
+    
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    started = time.perf_counter()
+    import librosa  # noqa: F401 - içe aktarma maliyeti de ısınmanın parçası
+    
+    y = _warmup_signal(sr)
+    _analyze_signal(y, sr, 0.0, len(y) / sr * 1000.0)
+    
+    # DSP çekirdekleri (numba varsa ilk çağrıda derlenir / önbellekten yüklenir)
+    from . import kernels
+    probe = y[:sr // 10].astype(np.float64)
+    kernels.envelope_follower(kernels.gain_computer(probe, -20.0, 3.0), 0.9, 0.99)
+    kernels.peak_hold(probe, 32)
+    
+    elapsed = time.perf_counter() - started
+    _warmup_done.set()
+    return elapsed
+
+def start_background_warmup(sr: int = None) -> threading.Thread:
+    """
+    warm_up'ı arka planda bir kez başlatır (sonraki çağrılar aynı thread'i döndürür).
+    
+    Args:
+        sr: Sample rate (None ise AnalysisConfig.SAMPLE_RATE)
+    
+    Returns:
+        Isınma thread'i
+    """
+    global _warmup_thread
+    
+    def worker():
+        try:
+            elapsed = warm_up(sr)
+            logger.info(f"Analiz ısınması tamamlandı ({elapsed:.1f}s)")
+        except Exception as e:
+            logger.warning(f"Analiz ısınması başarısız (ilk spot yavaş olabilir): {e}")
+    
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=worker, name="AnalysisWarmup", daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
+
+def is_warmed_up() -> bool:
+    """Isınma tamamlandıysa True"""
+    return _warmup_done.is_set()
+
+def benchmark_warmup(sr: int = None) -> Dict[str, float]:
+    """
+    Isınmanın kazancını ölçer: ilk (soğuk) ve ikinci (sıcak) analiz süresi.
+    
+    Anlamlı sonuç için yeni bir süreçte çalıştırılmalıdır. Soğuk süre,
+    ısınma olmadan ilk spotun beklediği ek süreye karşılık gelir; JIT disk
+    önbelleği doluysa sonraki açılışlarda bu süre de kısalır.
+    
+    Args:
+        sr: Sample rate (None ise AnalysisConfig.SAMPLE_RATE)
+    
+    Returns:
+        {"cold_s", "warm_s", "saving_s", "numba_cache_dir"} ölçümleri
+    """
+    if sr is None:
+        sr = AnalysisConfig.SAMPLE_RATE
+    
+    cold_s = warm_up(sr)
+    
+    from .features import _analyze_signal
+    
+    y = _warmup_signal(sr)
+    started = time.perf_counter()
+    _analyze_signal(y, sr, 0.0, len(y) / sr * 1000.0)
+    warm_s = time.perf_counter() - started
+    
+    result = {
+        "cold_s": cold_s,
+        "warm_s": warm_s,
+        "saving_s": cold_s - warm_s,
+        "numba_cache_dir": os.environ.get("NUMBA_CACHE_DIR", ""),
+    }
+    logger.info(
+        f"Isınma ölçümü: soğuk {cold_s:.2f}s, sıcak {warm_s:.3f}s "
+        f"(ilk spotta kazanç {cold_s - warm_s:.2f}s, tracker={AnalysisConfig.BEAT_TRACKER})"
+    )
+    return result
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    configure_jit_cache()
+    print(benchmark_warmup())
@@ -16,6 +16,11 @@ class AudioConfig:
     MIN_PLATEAU_DURATION_MS = 4000
     FADE_OVERLAP_FIX_MS = 250
     PLATEAU_SILENCE_GAP_MS = 180
+    LOOP_CROSSFADE_MS = 80  # Fon döngüsü ek yerindeki crossfade
+    ENDING_CROSSFADE_MS = 50  # Fon sonu -> bitiş sesi crossfade
+    ENDING_CROSSFADE_SHAPE = "linear"  # "linear" (pydub append ile aynı) veya "equal_power"
+    ENDING_FADE_OUT_MS = 50  # Crossfade öncesi fon sonuna doğrusal fade-out
+    CURVE_CACHE_SIZE = 32  # Zarf eğrisi LRU önbelleğindeki en fazla eğri sayısı
 
 # Ses Seviyesi Sabitleri (dB)
 class AudioLevels:
@@ -35,6 +40,66 @@ class CompressorConfig:
     ATTACK = 8.0
     RELEASE = 80.0
 
+# Sidechain Ducking Ayarları
+class DuckingConfig:
+    """Konuşma zarfıyla fon ducking (gövde boyunca ducked <-> mid seviye)"""
+    ENABLED = False
+    THRESHOLD_DB = -40.0  # Bu seviyenin üstündeki konuşma fonu kısar (dBFS, RMS)
+    ATTACK_MS = 15.0  # Konuşma başlayınca kısma hızı
+    RELEASE_MS = 400.0  # Duraklamada fonun açılma hızı
+    HOLD_MS = 250.0  # Kelime arası kısa boşluklarda fon kısık kalır
+    LOOKAHEAD_MS = 50.0  # Konuşma başlamadan önce kısmaya başla
+    DETECTOR_MS = 10.0  # Seviye algılayıcı RMS pencere süresi
+    EDGE_MS = 300.0  # Gövde başı/sonu kısık tutulur (intro/outro rampalarıyla süreklilik)
+
+# Mastering Limiter Ayarları
+class LimiterConfig:
+    """Lookahead true-peak limiter ayarları"""
+    CEILING_DB = -0.3  # True-peak tavanı (dBTP)
+    LOOKAHEAD_MS = 5.0
+    RELEASE_MS = 60.0
+    OVERSAMPLE = 4  # True-peak tespiti için aşırı örnekleme katı
+    INTERPOLATION_TAPS = 12  # Polifaz kol başına FIR uzunluğu (örnek)
+    BLOCK_MS = 50  # Tepe istatistiği blok süresi
+    PEAK_PERCENTILE = 99.5  # Kazanç, blok tepelerinin bu yüzdeliğine göre ayarlanır
+    MAX_GAIN_REDUCTION_DB = 3.0  # Tekil tepelerde limiter'ın en fazla azaltımı
+
+# Loudness (ITU-R BS.1770 / EBU R128) Ayarları
+class LoudnessConfig:
+    """Entegre loudness ölçümü ve LUFS hedefli mastering"""
+    ENABLED = False  # Mastering modu: False = tepe (limiter), True = LUFS hedefi
+    TARGET_LUFS = -16.0  # Yaygın teslim hedefleri: -23 (EBU R128), -16 (web/podcast)
+    TRUE_PEAK_CEILING_DB = -1.0  # LUFS modunda true-peak tavanı (EBU R128: -1 dBTP)
+    BLOCK_MS = 400  # Ölçüm bloğu
+    STEP_MS = 100  # Blok adımı (%75 örtüşme)
+    ABSOLUTE_GATE_LUFS = -70.0
+    RELATIVE_GATE_LU = -10.0
+    MAX_ITERATIONS = 3  # Limiter kazancı düşürürse hedefe yeniden yaklaşma turu
+    TOLERANCE_LU = 0.1
+
+# Örnekleme Hızı Dönüşümü
+class ResampleConfig:
+    """Polifaz örnekleme hızı dönüştürücü ayarları"""
+    TARGET_FRAME_RATE = 44100
+    # Montaj varsayılanı: None = pydub set_frame_rate (en hızlı; polifaz kademeleri
+    # daha yavaş ama örtüşmesiz). Gelişmiş ayarlarda "resample_quality" ile seçilir.
+    QUALITY = None
+    POLYPHASE_QUALITY = "standard"  # resample() çağrısında kademe verilmezse
+    # Gelişmiş ayarlar seçenekleri: değer -> etiket
+    QUALITY_LABELS = {
+        None: "Hızlı (set_frame_rate)",
+        "fast": "Polifaz - Hızlı",
+        "standard": "Polifaz - Standart",
+        "high": "Polifaz - Yüksek",
+    }
+    # Kademe -> (yarım filtre uzunluğu / max(up, down), Kaiser beta, kesim / hedef Nyquist)
+    QUALITY_TIERS = {
+        "fast": (8, 6.0, 0.90),
+        "standard": (16, 8.6, 0.92),
+        "high": (32, 10.0, 0.95),
+    }
+    BLOCK_SECONDS = 10.0  # Uzun girişler bu uzunlukta bloklarla işlenir
+
 # Ses Analizi Sabitleri
 class AnalysisConfig:
     """Ses analizi parametreleri"""
@@ -48,10 +113,26 @@ class AnalysisConfig:
     ONE_MEASURE_FALLBACK_MS = 2500
     MIN_TOTAL_OUTRO_MS = 5000
     FALLBACK_OUTRO_MS = 7000
-    GAIN_RAMP_STEP_MS = 15
-    LINEAR_GAIN_RAMP_STEP_MS = 20
+    OUTRO_ANALYSIS_MODE = "full"  # "full", "window" veya "auto" (önbellek yoksa, preset indeksi varsa pencere)
+    OUTRO_WINDOW_MAX_TEMPO_RATIO = 1.5  # Pencere/şarkı tempo oranı bunu aşarsa (oktav hatası) tam analiz
+    OUTRO_WINDOW_CONTEXT_MS = 8000  # Pencereli beat takibi: hedef öncesi tempo bağlamı
+    OUTRO_WINDOW_LOOKAHEAD_MS = 8000  # Pencereli beat takibi: hedef sonrası arama alanı
+    BEAT_TRACKER = "librosa"  # "librosa" veya "numpy" (hafif otokorelasyon tahmincisi)
+    BEATS_PER_BAR = 4  # Ölçü başına beat (downbeat tespiti)
+    PHRASE_BARS = 8  # Cümle başına ölçü (cümle sınırı tespiti)
+    # Outro bitişini oturt: "phrase", "downbeat" veya "none". "none" dışındaki modlar varsayılan
+    # outro sürelerini değiştirir (bitiş en fazla OUTRO_SNAP_MAX_EXTEND_MS, yani 4 sn uzayabilir)
+    OUTRO_SNAP = "phrase"
+    OUTRO_SNAP_MAX_EXTEND_MS = 4000  # Cümle sonuna oturtmak için izin verilen en fazla uzama
+    FON_START_SELECTION = "energy"  # Fon başlangıcı: "energy" (enerjili ölçü başı) veya "zero"
+    FON_START_MIN_ENERGY_RATIO = 0.9  # Başlangıç penceresi enerjisi / fon medyan enerjisi alt sınırı
+    LOOP_MIN_BARS = 8  # Fon döngüsü: minimum döngü uzunluğu (ölçü)
+    LOOP_CONTEXT_BARS = 2  # Fon döngüsü: ek yeri benzerliğinde bakılan önceki ölçü sayısı
     MAX_GAP_MS = 1400  # Segment birleştirme için maksimum boşluk
     MIN_SEGMENT_LENGTH_MS = 1000  # Minimum geçerli segment uzunluğu
+    MIN_SPOT_DURATION_MS = 0  # Süre sınırlı bölme: minimum spot süresi (0 = kapalı)
+    MAX_SPOT_DURATION_MS = 0  # Süre sınırlı bölme: maksimum spot süresi (0 = kapalı)
+    SPOT_DURATION_PENALTY = 100.0  # Süre sınırı ihlal cezası (saniye başına)
 
 # Çıktı Ayarları
 class OutputConfig:
@@ -71,6 +152,7 @@ class UIConfig:
     ANIMATION_DURATION = 200  # ms
     CARD_CORNER_RADIUS = 16
     BUTTON_CORNER_RADIUS = 12
+    SIMILAR_PRESET_COUNT = 4  # "Benzerlerini seç" ile eklenecek fon sayısı
 
 # Desteklenen Dosya Formatları
 SUPPORTED_AUDIO_FORMATS = ["*.wav", "*.mp3", "*.m4a", "*.flac", "*.aac", "*.ogg"]
@@ -88,6 +170,9 @@ PRESET_CATEGORIES = {
     "Dramatik": "presets/dramatik",
 }
 
+# Klasörü boş olduğunda içeriği otomatik sınıflandırmayla (preset indeksi) dolan kategoriler
+AUTO_PRESET_CATEGORIES = ("Enerjik", "Orta Ritimli", "Düşük Ritimli", "Dramatik")
+
 # Bitiş Kategorileri
 ENDING_CATEGORIES = {
     "Bitiş Sesleri": "presets/bitis",
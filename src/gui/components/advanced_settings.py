@@ -4,10 +4,25 @@ import customtkinter as ctk
 from typing import Optional, Callable, Dict, Any
 import logging
 
-from ...constants import FONT_FAMILY, UIConfig
+from ...constants import FONT_FAMILY, DuckingConfig, LoudnessConfig, ResampleConfig, UIConfig
 
 logger = logging.getLogger(__name__)
 
+class _OptionVar:
+    """Seçenek menüsü değişkeni: menüde etiket gösterir, get/set ayar değeriyle çalışır"""
+    
+    def __init__(self, options: Dict[Any, str], value: Any):
+        self.options = options
+        self.label_var = ctk.StringVar()
+        self.set(value)
+    
+    def get(self) -> Any:
+        label = self.label_var.get()
+        return next((value for value, text in self.options.items() if text == label), None)
+    
+    def set(self, value: Any):
+        self.label_var.set(self.options.get(value, next(iter(self.options.values()))))
+
 class AdvancedSettings(ctk.CTkToplevel):
     """Gelişmiş ayarlar penceresi"""
     
@@ -88,6 +103,24 @@ class AdvancedSettings(ctk.CTkToplevel):
         # Spot Analizi Ayarları
         self._create_section(scroll_frame, "Spot Analizi")
         self._create_slider_with_format(scroll_frame, "Boşluk Süresi", "max_gap_ms", 500, 3000, 1400, step=50, format_func=lambda v: f"{v/1000:.2f}s")
+        self._create_slider_with_format(scroll_frame, "Min. Spot Süresi", "min_spot_ms", 0, 30000, 0, step=500, format_func=self._format_spot_duration)
+        self._create_slider_with_format(scroll_frame, "Maks. Spot Süresi", "max_spot_ms", 0, 60000, 0, step=500, format_func=self._format_spot_duration)
+        
+        # Sidechain Ducking (konuşma duraklamalarında fon Fon Orta seviyesine açılır)
+        self._create_section(scroll_frame, "Otomatik Ducking")
+        self._create_switch(scroll_frame, "Konuşmaya Göre Fon Seviyesi", "ducking_enabled", DuckingConfig.ENABLED)
+        self._create_slider(scroll_frame, "Konuşma Eşiği (dB)", "ducking_threshold_db", -60.0, -20.0, DuckingConfig.THRESHOLD_DB, step=1.0)
+        self._create_slider_with_format(scroll_frame, "Kısma Süresi", "ducking_attack_ms", 5, 100, DuckingConfig.ATTACK_MS, step=5, format_func=lambda v: f"{v:.0f}ms")
+        self._create_slider_with_format(scroll_frame, "Açılma Süresi", "ducking_release_ms", 100, 1500, DuckingConfig.RELEASE_MS, step=50, format_func=lambda v: f"{v:.0f}ms")
+        
+        # Mastering (kapalıyken tepe limiter; açıkken entegre loudness hedefi, -1 dBTP tavan)
+        self._create_section(scroll_frame, "Loudness (LUFS)")
+        self._create_switch(scroll_frame, "LUFS Hedefli Mastering", "loudness_mastering", LoudnessConfig.ENABLED)
+        self._create_slider_with_format(scroll_frame, "Hedef Loudness", "target_lufs", -30, -9, LoudnessConfig.TARGET_LUFS, step=1, format_func=lambda v: f"{v:.0f} LUFS")
+        
+        # Örnekleme hızı dönüşümü (varsayılan set_frame_rate; polifaz daha yavaş, örtüşmesiz)
+        self._create_section(scroll_frame, "Örnekleme Hızı Dönüşümü")
+        self._create_option(scroll_frame, "Dönüşüm Kalitesi", "resample_quality", ResampleConfig.QUALITY_LABELS, ResampleConfig.QUALITY)
         
         # Butonlar
         btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -127,6 +160,11 @@ class AdvancedSettings(ctk.CTkToplevel):
             font=ctk.CTkFont(family=FONT_FAMILY, size=13, weight="bold")
         ).pack(side="right")
     
+    @staticmethod
+    def _format_spot_duration(value: float) -> str:
+        """Spot süresi sınırını formatlar (0 = kapalı)"""
+        return "Kapalı" if value <= 0 else f"{value/1000:.1f}s"
+    
     def _create_section(self, parent, title: str):
         """Bölüm başlığı oluşturur"""
         section = ctk.CTkFrame(parent, fg_color="transparent")
@@ -145,6 +183,46 @@ class AdvancedSettings(ctk.CTkToplevel):
             fg_color=("#E0E0E0", "#555")
         ).pack(fill="x", pady=(5, 0))
     
+    def _create_switch(self, parent, label: str, key: str, default: bool):
+        """Açma/kapama anahtarı oluşturur"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(fill="x", pady=8)
+        
+        switch_var = ctk.BooleanVar(value=bool(self.current_settings.get(key, default)))
+        ctk.CTkSwitch(
+            row,
+            text=label,
+            variable=switch_var,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=13)
+        ).pack(side="left")
+        
+        self.settings_vars[key] = switch_var
+    
+    def _create_option(self, parent, label: str, key: str, options: Dict[Any, str], default: Any):
+        """Seçenek menüsü oluşturur (options: değer -> etiket)"""
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.pack(fill="x", pady=8)
+        
+        ctk.CTkLabel(
+            row,
+            text=label,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=13),
+            anchor="w"
+        ).pack(side="left")
+        
+        option_var = _OptionVar(options, self.current_settings.get(key, default))
+        ctk.CTkOptionMenu(
+            row,
+            values=list(options.values()),
+            variable=option_var.label_var,
+            width=200,
+            height=28,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=12),
+            dropdown_font=ctk.CTkFont(family=FONT_FAMILY, size=12)
+        ).pack(side="right")
+        
+        self.settings_vars[key] = option_var
+    
     def _create_slider(self, parent, label: str, key: str, min_val: float, max_val: float, default: float, step: float = 0.1):
         """Slider oluşturur"""
         row = ctk.CTkFrame(parent, fg_color="transparent")
@@ -253,7 +331,16 @@ class AdvancedSettings(ctk.CTkToplevel):
             "intro_duration": 3000,
             "outro_rise": 2000,
             "outro_fall": 3000,
-            "max_gap_ms": 1400
+            "max_gap_ms": 1400,
+            "min_spot_ms": 0,
+            "max_spot_ms": 0,
+            "ducking_enabled": DuckingConfig.ENABLED,
+            "ducking_threshold_db": DuckingConfig.THRESHOLD_DB,
+            "ducking_attack_ms": DuckingConfig.ATTACK_MS,
+            "ducking_release_ms": DuckingConfig.RELEASE_MS,
+            "loudness_mastering": LoudnessConfig.ENABLED,
+            "target_lufs": LoudnessConfig.TARGET_LUFS,
+            "resample_quality": ResampleConfig.QUALITY
         }
         
         for key, value in defaults.items():
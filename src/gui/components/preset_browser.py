@@ -19,8 +19,11 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
-from ...constants import FONT_FAMILY, PRESET_CATEGORIES, ENDING_CATEGORIES, UIConfig
+from ...constants import FONT_FAMILY, PRESET_CATEGORIES, ENDING_CATEGORIES, AUTO_PRESET_CATEGORIES, UIConfig
 from ...utils.file_utils import get_resource_path
+from ...audio.preset_index import get_preset_index
+from ...audio.similarity import get_similarity_index, find_similar_presets
+from ...audio.tonality import entry_key, key_name
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +63,7 @@ class PresetBrowser(ctk.CTkToplevel):
         self._preview_btn = None
         self._is_closing = False
         self._preview_path = None
+        self.preset_index = get_preset_index()
         
         self._setup_window()
         self._setup_ui()
@@ -125,7 +129,7 @@ class PresetBrowser(ctk.CTkToplevel):
         )
         title_label.pack(anchor="center")
         
-        subtitle_label = ctk.CTkLabel(
+        self.subtitle_label = subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Kategori seçin ve müzikleri dinleyin",
             font=ctk.CTkFont(family=FONT_FAMILY, size=12),
@@ -280,7 +284,10 @@ class PresetBrowser(ctk.CTkToplevel):
         
         logger.info(f"Preset kategori: {category}, Klasör: {folder}")
         
-        if not os.path.exists(folder) or not os.path.isdir(folder):
+        is_auto_category = category in AUTO_PRESET_CATEGORIES
+        folder_exists = os.path.exists(folder) and os.path.isdir(folder)
+        
+        if not folder_exists and not is_auto_category:
             error_label = ctk.CTkLabel(
                 self.list_container,
                 text=f"❌ Klasör bulunamadı:\n{folder}",
@@ -293,7 +300,7 @@ class PresetBrowser(ctk.CTkToplevel):
         
         # Dosyaları bul ve doğal sıralama ile sırala
         try:
-            all_files = os.listdir(folder)
+            all_files = os.listdir(folder) if folder_exists else []
             items = []
             for f in all_files:
                 file_path = os.path.join(folder, f)
@@ -316,12 +323,25 @@ class PresetBrowser(ctk.CTkToplevel):
             
             items.sort(key=natural_sort_key)
             
-            logger.info(f"Bulunan {len(items)} ses dosyası (doğal sıralama ile)")
+            # Klasörü boş otomatik kategoriler indeksteki sanal üyelikten listelenir (dosya kopyalanmaz)
+            from_index = not items and is_auto_category
+            if from_index:
+                items = self.preset_index.paths_in_category(category)
+                items.sort(key=natural_sort_key)
+            
+            logger.info(
+                f"Bulunan {len(items)} ses dosyası (doğal sıralama ile"
+                f"{', otomatik sınıflandırma' if from_index else ''})"
+            )
             
             if not items:
+                empty_text = (
+                    "📭 Bu kategori henüz boş.\nPreset indeksi tamamlanınca fonlar otomatik listelenecek."
+                    if is_auto_category else "📭 Bu kategoride ses dosyası bulunamadı."
+                )
                 error_label = ctk.CTkLabel(
                     self.list_container,
-                    text="📭 Bu kategoride ses dosyası bulunamadı.",
+                    text=empty_text,
                     text_color="#6C757D",
                     font=ctk.CTkFont(family=FONT_FAMILY, size=13)
                 )
@@ -412,6 +432,18 @@ class PresetBrowser(ctk.CTkToplevel):
         )
         play_btn.pack(side="left", padx=(0, 10))
         
+        # İndeks bilgisi (tempo · süre) - arka plan indekslemesi tamamlandıysa
+        info_text = self._format_preset_info(path)
+        if info_text:
+            info_label = ctk.CTkLabel(
+                left_frame,
+                text=info_text,
+                anchor="e",
+                font=ctk.CTkFont(family=FONT_FAMILY, size=10),
+                text_color="gray60"
+            )
+            info_label.pack(side="right", padx=(8, 0))
+        
         # Dosya adı (kompakt)
         name_label = ctk.CTkLabel(
             left_frame,
@@ -435,6 +467,73 @@ class PresetBrowser(ctk.CTkToplevel):
             command=lambda p=path: self._toggle_select(p, select_btn, check_label, row)
         )
         select_btn.pack(side="right")
+        
+        # Benzerlerini seç (fon benzerlik indeksindeyse ve çoklu seçim mümkünse)
+        if self.total_spots != 1 and self._has_similarity(path):
+            similar_btn = ctk.CTkButton(
+                content_frame,
+                text="≈ Benzerleri",
+                width=90,
+                height=28,
+                corner_radius=6,
+                font=ctk.CTkFont(family=FONT_FAMILY, size=11),
+                fg_color="#17A2B8",
+                hover_color="#138496",
+                command=lambda p=path: self._select_similar(p)
+            )
+            similar_btn.pack(side="right", padx=(0, 6))
+    
+    def _has_similarity(self, path: str) -> bool:
+        """Fon benzerlik indeksinde varsa True"""
+        try:
+            return path in get_similarity_index(self.preset_index)
+        except Exception:
+            return False
+    
+    def _select_similar(self, path: str):
+        """Fonu ve en benzer fonları seçer (spot sayısı sınırına kadar)"""
+        if self._is_closing:
+            return
+        
+        count = UIConfig.SIMILAR_PRESET_COUNT
+        if self.total_spots:
+            count = min(count, self.total_spots - len(self.selected_presets | {path}))
+        
+        try:
+            similar = find_similar_presets(
+                path, max(count, 0), exclude=list(self.selected_presets), index=self.preset_index
+            )
+        except Exception as e:
+            logger.warning(f"Benzer fon araması başarısız: {e}")
+            similar = []
+        
+        self.selected_presets.add(path)
+        self.selected_presets.update(similar)
+        logger.info(f"Benzer fonlar seçildi ({os.path.basename(path)}): {[os.path.basename(p) for p in similar]}")
+        
+        # Başka kategorideki seçimler listede görünmeyebilir: başlıkta özetle
+        names = ", ".join(os.path.splitext(os.path.basename(p))[0] for p in similar)
+        self.subtitle_label.configure(
+            text=f"Benzer fonlar seçildi: {names}" if similar else "Benzer fon bulunamadı veya spot sınırına ulaşıldı"
+        )
+        self._refresh_list()
+    
+    def _format_preset_info(self, path: str) -> Optional[str]:
+        """Preset indeksindeki tempo, ton ve süre bilgisini formatlar"""
+        try:
+            entry = self.preset_index.get(path)
+        except Exception:
+            entry = None
+        if not entry:
+            return None
+        
+        total_sec = int(round(entry.get("duration_ms", 0) / 1000.0))
+        tempo = entry.get("tempo", 0)
+        duration_text = f"{total_sec // 60}:{total_sec % 60:02d}"
+        key = entry_key(entry)
+        if key is not None and key.confidence > 0:
+            duration_text = f"{key_name(key.tonic, key.mode)} · {duration_text}"
+        return f"{tempo:.0f} BPM · {duration_text}" if tempo else duration_text
     
     def _toggle_preview(self, path: str, btn: ctk.CTkButton):
         """Önizleme toggle"""
@@ -3,7 +3,6 @@
 import os
 import sys
 import threading
-import random
 import json
 import time
 import subprocess
@@ -15,14 +14,19 @@ from typing import List, Optional, Dict, Tuple
 import logging
 
 from ..constants import (
-    APP_NAME, APP_VERSION, FONT_FAMILY, UIConfig,
+    APP_NAME, APP_VERSION, FONT_FAMILY, UIConfig, DuckingConfig, LoudnessConfig, ResampleConfig,
     AUDIO_FILE_TYPES, PRESET_CATEGORIES, ENDING_CATEGORIES
 )
 from ..utils import (
     get_resource_path, format_path_display, validate_audio_file,
     ConfigManager, detect_and_set_ffmpeg
 )
-from ..audio import analyze_audio_segments, ses_montaj
+from ..audio import analyze_segment_index, ses_montaj, SegmentIndex, count_valid_spots
+from ..audio.envelope import curve_cache_stats
+from ..audio.preset_index import PresetIndexer, start_background_indexing
+from ..audio.scheduler import schedule_spots
+from ..audio.tonality import ending_compatibility_matrix
+from ..audio.warmup import start_background_warmup
 from .components.step_card import StepCard
 from .components.control_panel import ControlPanel
 from .components.preset_browser import PresetBrowser
@@ -36,6 +40,9 @@ logger = logging.getLogger(__name__)
 class MainWindow(ctk.CTk):
     """Ana uygulama penceresi"""
     
+    # Değiştiğinde ham seslerin yeniden analiz edilmesini gerektiren ayarlar
+    ANALYSIS_SETTING_KEYS = ("max_gap_ms", "min_spot_ms", "max_spot_ms")
+    
     def __init__(self):
         """MainWindow başlatır"""
         super().__init__()
@@ -45,7 +52,7 @@ class MainWindow(ctk.CTk):
         self.fon_paths: List[str] = []
         self.ending_paths: List[str] = []  # Bitiş sesleri
         self.output_path: Optional[str] = None
-        self.analyzed_segments_map: Dict[str, List[Tuple[int, int]]] = {}
+        self.analyzed_segments_map: Dict[str, SegmentIndex] = {}
         self.analysis_done = False
         self.is_cancelled = False
         
@@ -55,6 +62,8 @@ class MainWindow(ctk.CTk):
         self.control_panel: Optional[ControlPanel] = None
         self.analysis_modal: Optional[AnalysisModal] = None
         self._download_progress_modal: Optional[ProgressModal] = None
+        self._preset_indexer: Optional[PresetIndexer] = None
+        self._montaj_active = False
         
         # Yapılandırma
         self.config = ConfigManager()
@@ -195,14 +204,44 @@ class MainWindow(ctk.CTk):
         # Ayarları yükle (control_panel oluşturulduktan sonra)
         self._load_settings()
         
-        # Gelişmiş ayarlar değişkeni
-        self.advanced_settings = {}
+        # Gelişmiş ayarlar değişkeni (kaydedilmiş ayarlar varsa onları kullan)
+        self.advanced_settings = self.config.get("advanced_settings", {}) or {}
         
         # Başlangıç durumunu güncelle (step=0 için "Adım 1" mesajını göster)
         self._update_status()
         
         # Uygulama başlangıcında otomatik güncelleme kontrolü (5 saniye sonra)
         self.after(5000, self._auto_check_updates)
+        
+        # Pencere açıldıktan sonra analiz zincirini ısıt (ilk spot JIT derlemesi beklemesin)
+        self.after(1000, self._start_analysis_warmup)
+        
+        # Preset kütüphanesini boşta iken arka planda indeksle
+        self.after(8000, self._start_preset_indexing)
+    
+    def _start_analysis_warmup(self):
+        """librosa/numba ısınmasını arka planda başlatır"""
+        try:
+            start_background_warmup()
+        except Exception as e:
+            logger.warning(f"Analiz ısınması başlatılamadı: {e}")
+    
+    def _start_preset_indexing(self):
+        """Preset indekslemeyi arka planda başlatır"""
+        try:
+            self._preset_indexer = start_background_indexing()
+            if self._montaj_active:
+                self._preset_indexer.pause()
+        except Exception as e:
+            logger.warning(f"Preset indeksleme başlatılamadı: {e}")
+    
+    def _set_preset_indexing_paused(self, paused: bool):
+        """Montaj sırasında indekslemeyi duraklatır / sonra sürdürür"""
+        if self._preset_indexer and self._preset_indexer.is_alive():
+            if paused:
+                self._preset_indexer.pause()
+            else:
+                self._preset_indexer.resume()
     
     def _open_advanced_settings(self):
         """Gelişmiş ayarlar penceresini açar"""
@@ -216,16 +255,36 @@ class MainWindow(ctk.CTk):
             "intro_duration": 3000,
             "outro_rise": 2000,
             "outro_fall": 3000,
-            "max_gap_ms": 1400
+            "max_gap_ms": 1400,
+            "min_spot_ms": 0,
+            "max_spot_ms": 0,
+            "ducking_enabled": DuckingConfig.ENABLED,
+            "ducking_threshold_db": DuckingConfig.THRESHOLD_DB,
+            "ducking_attack_ms": DuckingConfig.ATTACK_MS,
+            "ducking_release_ms": DuckingConfig.RELEASE_MS,
+            "loudness_mastering": LoudnessConfig.ENABLED,
+            "target_lufs": LoudnessConfig.TARGET_LUFS,
+            "resample_quality": ResampleConfig.QUALITY
         }
         
         def on_save(settings):
             """Ayarları kaydet"""
+            analysis_changed = any(
+                settings.get(key) != current_settings.get(key)
+                for key in self.ANALYSIS_SETTING_KEYS
+            )
             self.advanced_settings = settings
             logger.info(f"Gelişmiş ayarlar kaydedildi: {settings}")
             # Config'e kaydet
             self.config.set("advanced_settings", settings)
             self.config.save()
+            
+            # Spot analizi ayarları değiştiyse ham sesleri yeniden analiz et
+            if analysis_changed and self.ham_paths:
+                self.analysis_done = False
+                self.step_cards["ham"].update_analysis("Analiz ediliyor...", "gray")
+                self.analysis_modal = AnalysisModal(self)
+                self._run_analysis_in_background(self.ham_paths)
         
         AdvancedSettings(self, current_settings, on_save)
     
@@ -378,9 +437,7 @@ class MainWindow(ctk.CTk):
                 
                 if valid_paths:
                     # Tek spot kuralı
-                    total_spots = sum(
-                        len(v) for v in self.analyzed_segments_map.values()
-                    ) if self.analyzed_segments_map else 0
+                    total_spots = count_valid_spots(self.analyzed_segments_map)
                     
                     if total_spots == 1 and len(valid_paths) > 1:
                         valid_paths = [valid_paths[0]]
@@ -422,9 +479,7 @@ class MainWindow(ctk.CTk):
                 
                 if valid_paths:
                     # Tek spot kuralı
-                    total_spots = sum(
-                        len(v) for v in self.analyzed_segments_map.values()
-                    ) if self.analyzed_segments_map else 0
+                    total_spots = count_valid_spots(self.analyzed_segments_map)
                     
                     if total_spots == 1 and len(valid_paths) > 1:
                         valid_paths = [valid_paths[0]]
@@ -469,9 +524,7 @@ class MainWindow(ctk.CTk):
             )
             return
         
-        total_spots = sum(
-            len(v) for v in self.analyzed_segments_map.values()
-        ) if self.analyzed_segments_map else None
+        total_spots = count_valid_spots(self.analyzed_segments_map)
         
         browser = PresetBrowser(
             self,
@@ -510,9 +563,7 @@ class MainWindow(ctk.CTk):
             )
             return
         
-        total_spots = sum(
-            len(v) for v in self.analyzed_segments_map.values()
-        ) if self.analyzed_segments_map else None
+        total_spots = count_valid_spots(self.analyzed_segments_map)
         
         browser = PresetBrowser(
             self,
@@ -537,15 +588,25 @@ class MainWindow(ctk.CTk):
     
     def _run_analysis_in_background(self, paths: List[str]):
         """Arka planda ses analizi yapar"""
+        settings = self.advanced_settings or {}
+        max_gap_ms = settings.get("max_gap_ms")
+        min_spot_ms = settings.get("min_spot_ms")
+        max_spot_ms = settings.get("max_spot_ms")
+        
         def analysis_thread():
             result = {}
             for path in paths:
                 try:
-                    segments = analyze_audio_segments(path)
+                    segments = analyze_segment_index(
+                        path,
+                        max_gap_ms=int(max_gap_ms) if max_gap_ms else None,
+                        min_spot_ms=int(min_spot_ms) if min_spot_ms else None,
+                        max_spot_ms=int(max_spot_ms) if max_spot_ms else None
+                    )
                     result[path] = segments
                 except Exception as e:
                     logger.error(f"Analiz hatası ({path}): {e}")
-                    result[path] = []
+                    result[path] = SegmentIndex()
             
             self.analyzed_segments_map = result
             self.after(0, self._update_analysis_ui)
@@ -562,7 +623,7 @@ class MainWindow(ctk.CTk):
             except:
                 pass
         
-        count = sum(len(v) for v in self.analyzed_segments_map.values())
+        count = count_valid_spots(self.analyzed_segments_map)
         
         if count > 0:
             self.step_cards["ham"].update_analysis(
@@ -640,6 +701,10 @@ class MainWindow(ctk.CTk):
         self.control_panel.set_processing(True)
         self.is_cancelled = False
         
+        # Montaj süresince arka plan indekslemesini duraklat
+        self._montaj_active = True
+        self._set_preset_indexing_paused(True)
+        
         # Doğrulama thread'i
         threading.Thread(target=self._validation_thread, daemon=True).start()
     
@@ -749,11 +814,8 @@ class MainWindow(ctk.CTk):
             len(v) for v in self.analyzed_segments_map.values()
         )
         
-        # Toplam geçerli spot sayısını hesapla (minimum 1000ms uzunluğunda olanlar)
-        total_valid_spots = 0
-        for ranges in self.analyzed_segments_map.values():
-            valid_count = sum(1 for seg in ranges if (seg[1] - seg[0]) >= 1000)
-            total_valid_spots += valid_count
+        # Toplam geçerli spot sayısı (minimum uzunluk filtresi indekste vektörel)
+        total_valid_spots = count_valid_spots(self.analyzed_segments_map)
         
         # Tek spot kuralı: çoklu fon seçildiyse ilkini kullan
         effective_fons = self.fon_paths
@@ -764,80 +826,85 @@ class MainWindow(ctk.CTk):
         if hasattr(self, 'progress_modal') and self.progress_modal:
             self.after(0, lambda: self.progress_modal.update_stage(1))
         
-        # Her spot için fon ata ve montajla
-        global_spot_index = 0  # Tüm spotlar için global sayaç
-        current_spot_number = 0  # Mevcut spot numarası (1'den başlar)
-        for ham_path, ranges in self.analyzed_segments_map.items():
-            valid_ranges = [
-                seg for seg in ranges
-                if (seg[1] - seg[0]) >= 1000
-            ]
+        # Fon/bitiş ataması: dengeli, seed'li ve aynı fonu kullanan spotlar art arda
+        spots = [
+            (ham_path, start, end)
+            for ham_path, ranges in self.analyzed_segments_map.items()
+            for start, end in ranges.valid()
+        ]
+        # Bitişler fonla ton uyumlu olanlardan (tonlar preset indeksinde hazır)
+        compatibility = None
+        if self.ending_paths and len(self.ending_paths) > 1:
+            try:
+                compatibility = ending_compatibility_matrix(effective_fons, self.ending_paths)
+            except Exception as e:
+                logger.warning(f"Ton uyum matrisi oluşturulamadı, dengeli atama kullanılacak: {e}")
+        jobs = schedule_spots(spots, effective_fons, self.ending_paths, compatibility=compatibility)
+        # Aynı ham dosya, fon ve bitişi paylaşan işler tek ses_montaj çağrısında işlenir:
+        # fon analizi, başlangıç noktaları ve müzikal bitişler grup için tek seferde (toplu) hesaplanır
+        job_groups: Dict[Tuple[str, Optional[str], Optional[str]], List] = {}
+        for job in jobs:
+            job_groups.setdefault((job.ham_path, job.fon_path, job.ending_path), []).append(job)
+        
+        outputs_by_spot = {}
+        curve_stats_start = curve_cache_stats()
+        spots_started = 0
+        
+        for (ham_path, fon_path, ending_path), group in job_groups.items():
+            if self.is_cancelled:
+                return []
             
-            for idx, (start, end) in enumerate(valid_ranges, 1):
-                if self.is_cancelled:
-                    return []
-                
-                # Fon seçimi
-                chosen_fon = (
-                    effective_fons[0]
-                    if len(effective_fons) == 1
-                    else random.choice(effective_fons)
-                )
-                
-                # Tek spot montaj
-                partial_ranges = [(start, end)]
-                
-                # Mevcut spot numarasını artır
-                current_spot_number += 1
-                
-                # Closure için spot numarasını yakala
-                spot_num = current_spot_number
-                total_spots = total_valid_spots
-                
-                def progress_callback(progress: int, message: str):
-                    self.after(0, lambda: self.control_panel.update_progress(
-                        progress, message
-                    ))
-                    # Progress modal'a spot bilgisini gönder (toplam spot sayısı ile)
-                    if hasattr(self, 'progress_modal') and self.progress_modal:
-                        # Kendi spot bilgimizi oluştur
+            # Spot numarası grup içindeki her "Bölüm" bildiriminde ilerler
+            spot_counter = iter(range(spots_started + 1, spots_started + len(group) + 1))
+            total_spots = total_valid_spots
+            
+            def progress_callback(progress: int, message: str, spot_counter=spot_counter):
+                self.after(0, lambda: self.control_panel.update_progress(
+                    progress, message
+                ))
+                # Progress modal'a spot bilgisini gönder (toplam spot sayısı ile)
+                if hasattr(self, 'progress_modal') and self.progress_modal:
+                    if "Montaj tamamlandı" not in message:
+                        spot_num = next(spot_counter, spots_started + len(group))
                         spot_info = f"Spot {spot_num}/{total_spots} İşleniyor..."
-                        if "Montaj tamamlandı" not in message:
-                            self.after(0, lambda info=spot_info: self.progress_modal.update_spot_info(info))
-                        else:
-                            self.after(0, lambda: self.progress_modal.update_spot_info(""))
-                
-                # Gelişmiş ayarları kullan (varsa)
-                # Gelişmiş ayarları geçir
-                advanced_settings_dict = self.advanced_settings if self.advanced_settings else None
-                
-                # Spot index offset'i geçir (dosya isimlendirme için)
-                # global_spot_index kullanarak her spot için benzersiz numara
-                
-                # Bitiş seçimi (spot başına veya genel)
-                chosen_ending = None
-                if self.ending_paths:
-                    if len(self.ending_paths) == 1:
-                        chosen_ending = self.ending_paths[0]
+                        self.after(0, lambda info=spot_info: self.progress_modal.update_spot_info(info))
                     else:
-                        # Çoklu bitiş varsa rastgele seç (veya spot index'e göre)
-                        chosen_ending = random.choice(self.ending_paths)
-                
-                out_files = ses_montaj(
-                    ham_path,
-                    output_dir=output_folder,
-                    output_format=output_format,
-                    fon_path=chosen_fon,
-                    merged_ranges=partial_ranges,
-                    progress_callback=progress_callback,
-                    is_cancelled=lambda: self.is_cancelled,
-                    advanced_settings=advanced_settings_dict,
-                    spot_index_offset=global_spot_index,
-                    ending_path=chosen_ending
-                )
-                
-                all_out_files.extend(out_files)
-                global_spot_index += len(out_files)  # Kaydedilen dosya sayısı kadar artır
+                        self.after(0, lambda: self.progress_modal.update_spot_info(""))
+            
+            # Gelişmiş ayarları geçir
+            advanced_settings_dict = self.advanced_settings if self.advanced_settings else None
+            
+            # Spot numaraları dosya isimlendirme ve fon başlangıcı için; render sırası fonlara
+            # göre gruplandığından numara spotun kendi sırasından gelir (ardışık olmayabilir)
+            out_files = ses_montaj(
+                ham_path,
+                output_dir=output_folder,
+                output_format=output_format,
+                fon_path=fon_path,
+                merged_ranges=[(job.start_ms, job.end_ms) for job in group],
+                progress_callback=progress_callback,
+                is_cancelled=lambda: self.is_cancelled,
+                advanced_settings=advanced_settings_dict,
+                ending_path=ending_path,
+                spot_numbers=[job.spot_index for job in group]
+            )
+            spots_started += len(group)
+            
+            # Çıktılar başlangıca göre sıralı gelir
+            ordered = sorted(group, key=lambda job: job.start_ms)
+            if len(out_files) == len(ordered):
+                for job, out_file in zip(ordered, out_files):
+                    outputs_by_spot[job.spot_index] = [out_file]
+            else:
+                outputs_by_spot[ordered[0].spot_index] = out_files
+        
+        # Çıktılar spot sırasıyla
+        for spot_index in sorted(outputs_by_spot):
+            all_out_files.extend(outputs_by_spot[spot_index])
+        logger.info(
+            f"Toplu montaj zarf eğrisi önbelleği ({len(jobs)} iş, {len(job_groups)} çağrı): "
+            f"{curve_cache_stats().since(curve_stats_start)}"
+        )
         
         # Aşama 3: Montaj Tamamlanıyor
         if hasattr(self, 'progress_modal') and self.progress_modal:
@@ -858,6 +925,8 @@ class MainWindow(ctk.CTk):
     def _montaj_tamamlandi(self, out_files: List[str], output_folder: str):
         """Montaj tamamlandı handler'ı"""
         self.control_panel.set_processing(False)
+        self._montaj_active = False
+        self._set_preset_indexing_paused(False)
         self.control_panel.update_status(
             f"✅ Başarılı! {len(out_files)} adet spot oluşturuldu.",
             "#28A745"
@@ -976,6 +1045,8 @@ class MainWindow(ctk.CTk):
     def _montaj_hatasi(self, exc: Exception):
         """Montaj hatası handler'ı"""
         self.control_panel.set_processing(False)
+        self._montaj_active = False
+        self._set_preset_indexing_paused(False)
         self.control_panel.update_status("Bir hata oluştu!", "#E74C3C")
         
         # Progress modal'ı kapat
@@ -990,6 +1061,8 @@ class MainWindow(ctk.CTk):
     def _montaj_iptal_edildi(self):
         """Montaj iptal edildi handler'ı"""
         self.control_panel.set_processing(False)
+        self._montaj_active = False
+        self._set_preset_indexing_paused(False)
         self.control_panel.update_status(
             "İşlem kullanıcı tarafından iptal edildi.",
             "gray60"
@@ -1043,27 +1116,6 @@ class MainWindow(ctk.CTk):
         except Exception as e:
             logger.warning(f"Ayarlar yüklenemedi: {e}")
     
-    def _open_advanced_settings(self):
-        """Gelişmiş ayarlar penceresini açar"""
-        from .components.advanced_settings import AdvancedSettings
-        
-        current_settings = {
-            "start_fon_db": -1.94,
-            "ducked_fon_db": -10.46,
-            "mid_fon_db": -3.10,
-            "voice_db": -0.91,
-            "intro_duration": 3000,
-            "outro_rise": 2000,
-            "outro_fall": 3000
-        }
-        
-        def on_save(settings):
-            # Ayarları kaydet (şimdilik sadece log)
-            logger.info(f"Gelişmiş ayarlar kaydedildi: {settings}")
-            # TODO: Ayarları processor'a aktar
-        
-        AdvancedSettings(self, current_settings, on_save)
-    
     def _check_for_updates(self):
         """Güncellemeleri kontrol eder"""
         # Butonu devre dışı bırak
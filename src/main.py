@@ -11,6 +11,12 @@ _parent_dir = os.path.dirname(_current_dir)
 if _parent_dir not in sys.path:
     sys.path.insert(0, _parent_dir)
 
+from src.utils.file_utils import configure_jit_cache
+
+# numba JIT önbelleğini uygulama veri klasörüne yönlendir: GUI içe aktarımı
+# src.audio'yu (ve njit çekirdeklerini) yükler, önbellek yolu o anda sabitlenir
+configure_jit_cache()
+
 from src.utils.logger import setup_logging, get_logger
 from src.utils.ffmpeg_setup import detect_and_set_ffmpeg, _patch_pydub_subprocess
 from src.gui.main_window import MainWindow
@@ -44,6 +50,29 @@ def main():
         )
         sys.exit(1)
     
+    # Kurulum sırasında preset kütüphanesini indeksle (GUI açılmadan)
+    if "--index-presets" in sys.argv:
+        from src.audio.preset_index import build_preset_index
+        try:
+            count = build_preset_index()
+            logger.info(f"Preset indeksi oluşturuldu: {count} dosya")
+        except Exception as e:
+            logger.error(f"Preset indeksi oluşturulamadı: {e}", exc_info=True)
+        sys.exit(0)
+    
+    # Analiz ısınmasının ilk spota kazancını ölç (GUI açılmadan)
+    if "--benchmark-warmup" in sys.argv:
+        from src.audio.warmup import benchmark_warmup
+        try:
+            result = benchmark_warmup()
+            print(
+                f"Soğuk: {result['cold_s']:.2f}s, sıcak: {result['warm_s']:.3f}s, "
+                f"kazanç: {result['saving_s']:.2f}s"
+            )
+        except Exception as e:
+            logger.error(f"Isınma ölçümü başarısız: {e}", exc_info=True)
+        sys.exit(0)
+    
     # GUI'yi başlat
     try:
         ctk.set_appearance_mode("light")
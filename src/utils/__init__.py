@@ -2,7 +2,9 @@
 
 from .logger import setup_logging, get_logger
 from .config import ConfigManager
-from .file_utils import get_resource_path, format_path_display, validate_audio_file
+from .file_utils import (
+    get_resource_path, get_app_data_dir, configure_jit_cache, format_path_display, validate_audio_file
+)
 from .ffmpeg_setup import detect_and_set_ffmpeg
 
 __all__ = [
@@ -10,6 +12,8 @@ __all__ = [
     "get_logger",
     "ConfigManager",
     "get_resource_path",
+    "get_app_data_dir",
+    "configure_jit_cache",
     "format_path_display",
     "validate_audio_file",
     "detect_and_set_ffmpeg",
@@ -2,9 +2,13 @@
 
 import os
 import sys
+import logging
+import tempfile
 from typing import Tuple, Optional
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 def get_resource_path(relative_path: str) -> str:
     """
     Kaynak dosya yolunu döndürür (PyInstaller uyumlu).
@@ -30,6 +34,50 @@ def get_resource_path(relative_path: str) -> str:
     
     return full_path
 
+def get_app_data_dir(*parts: str) -> str:
+    """
+    Uygulama veri klasörünü döndürür (yoksa oluşturur).
+    
+    Windows'ta %APPDATA%/AiMusicAutoSpot, diğer durumlarda temp dizini kullanılır.
+    
+    Args:
+        parts: Alt klasör adları (örn. "cache", "features")
+        
+    Returns:
+        Mutlak klasör yolu
+    """
+    appdata = os.getenv('APPDATA')
+    if appdata:
+        base_dir = os.path.join(appdata, "AiMusicAutoSpot")
+    else:
+        base_dir = os.path.join(tempfile.gettempdir(), "AiMusicAutoSpot")
+    
+    path = os.path.join(base_dir, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def configure_jit_cache() -> Optional[str]:
+    """
+    numba JIT önbelleğini uygulama veri klasörüne yönlendirir.
+    
+    src.audio içe aktarılmadan önce çağrılmalıdır: DSP çekirdekleri
+    (njit cache=True) içe aktarılırken önbellek yolunu NUMBA_CACHE_DIR'den
+    sabitler. Kurulu uygulamada paket klasörü yazılamadığı için derlenen
+    fonksiyonlar aksi halde her açılışta yeniden derlenir. Bu yüzden
+    src.audio'ya değil buraya (yalnızca standart kütüphane) konmuştur.
+    NUMBA_CACHE_DIR zaten ayarlıysa dokunulmaz.
+    
+    Returns:
+        Kullanılan önbellek klasörü (ayarlanamazsa None)
+    """
+    try:
+        cache_dir = os.environ.get("NUMBA_CACHE_DIR") or get_app_data_dir("cache", "numba")
+        os.environ["NUMBA_CACHE_DIR"] = cache_dir
+        return cache_dir
+    except Exception as e:
+        logger.warning(f"JIT önbellek klasörü ayarlanamadı: {e}")
+        return None
+
 def format_path_display(path: str, max_len: int = 60) -> str:
     """
     Dosya yolunu görüntüleme için formatlar.
@@ -0,0 +1,6 @@
+"""pytest ayarları - testler depo kökünden src paketini içe aktarır"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
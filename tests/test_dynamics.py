@@ -0,0 +1,30 @@
+"""Limiter: tavan ve release balistiği"""
+
+import numpy as np
+
+from src.audio.dynamics import limit, true_peak_envelope
+
+SR = 44100
+
+def _gain_reduction_db(samples, out):
+    return 20.0 * np.log10(out[:, 0] / samples[:, 0])
+
+def test_limiter_release_after_single_sample_peak():
+    samples = np.full((SR, 1), 0.05, dtype=np.float32)
+    peak = SR // 4
+    samples[peak] = 1.0
+    out = limit(samples, SR, ceiling_db=-3.0, release_ms=60.0)
+    reduction = -_gain_reduction_db(samples, out)
+    
+    # Tepede tam azaltım, sonra release zaman sabitiyle düşüş (60 ms'de ~1/e)
+    np.testing.assert_allclose(reduction[peak], 3.0, atol=0.05)
+    assert reduction[peak + int(0.005 * SR)] > 2.7
+    assert 0.9 < reduction[peak + int(0.060 * SR)] < 1.3
+    assert reduction[peak + int(0.300 * SR)] < 0.05
+    assert np.all(np.diff(reduction[peak:]) <= 1e-9)
+
+def test_limiter_holds_true_peak_ceiling():
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal((SR, 2)) * 0.3).astype(np.float32)
+    out = limit(samples, SR, ceiling_db=-1.0, pre_gain_db=6.0)
+    assert 20.0 * np.log10(true_peak_envelope(out).max()) <= -1.0 + 0.1
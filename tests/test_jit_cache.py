@@ -0,0 +1,45 @@
+"""numba JIT önbelleği: çekirdekler uygulama veri klasörüne yazılmalı"""
+
+import ast
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_main_configures_jit_cache_before_audio_imports():
+    with open(os.path.join(ROOT, "src", "main.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    
+    configured_at = None
+    for position, node in enumerate(tree.body):
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+            if getattr(node.value.func, "id", None) == "configure_jit_cache":
+                configured_at = position
+                break
+    assert configured_at is not None, "configure_jit_cache modül düzeyinde çağrılmıyor"
+    
+    for node in tree.body[:configured_at]:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names = [node.module or ""] if isinstance(node, ast.ImportFrom) else [a.name for a in node.names]
+            assert not any(name.startswith(("src.audio", "src.gui")) for name in names)
+
+def test_kernel_cache_path_is_in_app_data_dir(tmp_path):
+    pytest.importorskip("numba")
+    script = (
+        "from src.utils.file_utils import configure_jit_cache\n"
+        "configure_jit_cache()\n"
+        "from src.audio.kernels import compiled\n"
+        "print(compiled.envelope_follower._cache._cache_path)\n"
+    )
+    env = dict(os.environ, APPDATA=str(tmp_path))
+    env.pop("NUMBA_CACHE_DIR", None)
+    env.pop("NUMBA_DISABLE_JIT", None)
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    cache_path = os.path.realpath(result.stdout.strip().splitlines()[-1])
+    expected = os.path.realpath(os.path.join(str(tmp_path), "AiMusicAutoSpot", "cache", "numba"))
+    assert cache_path.startswith(expected + os.sep)